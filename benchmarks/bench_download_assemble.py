@@ -0,0 +1,85 @@
+"""
+Benchmark assembling many tickers' price histories into download()'s wide
+table: pd.concat (with the old realign fallback) vs multi._union_concat.
+
+Usage:
+   python benchmarks/bench_download_assemble.py [n_tickers] [years]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from yfinance import multi  # noqa: E402
+
+
+def make_dfs(n_tickers, years, duplicates=False):
+    # Ragged daily histories: different listing dates & holidays
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end='2025-01-01', periods=years * 261, name='Date')
+    dfs = {}
+    for i in range(n_tickers):
+        idx = dates[rng.integers(0, len(dates) - 10):]
+        idx = idx.delete(rng.integers(0, len(idx), 3))
+        df = pd.DataFrame({c: rng.random(len(idx)) for c in ['Open', 'High', 'Low', 'Close', 'Adj Close']},
+                          index=idx)
+        df['Volume'] = rng.integers(0, 10 ** 6, len(idx))
+        if duplicates and i % 100 == 0:
+            # Yahoo sometimes repeats the last row
+            df = pd.concat([df, df.iloc[-1:]])
+        dfs[f'T{i}'] = df
+    return dfs
+
+
+def _concat(dfs):
+    return pd.concat(dfs.values(), axis=1, sort=True, keys=dfs.keys(), names=["Ticker", "Price"])
+
+
+def _realign(dfs):
+    idx = max(dfs.values(), key=len).index
+    out = {}
+    for key, df in dfs.items():
+        try:
+            df = pd.DataFrame(index=idx, data=df).drop_duplicates()
+        except Exception:
+            df = pd.concat([pd.DataFrame(index=idx), df.dropna()], axis=0, sort=True)
+        out[key] = df.loc[~df.index.duplicated(keep="last")]
+    return out
+
+
+def legacy(dfs):
+    try:
+        return _concat(dfs)
+    except Exception:
+        return _concat(_realign(dfs))
+
+
+def measure(fn, dfs):
+    start = time.perf_counter()
+    fn(dict(dfs))
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(dict(dfs))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    n_tickers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    for duplicates in (False, True):
+        dfs = make_dfs(n_tickers, years, duplicates)
+        print(f"{n_tickers} tickers x {years}y daily, duplicate rows={duplicates}")
+        for name, fn in (('pd.concat', legacy), ('_union_concat', multi._union_concat)):
+            elapsed, peak = measure(fn, dfs)
+            print(f"  {name:>14}: {elapsed:6.2f}s  peak {peak / 2 ** 20:7.0f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark history() & download() from a recorded cassette, so timings
+exclude network and are reproducible offline.
+
+Record once (needs network):
+   python benchmarks/bench_history_replay.py --record history.cassette.gz
+Then benchmark (offline):
+   python benchmarks/bench_history_replay.py history.cassette.gz
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import yfinance as yf  # noqa: E402
+
+TICKERS = ['MSFT', 'AAPL', 'NVDA', 'SHEL.L', '7203.T', 'BHP.AX']
+START = '2020-01-01'
+END = '2025-01-01'
+
+
+def _workload(repair):
+    for t in TICKERS:
+        yf.Ticker(t).history(start=START, end=END, repair=repair)
+    yf.download(TICKERS, start=START, end=END, progress=False, threads=False)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('cassette')
+    parser.add_argument('--record', action='store_true')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    yf.config.network.cassette = args.cassette
+    yf.config.network.cassette_mode = 'record' if args.record else 'replay'
+    # Don't let in-memory caching hide parsing cost
+    yf.config.network.coalesce = False
+
+    for repair in (False, True):
+        if args.record:
+            _workload(repair)
+            continue
+        times = []
+        for _ in range(args.repeat):
+            yf.data.YfData.cache_get.cache_clear()
+            start = time.perf_counter()
+            _workload(repair)
+            times.append(time.perf_counter() - start)
+        print(f"repair={repair}: best {min(times):.3f}s, mean {sum(times) / len(times):.3f}s over {args.repeat} runs")
+
+
+if __name__ == '__main__':
+    main()
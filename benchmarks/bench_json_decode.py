@@ -0,0 +1,66 @@
+"""
+Benchmark decoding large chart JSON, like a period="max" daily history, with
+each available JSON decoder.
+
+Usage:
+   python benchmarks/bench_json_decode.py [n_bars]
+"""
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from yfinance import utils  # noqa: E402
+from yfinance.config import YfConfig  # noqa: E402
+
+
+def make_chart_payload(n_bars):
+    rng = random.Random(0)
+    timestamps = [1000000000 + i * 86400 for i in range(n_bars)]
+    close = [round(100 * (1 + rng.gauss(0, 0.01)) ** (i / 100), 4) for i in range(n_bars)]
+    quote = {
+        'open': [round(c * (1 + rng.gauss(0, 0.005)), 4) for c in close],
+        'high': [round(c * 1.01, 4) for c in close],
+        'low': [round(c * 0.99, 4) for c in close],
+        'close': close,
+        'volume': [rng.randint(100000, 10000000) for _ in range(n_bars)],
+    }
+    dividends = {str(t): {'amount': 0.5, 'date': t} for t in timestamps[::90]}
+    splits = {str(timestamps[n_bars // 2]): {'date': timestamps[n_bars // 2], 'numerator': 2, 'denominator': 1, 'splitRatio': '2:1'}}
+    payload = {'chart': {'result': [{
+        'meta': {'currency': 'USD', 'symbol': 'BENCH', 'exchangeTimezoneName': 'America/New_York',
+                 'instrumentType': 'EQUITY', 'dataGranularity': '1d', 'range': 'max'},
+        'timestamp': timestamps,
+        'events': {'dividends': dividends, 'splits': splits},
+        'indicators': {'quote': [quote], 'adjclose': [{'adjclose': close}]},
+    }], 'error': None}}
+    return json.dumps(payload).encode()
+
+
+def main():
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 12000
+    payload = make_chart_payload(n_bars)
+    print(f"payload: {n_bars} bars, {len(payload) / 1e6:.2f} MB")
+
+    decoders = ['stdlib']
+    for name in ('orjson', 'ujson'):
+        try:
+            utils._load_json_decoder(name)
+            decoders.append(name)
+        except Exception:
+            print(f"{name}: not installed")
+
+    baseline = None
+    for name in decoders:
+        YfConfig.network.json_decoder = name
+        n = 20
+        t = min(timeit.repeat(lambda: utils.json_loads(payload), number=n, repeat=5)) / n
+        baseline = baseline or t
+        print(f"{name:>8}: {t * 1e3:8.2f} ms/decode  ({baseline / t:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark parsing chart JSON into price & action frames:
+previous pandas-inference parser vs numpy-direct utils.parse_quotes/parse_actions.
+
+Usage:
+   python benchmarks/bench_parse_chart.py [n_charts] [years]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from yfinance import utils  # noqa: E402
+
+
+# Previous implementation, for comparison
+def legacy_parse_quotes(data):
+    timestamps = data["timestamp"]
+    ohlc = data["indicators"]["quote"][0]
+    volumes = ohlc["volume"]
+    opens = ohlc["open"]
+    closes = ohlc["close"]
+    lows = ohlc["low"]
+    highs = ohlc["high"]
+
+    adjclose = closes
+    if "adjclose" in data["indicators"]:
+        adjclose = data["indicators"]["adjclose"][0]["adjclose"]
+
+    quotes = pd.DataFrame(
+        {
+            "Open": opens,
+            "High": highs,
+            "Low": lows,
+            "Close": closes,
+            "Adj Close": adjclose,
+            "Volume": volumes,
+        }
+    )
+
+    quotes.index = pd.to_datetime(timestamps, unit="s")
+    quotes.sort_index(inplace=True)
+
+    all_nan = quotes[["Open", "High", "Low", "Close"]].isna().all(axis=1)
+    if all_nan.any():
+        logger = utils.get_yf_logger()
+        logger.debug(
+            f"Received blank OHLC for timestamps: {quotes.index[all_nan][:5].tolist()}"
+        )
+
+    return quotes
+
+
+def legacy_parse_actions(data):
+    dividends = None
+    capital_gains = None
+    splits = None
+
+    if "events" in data:
+        if "dividends" in data["events"] and len(data["events"]["dividends"]) > 0:
+            dividends = pd.DataFrame(data=list(data["events"]["dividends"].values()))
+            dividends.set_index("date", inplace=True)
+            dividends.index = pd.to_datetime(dividends.index, unit="s")
+            dividends.sort_index(inplace=True)
+            if "currency" in dividends.columns and (dividends["currency"] == "").all():
+                # Currency column useless, drop it.
+                dividends = dividends.drop("currency", axis=1)
+            dividends = dividends.rename(columns={"amount": "Dividends"})
+
+        if "capitalGains" in data["events"] and len(data["events"]["capitalGains"]) > 0:
+            capital_gains = pd.DataFrame(
+                data=list(data["events"]["capitalGains"].values())
+            )
+            capital_gains.set_index("date", inplace=True)
+            capital_gains.index = pd.to_datetime(capital_gains.index, unit="s")
+            capital_gains.sort_index(inplace=True)
+            capital_gains.columns = ["Capital Gains"]
+
+        if "splits" in data["events"] and len(data["events"]["splits"]) > 0:
+            splits = pd.DataFrame(data=list(data["events"]["splits"].values()))
+            splits.set_index("date", inplace=True)
+            splits.index = pd.to_datetime(splits.index, unit="s")
+            splits.sort_index(inplace=True)
+            splits["Stock Splits"] = splits["numerator"] / splits["denominator"]
+            splits = splits[["Stock Splits"]]
+
+    if dividends is None:
+        dividends = pd.DataFrame(columns=["Dividends"], index=pd.DatetimeIndex([]))
+    if capital_gains is None:
+        capital_gains = pd.DataFrame(
+            columns=["Capital Gains"], index=pd.DatetimeIndex([])
+        )
+    if splits is None:
+        splits = pd.DataFrame(columns=["Stock Splits"], index=pd.DatetimeIndex([]))
+
+    return dividends, splits, capital_gains
+
+
+def make_chart(years, seed):
+    # Daily chart JSON as decoded from Yahoo: lists of floats with some None
+    rng = np.random.default_rng(seed)
+    n = years * 252
+    ts = (1_000_000_000 + np.arange(n) * 86400).tolist()
+
+    def prices():
+        v = rng.random(n).round(4).tolist()
+        for i in rng.integers(0, n, 3):
+            v[i] = None
+        return v
+    quote = {k: prices() for k in ["open", "high", "low", "close"]}
+    quote["volume"] = rng.integers(0, 10 ** 7, n).tolist()
+    div_ts = ts[::63]
+    return {
+        "timestamp": ts,
+        "indicators": {"quote": [quote], "adjclose": [{"adjclose": prices()}]},
+        "events": {
+            "dividends": {str(t): {"amount": 0.25, "date": t} for t in div_ts},
+            "splits": {str(ts[n // 2]): {"date": ts[n // 2], "numerator": 2, "denominator": 1, "splitRatio": "2:1"}},
+        },
+    }
+
+
+def measure(parse_quotes, parse_actions, charts):
+    start = time.perf_counter()
+    for chart in charts:
+        parse_quotes(chart)
+        parse_actions(chart)
+    return time.perf_counter() - start
+
+
+def main():
+    n_charts = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    charts = [make_chart(years, i) for i in range(n_charts)]
+    print(f"{n_charts} charts x {years}y daily")
+    for name, fns in (('legacy', (legacy_parse_quotes, legacy_parse_actions)),
+                      ('numpy-direct', (utils.parse_quotes, utils.parse_actions))):
+        print(f"  {name:>12}: {measure(*fns, charts):6.2f}s")
+
+
+if __name__ == '__main__':
+    main()
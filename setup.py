@@ -69,6 +69,8 @@ setup(
     extras_require={
         'nospam': ['requests_cache>=1.0', 'requests_ratelimiter>=0.3.1'],
         'repair': ['scipy>=1.6.3'],
+        'fast': ['orjson>=3.6'],
+        'arrow': ['pyarrow>=10.0'],
     },
     # Include protobuf files for websocket support
     package_data={
@@ -0,0 +1,59 @@
+"""
+Daily chart responses for offline tests, with a fake response like Yahoo's
+"""
+from unittest.mock import MagicMock
+
+DAY = 86400
+START = 10 * DAY  # 1970-01-11
+
+
+def chart_json(close, adjclose=None, volume=None, events=None, timestamps=None):
+    if timestamps is None:
+        timestamps = [START + i * DAY for i in range(len(close))]
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"instrumentType": "EQUITY", "exchangeTimezoneName": "UTC",
+                             "currency": "USD", "priceHint": 2, "validRanges": ["1mo", "max"]},
+                    "timestamp": timestamps,
+                    "indicators": {
+                        "quote": [{"open": close, "high": close, "low": close, "close": close,
+                                   "volume": volume or [100] * len(close)}],
+                        "adjclose": [{"adjclose": adjclose or close}],
+                    },
+                    "events": events or {},
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+def chart_response(chart, period1, period2):
+    # Like Yahoo, only return bars in [period1, period2)
+    result = chart["chart"]["result"][0]
+    keep = [i for i, ts in enumerate(result["timestamp"]) if period1 <= ts < period2]
+    quote = result["indicators"]["quote"][0]
+    response = MagicMock()
+    response.json.return_value = chart_json(
+        [quote["close"][i] for i in keep],
+        adjclose=[result["indicators"]["adjclose"][0]["adjclose"][i] for i in keep],
+        volume=[quote["volume"][i] for i in keep],
+        events=result["events"],
+        timestamps=[result["timestamp"][i] for i in keep])
+    response.text = ""
+    return response
+
+
+# What Yahoo returned after 3 days, then after 5 days with a dividend or split on day 4
+OLD = chart_json([10.0, 11.0, 12.0])
+DIV_FACTOR = 1 - 1.0 / 12.0
+WITH_DIVIDEND = chart_json([10.0, 11.0, 12.0, 13.0, 14.0],
+                           adjclose=[10.0 * DIV_FACTOR, 11.0 * DIV_FACTOR, 12.0 * DIV_FACTOR, 13.0, 14.0],
+                           events={"dividends": {str(START + 3 * DAY): {"amount": 1.0, "date": START + 3 * DAY}}})
+WITH_SPLIT = chart_json([5.0, 5.5, 6.0, 6.5, 7.0], volume=[200, 200, 200, 100, 100],
+                        events={"splits": {str(START + 3 * DAY): {"date": START + 3 * DAY, "numerator": 2,
+                                                          "denominator": 1, "splitRatio": "2:1"}}})
+# Last bar of OLD was incomplete
+NO_ACTIONS = chart_json([10.0, 11.0, 12.5, 13.0, 14.0])
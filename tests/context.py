@@ -4,9 +4,8 @@ import platformdirs as _ad
 import datetime as _dt
 import sys
 import os
+import tempfile
 import yfinance
-# from requests_ratelimiter import LimiterSession
-# from pyrate_limiter import Duration, RequestRate, Limiter
 
 _parent_dp = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 _src_dp = _parent_dp
@@ -28,21 +27,21 @@ if os.path.isdir(testing_cache_dirpath):
 # Since switching to curl_cffi, the requests_ratelimiter|cache won't work.
 session_gbl = None
 
-# # Setup a session to only rate-limit
-# history_rate = RequestRate(1, Duration.SECOND)
-# limiter = Limiter(history_rate)
-# session_gbl = LimiterSession(limiter=limiter)
-
-# # Use this instead if you also want caching:
-# from requests_cache import CacheMixin, SQLiteCache
-# from requests_ratelimiter import LimiterMixin
-# from requests import Session
-# from pyrate_limiter import MemoryQueueBucket
-# class CachedLimiterSession(CacheMixin, LimiterMixin, Session):
-#     pass
-# cache_fp = os.path.join(testing_cache_dirpath, "unittests-cache")
-# session_gbl = CachedLimiterSession(
-#     limiter=limiter,
-#     bucket_class=MemoryQueueBucket,
-#     backend=SQLiteCache(cache_fp, expire_after=_dt.timedelta(hours=1)),
-# )
+# # Use yfinance's own rate-limiting & response caching instead:
+# yfinance.config.network.rate_limit = 1  # requests/second
+# yfinance.config.cache.responses = True
+
+
+class TempCacheDirMixin:
+    # Point yfinance caches at a temporary folder for each test, then restore
+    def setUp(self):
+        super().setUp()
+        self.tempCacheDir = tempfile.TemporaryDirectory()
+        self._prev_cache_dir = yfinance.cache._TzDBManager.get_location()
+        yfinance.set_tz_cache_location(self.tempCacheDir.name)
+
+    def tearDown(self):
+        # Also closes the cache databases, so folder can be deleted
+        yfinance.set_tz_cache_location(self._prev_cache_dir)
+        self.tempCacheDir.cleanup()
+        super().tearDown()
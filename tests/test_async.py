@@ -0,0 +1,153 @@
+"""
+Tests for asyncio data client & awaitable variants
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_async
+
+"""
+from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from yfinance.data import YfData, AsyncYfData, _CrumbSnapshot
+from yfinance.scrapers.history import PriceHistory
+
+
+def _chart_json():
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"instrumentType": "EQUITY", "exchangeTimezoneName": "UTC", "currency": "USD"},
+                    "timestamp": [0, 86400],
+                    "indicators": {
+                        "quote": [{"open": [1.0, 2.0], "high": [1.0, 2.0], "low": [1.0, 2.0],
+                                   "close": [1.0, 2.0], "volume": [10, 20]}],
+                        "adjclose": [{"adjclose": [1.0, 2.0]}],
+                    },
+                    "events": {},
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+def _mock_response(json_data, status_code=200, url="https://query2.finance.yahoo.com/"):
+    response = MagicMock()
+    response.json.return_value = json_data
+    response.text = ""
+    response.status_code = status_code
+    response.url = url
+    return response
+
+
+class TestAsyncYfData(unittest.IsolatedAsyncioTestCase):
+    async def test_make_request_adds_crumb(self):
+        dat = AsyncYfData()
+        session_get = AsyncMock(return_value=_mock_response({}))
+        with patch.object(AsyncYfData, '_get_crumb_snapshot', AsyncMock(return_value=_CrumbSnapshot('abc', 'basic', 0))):
+            await dat._make_request("https://query2.finance.yahoo.com/x", session_get, params={'a': 1})
+        kwargs = session_get.call_args.kwargs
+        self.assertEqual(kwargs['params'], {'a': 1, 'crumb': 'abc'})
+
+    async def test_make_request_toggles_strategy_on_error(self):
+        dat = AsyncYfData()
+        session_get = AsyncMock(side_effect=[_mock_response({}, 401), _mock_response({}, 200)])
+        crumbs = AsyncMock(side_effect=[_CrumbSnapshot('abc', 'basic', 7), _CrumbSnapshot('xyz', 'csrf', 8)])
+        with patch.object(AsyncYfData, '_get_crumb_snapshot', crumbs), \
+                patch.object(YfData, '_toggle_cookie_strategy') as toggle:
+            response = await dat._make_request("https://query2.finance.yahoo.com/x", session_get)
+        # Version-checked, so concurrent failures toggle only once
+        toggle.assert_called_once_with(7)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session_get.call_args.kwargs['params']['crumb'], 'xyz')
+
+
+class TestAwaitableVariants(unittest.IsolatedAsyncioTestCase):
+    async def test_history_async_matches_history(self):
+        data = YfData()
+        ph = PriceHistory(data, "TEST", tz="UTC")
+        kwargs = dict(start="1970-01-01", end="1970-01-03", interval="1d", auto_adjust=False)
+        with patch.object(YfData, 'cache_get', return_value=_mock_response(_chart_json())):
+            df_sync = ph.history(**kwargs)
+        with patch.object(AsyncYfData, 'get', AsyncMock(return_value=_mock_response(_chart_json()))):
+            df_async = await ph.history_async(**kwargs)
+        self.assertTrue(df_sync.equals(df_async))
+
+    async def test_search_async_fetches_on_await(self):
+        get = AsyncMock(return_value=_mock_response({"quotes": [{"symbol": "AAPL"}, {"name": "no symbol"}]}))
+        with patch.object(AsyncYfData, 'get', get):
+            search = yf.AsyncSearch("AAPL")
+            get.assert_not_called()
+            result = await search.search()
+        self.assertIs(result, search)
+        self.assertEqual(search.quotes, [{"symbol": "AAPL"}])
+
+    async def test_screen_async(self):
+        post = AsyncMock(return_value=_mock_response({'finance': {'result': [{'key': 'value'}]}}))
+        with patch.object(AsyncYfData, 'post', post):
+            response = await yf.screen_async(yf.EquityQuery('gt', ['eodprice', 3]))
+        self.assertEqual(response, {'key': 'value'})
+
+
+class TestDownloadAsync(TempCacheDirMixin, unittest.IsolatedAsyncioTestCase):
+    tickers = ["AAA", "BBB", "CCC"]
+    kwargs = dict(start="1970-01-01", end="1970-01-03", auto_adjust=False, progress=False)
+
+    def setUp(self):
+        super().setUp()
+        tz_cache = yf.cache.get_tz_cache()
+        for t in self.tickers:
+            tz_cache.store(t, "UTC")
+
+    def _download_threads(self):
+        with patch.object(YfData, 'cache_get', return_value=_mock_response(_chart_json())):
+            return yf.download(self.tickers, threads=False, **self.kwargs)
+
+    async def test_engine_async_matches_threads(self):
+        df_threads = self._download_threads()
+        with patch.object(AsyncYfData, 'get', AsyncMock(return_value=_mock_response(_chart_json()))):
+            # Called inside a running event loop, so download runs its own loop in another thread
+            df_async = yf.download(self.tickers, engine="async", **self.kwargs)
+        self.assertEqual(df_threads.shape, (2, 18))
+        self.assertTrue(df_threads.equals(df_async))
+
+    async def test_download_async_matches_threads(self):
+        df_threads = self._download_threads()
+        with patch.object(AsyncYfData, 'get', AsyncMock(return_value=_mock_response(_chart_json()))):
+            df_async = await yf.download_async(self.tickers, **self.kwargs)
+        self.assertTrue(df_threads.equals(df_async))
+
+    async def test_concurrency_bound(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _mock_response(_chart_json())
+
+        with patch.object(AsyncYfData, 'get', side_effect=get):
+            await yf.download_async(self.tickers, concurrency=2, **self.kwargs)
+        self.assertEqual(max_in_flight, 2)
+
+    async def test_failed_ticker_recorded(self):
+        with patch.object(AsyncYfData, 'get', AsyncMock(side_effect=Exception("boom"))):
+            df = await yf.download_async(self.tickers, **self.kwargs)
+        self.assertTrue(df.empty)
+        self.assertEqual(sorted(yf.shared._ERRORS.keys()), self.tickers)
+
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            yf.download(self.tickers, engine="processes", **self.kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,11 +9,17 @@ Specific test class:
 
 """
 from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
 
 import unittest
 import tempfile
 import os
 import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from yfinance.data import YfData
 
 
 class TestCache(unittest.TestCase):
@@ -46,6 +52,122 @@ class TestCache(unittest.TestCase):
 
         self.assertTrue(os.path.exists(os.path.join(self.tempCacheDir.name, "tkr-tz.db")))
 
+    def test_bulkLookupStore(self):
+        cache = yf.cache.get_tz_cache()
+        tzs = {f"T{i}": "America/New_York" for i in range(700)}
+        cache.store_many(tzs)
+        cache.store("T0", "Europe/London")
+        found = cache.lookup_many(list(tzs) + ["MISSING"])
+        self.assertEqual(len(found), 700)
+        self.assertEqual(found["T0"], "Europe/London")
+        self.assertEqual(found["T699"], cache.lookup("T699"))
+
+
+class TestResponseCache(TempCacheDirMixin, unittest.TestCase):
+    def tearDown(self):
+        yf.cache._ResponseDBManager.close_db()
+        super().tearDown()
+
+    def test_store_lookup(self):
+        cache = yf.cache.get_response_cache()
+        cache.store('k', 'https://x', 200, b'{"a": 1}', ttl=None)
+        self.assertEqual(cache.lookup('k'), {'url': 'https://x', 'status_code': 200, 'content': b'{"a": 1}'})
+        self.assertIsNone(cache.lookup('missing'))
+        self.assertTrue(os.path.exists(os.path.join(self.tempCacheDir.name, "responses.db")))
+
+    def test_expiry(self):
+        cache = yf.cache.get_response_cache()
+        cache.store('k', 'https://x', 200, b'x', ttl=-1)
+        self.assertIsNone(cache.lookup('k'))
+
+    def test_lru_eviction(self):
+        cache = yf.cache.get_response_cache()
+        for i in range(5):
+            cache.store(f'k{i}', 'https://x', 200, b'x' * 100, ttl=None, max_bytes=1000)
+        # Touch oldest so it becomes most-recently-used
+        self.assertIsNotNone(cache.lookup('k0'))
+        for i in range(5, 10):
+            cache.store(f'k{i}', 'https://x', 200, b'x' * 100, ttl=None, max_bytes=1000)
+        cache.store('k10', 'https://x', 200, b'x' * 100, ttl=None, max_bytes=1000)
+        self.assertIsNotNone(cache.lookup('k0'))
+        self.assertIsNone(cache.lookup('k1'))
+        self.assertIsNotNone(cache.lookup('k10'))
+        self.assertLessEqual(cache._total_bytes, 1000)
+
+    def test_clear(self):
+        cache = yf.cache.get_response_cache()
+        cache.store('k', 'https://x', 200, b'x', ttl=None)
+        cache.clear()
+        self.assertIsNone(cache.lookup('k'))
+
+
+class TestHistoryCache(TempCacheDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        yf.cache.get_tz_cache().store("AAA", "UTC")
+        yf.cache.get_history_cache().clear()
+        yf.config.cache.history = True
+        self.requested = []
+        patch.object(YfData, 'get', side_effect=self._get).start()
+        patch.object(YfData, 'cache_get', side_effect=self._get).start()
+
+    def tearDown(self):
+        patch.stopall()
+        yf.config.cache.history = False
+        yf.cache.get_history_cache().clear()
+        super().tearDown()
+
+    def _get(self, url, params=None, timeout=30):
+        self.requested.append(params)
+        ts = [10 * 86400, 11 * 86400]
+        response = MagicMock()
+        response.text = ""
+        response.json.return_value = {"chart": {"result": [{
+            "meta": {"instrumentType": "EQUITY", "exchangeTimezoneName": "UTC", "currency": "USD",
+                     "priceHint": 2, "validRanges": ["1mo", "max"]},
+            "timestamp": ts,
+            "indicators": {"quote": [{"open": [1.0, 2.0], "high": [1.0, 2.0], "low": [1.0, 2.0],
+                                      "close": [1.0, 2.0], "volume": [1, 1]}],
+                           "adjclose": [{"adjclose": [1.0, 2.0]}]},
+            "events": {},
+        }], "error": None}}
+        return response
+
+    def test_shared_across_tickers(self):
+        df = yf.Ticker("AAA").history(start="1970-01-11", end="1970-01-13")
+        df.loc[df.index[0], "Close"] = -1  # caller changes can't leak into cache
+        df2 = yf.Ticker("AAA").history(start="1970-01-11", end="1970-01-13")
+        self.assertEqual(len(self.requested), 1)
+        self.assertEqual(df2["Close"].iloc[0], 1.0)
+        self.assertEqual(yf.Ticker("AAA").history(start="1970-01-11", end="1970-01-13", auto_adjust=False)["Close"].iloc[0], 1.0)
+        self.assertEqual(len(self.requested), 2)
+
+    def test_ttl(self):
+        yf.Ticker("AAA").history(start="1970-01-11")
+        yf.Ticker("AAA").history(start="1970-01-11")
+        self.assertEqual(len(self.requested), 1)
+        # Range not ended, so expires with 'open' TTL
+        with patch.dict(yf.config.cache.history_ttl, {"open": -1}):
+            yf.cache.get_history_cache().clear()
+            yf.Ticker("AAA").history(start="1970-01-11")
+            yf.Ticker("AAA").history(start="1970-01-11")
+        self.assertEqual(len(self.requested), 3)
+
+    def test_lru_eviction(self):
+        cache = yf.cache.get_history_cache()
+        df = pd.DataFrame({"Close": [1.0] * 10})
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        for i in range(3):
+            cache.store(i, df, {}, ttl=None, max_bytes=size * 3)
+        # Touch oldest so it becomes most-recently-used
+        self.assertIsNotNone(cache.lookup(0))
+        cache.store(3, df, {}, ttl=None, max_bytes=size * 3)
+        self.assertIsNotNone(cache.lookup(0))
+        self.assertIsNone(cache.lookup(1))
+        self.assertLessEqual(cache._total_bytes, size * 3)
+        cache.store(4, df, {}, ttl=-1)
+        self.assertIsNone(cache.lookup(4))
+
 
 class TestCacheMigration(unittest.TestCase):
     def test_old_cache_schema_upgrade(self):
@@ -0,0 +1,76 @@
+"""
+Tests for record/replay cassette
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_cassette
+
+"""
+from tests.context import yfinance as yf
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from yfinance.cassette import Cassette, close_cassette
+from yfinance.data import YfData, _CrumbSnapshot
+from yfinance.exceptions import YFDataException
+
+
+def _response(content, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.url = 'https://query2.finance.yahoo.com/v8/finance/chart/MSFT'
+    response.headers = {'content-type': 'application/json'}
+    response.content = content
+    return response
+
+
+class TestCassette(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempDir.name, 'test.cassette.gz')
+
+    def tearDown(self):
+        yf.config.network.cassette = None
+        yf.config.network.cassette_mode = 'replay'
+        close_cassette()
+        self.tempDir.cleanup()
+
+    def test_replay_order(self):
+        cassette = Cassette(self.path, 'record')
+        cassette.record('k', 'GET', 'u', {}, None, _response(b'1'), 0.1)
+        cassette.record('k', 'GET', 'u', {}, None, _response(b'2'), 0.1)
+        cassette.close()
+
+        cassette = Cassette(self.path, 'replay')
+        self.assertEqual(cassette.replay('k', 'u')['content'], b'1')
+        self.assertEqual(cassette.replay('k', 'u')['content'], b'2')
+        self.assertEqual(cassette.replay('k', 'u')['content'], b'2')
+        with self.assertRaises(YFDataException):
+            cassette.replay('other', 'u')
+
+    def test_record_then_replay_offline(self):
+        dat = YfData()
+        url = 'https://query2.finance.yahoo.com/v8/finance/chart/MSFT'
+        request_method = MagicMock(return_value=_response(b'{"chart": {}}'))
+        request_method.__name__ = 'get'
+
+        yf.config.network.cassette = self.path
+        yf.config.network.cassette_mode = 'record'
+        with patch.object(YfData, '_get_crumb_snapshot', return_value=_CrumbSnapshot('abc', 'basic', 0)):
+            dat._make_request(url, request_method, params={'interval': '1d', 'range': '1mo'})
+        close_cassette()
+
+        yf.config.network.cassette_mode = 'replay'
+        with patch.object(YfData, '_get_crumb_snapshot', side_effect=AssertionError("network used")):
+            # Params order doesn't matter
+            response = dat._make_request(url, MagicMock(__name__='get'), params={'range': '1mo', 'interval': '1d'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"chart": {}})
+        self.assertEqual(response.headers, {'content-type': 'application/json'})
+        self.assertEqual(request_method.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
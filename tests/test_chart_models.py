@@ -1,11 +1,12 @@
 from tests.context import yfinance as yf
 
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from pydantic import ValidationError
 
-from yfinance.chart import ChartResponse
+from yfinance.chart import ChartResponse, chart_meta
+from yfinance.config import YfConfig
 
 
 SAMPLE_CHART_RESPONSE = {
@@ -44,13 +45,36 @@ class TestChartModels(unittest.TestCase):
         ticker = yf.Ticker("FAKE")
         mock_resp = Mock()
         mock_resp.json.return_value = SAMPLE_CHART_RESPONSE
-        original_cache_get = ticker._data.cache_get
-        ticker._data.cache_get = Mock(return_value=mock_resp)
-        try:
+        with patch.object(type(ticker._data), 'cache_get', return_value=mock_resp):
             tz = ticker._fetch_ticker_tz(timeout=5)
-            self.assertEqual(tz, "America/New_York")
+        self.assertEqual(tz, "America/New_York")
+
+    def test_fetch_ticker_tz_skips_model(self):
+        ticker = yf.Ticker("FAKE")
+        with patch.object(ChartResponse, 'model_validate') as model_validate:
+            self.assertEqual(ticker._tz_from_chart(SAMPLE_CHART_RESPONSE), "America/New_York")
+        model_validate.assert_not_called()
+
+    def test_validate_chart_option(self):
+        ticker = yf.Ticker("FAKE")
+        bad_prices = {"chart": {"result": [{"meta": {"exchangeTimezoneName": "UTC"},
+                                            "indicators": {"quote": [{"close": ["x"]}]}}], "error": None}}
+        self.assertEqual(ticker._tz_from_chart(bad_prices), "UTC")
+        YfConfig.debug.validate_chart = True
+        try:
+            self.assertIsNone(ticker._tz_from_chart(bad_prices))
         finally:
-            ticker._data.cache_get = original_cache_get
+            YfConfig.debug.validate_chart = False
+
+    def test_chart_meta(self):
+        self.assertEqual(chart_meta(SAMPLE_CHART_RESPONSE), {"exchangeTimezoneName": "America/New_York"})
+        for bad in [{"chart": {"result": [{}], "error": None}}, {"chart": {"result": None}}, None,
+                    {"chart": {"result": [{"meta": {"exchangeTimezoneName": 1}}]}}]:
+            with self.assertRaises(ValueError):
+                chart_meta(bad)
+        ticker = yf.Ticker("FAKE")
+        self.assertIsNone(ticker._tz_from_chart({"chart": {"result": [{}], "error": None}}))
+        self.assertIsNone(ticker._tz_from_chart({"chart": {"result": None, "error": {"code": "Not Found"}}}))
 
     def test_model_validation_error(self):
         bad_data = {"chart": {"result": [{}], "error": None}}
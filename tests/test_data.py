@@ -0,0 +1,228 @@
+"""
+Tests for YfData request handling
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_data
+
+"""
+from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from yfinance.data import YfData, _SingleFlight, _canonical_request_key, _response_cache_ttl, _CrumbSnapshot
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_canonical_key_ignores_param_order(self):
+        k1 = _canonical_request_key('GET', 'u', {'a': 1, 'b': 2})
+        k2 = _canonical_request_key('GET', 'u', {'b': 2, 'a': 1})
+        self.assertEqual(k1, k2)
+        self.assertNotEqual(k1, _canonical_request_key('POST', 'u', {'a': 1, 'b': 2}))
+        self.assertNotEqual(_canonical_request_key('POST', 'u', body={'x': 1}),
+                            _canonical_request_key('POST', 'u', body={'x': 2}))
+
+    def test_concurrent_calls_coalesce(self):
+        sf = _SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'result'
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(sf.do('k', fn)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(sf.do('k', fn))) for _ in range(4)]
+        for t in followers:
+            t.start()
+        while sf.stats()['coalesced'] < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader] + followers:
+            t.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['result'] * 5)
+        self.assertEqual(sf.stats(), {'executed': 1, 'coalesced': 4, 'in_flight': 0})
+
+        # Completed calls are not cached
+        sf.do('k', fn)
+        self.assertEqual(len(calls), 2)
+
+    def test_exception_shared(self):
+        sf = _SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fn():
+            started.set()
+            release.wait(5)
+            raise ValueError('boom')
+
+        errors = []
+
+        def run():
+            try:
+                sf.do('k', fn)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run)]
+        threads[0].start()
+        started.wait(5)
+        threads.append(threading.Thread(target=run))
+        threads[1].start()
+        while sf.stats()['coalesced'] < 1:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(len(errors), 2)
+
+    def test_reentrant_call_does_not_deadlock(self):
+        sf = _SingleFlight()
+        self.assertEqual(sf.do('k', lambda: sf.do('k', lambda: 1)), 1)
+
+
+class TestYfDataCoalesce(unittest.TestCase):
+    def test_config_disables(self):
+        dat = YfData()
+        response = MagicMock()
+        with patch.object(YfData, '_make_request', return_value=response) as make_request, \
+                patch.object(YfData, '_is_this_consent_url', return_value=False):
+            yf.config.network.coalesce = False
+            try:
+                before = dat.coalesce_stats()['executed']
+                self.assertIs(dat.get('https://query2.finance.yahoo.com/x'), response)
+                self.assertEqual(dat.coalesce_stats()['executed'], before)
+            finally:
+                yf.config.network.coalesce = True
+            dat.get('https://query2.finance.yahoo.com/x')
+            self.assertEqual(dat.coalesce_stats()['executed'], before + 1)
+            self.assertEqual(make_request.call_count, 2)
+
+
+class TestResponseCache(TempCacheDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        yf.config.cache.responses = True
+
+    def tearDown(self):
+        yf.config.cache.responses = False
+        yf.cache._ResponseDBManager.close_db()
+        super().tearDown()
+
+    def test_ttl_by_endpoint(self):
+        chart_url = 'https://query2.finance.yahoo.com/v8/finance/chart/MSFT'
+        self.assertIsNone(_response_cache_ttl(chart_url, {'period1': 0, 'period2': 86400}))
+        self.assertEqual(_response_cache_ttl(chart_url, {'period1': 0, 'period2': int(time.time())}), 0)
+        self.assertEqual(_response_cache_ttl(chart_url, {'range': '1mo'}), 0)
+        self.assertEqual(_response_cache_ttl('https://query2.finance.yahoo.com/v10/finance/quoteSummary/MSFT'), 300)
+        self.assertEqual(_response_cache_ttl('https://query1.finance.yahoo.com/v1/finance/search'), 0)
+        yf.config.cache.responses = False
+        self.assertEqual(_response_cache_ttl(chart_url, {'period1': 0, 'period2': 86400}), 0)
+
+    def test_get_raw_json_served_from_disk(self):
+        dat = YfData()
+        url = 'https://query2.finance.yahoo.com/v10/finance/quoteSummary/MSFT'
+        response = MagicMock()
+        response.status_code = 200
+        response.url = url
+        response.content = b'{"quoteSummary": {}}'
+        response.json.return_value = {"quoteSummary": {}}
+        with patch.object(YfData, 'get', return_value=response) as get:
+            self.assertEqual(dat.get_raw_json(url, params={'modules': 'x'}), {"quoteSummary": {}})
+            self.assertEqual(dat.get_raw_json(url, params={'modules': 'x'}), {"quoteSummary": {}})
+            self.assertEqual(get.call_count, 1)
+            dat.get_raw_json(url, params={'modules': 'y'})
+            self.assertEqual(get.call_count, 2)
+
+
+class TestSessionPool(unittest.TestCase):
+    def test_pooled_session_reused_across_threads(self):
+        dat = YfData()
+        if dat._session is not dat._own_session:
+            self.skipTest("user session set, pooling disabled")
+        sessions = []
+
+        def borrow():
+            with dat._borrow_session() as session:
+                sessions.append(session)
+
+        borrow()
+        t = threading.Thread(target=borrow)
+        t.start()
+        t.join()
+        self.assertIs(sessions[0], sessions[1])
+        self.assertIsNot(sessions[0], dat._session)
+        self.assertIs(sessions[0].cookies.jar, dat._session.cookies.jar)
+
+    def test_concurrent_borrows_get_distinct_sessions(self):
+        dat = YfData()
+        with dat._borrow_session() as s1:
+            with dat._borrow_session() as s2:
+                self.assertIsNot(s1, s2)
+
+    def test_pool_keeps_sessions_beyond_max_connections(self):
+        dat = YfData()
+        if dat._session is not dat._own_session:
+            self.skipTest("user session set, pooling disabled")
+        n = (yf.config.network.max_connections or 1) + 2
+        barrier = threading.Barrier(n)
+        first = set()
+
+        def borrow(sessions):
+            with dat._borrow_session() as session:
+                sessions.add(session)
+                barrier.wait()
+
+        for sessions in (first, set()):
+            threads = [threading.Thread(target=borrow, args=(sessions,)) for _ in range(n)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(len(sessions), n)
+        # Second round of concurrent requests reused every session, none were closed
+        self.assertEqual(sessions, first)
+
+
+class TestCrumbSnapshot(unittest.TestCase):
+    def setUp(self):
+        # Private instance, bypassing singleton
+        self.dat = object.__new__(YfData)
+        self.dat.__init__()
+        self.dat._cookie = True
+        self.dat._crumb = 'abc'
+
+    def test_fast_path_skips_lock(self):
+        snapshot = self.dat._get_crumb_snapshot()
+        self.assertEqual(snapshot, _CrumbSnapshot('abc', 'basic', 0))
+        self.dat._cookie_lock = MagicMock()
+        self.dat._cookie_lock.__enter__.side_effect = AssertionError("lock taken")
+        self.dat._cookie_lock.acquire.side_effect = AssertionError("lock taken")
+        self.assertIs(self.dat._get_crumb_snapshot(), snapshot)
+        self.assertEqual(self.dat._get_cookie_and_crumb(), ('abc', 'basic'))
+
+    def test_toggle_invalidates_once(self):
+        snapshot = self.dat._get_crumb_snapshot()
+        with patch.object(YfData, '_get_crumb_csrf', return_value='xyz'):
+            self.dat._toggle_cookie_strategy(snapshot.version)
+            self.assertIsNone(self.dat._crumb_snapshot)
+            # Stale version from a concurrent failed request must not toggle back
+            self.dat._toggle_cookie_strategy(snapshot.version)
+            self.assertEqual(self.dat._cookie_strategy, 'csrf')
+            self.assertEqual(self.dat._get_crumb_snapshot(), _CrumbSnapshot('xyz', 'csrf', 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Tests for hedged requests & host failover
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_failover
+
+"""
+from tests.context import yfinance as yf
+
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from yfinance import failover
+from yfinance.ratelimit import RateLimiter
+from yfinance.data import YfData, AsyncYfData
+
+QUERY1 = 'https://query1.finance.yahoo.com/v8/finance/chart/MSFT'
+QUERY2 = 'https://query2.finance.yahoo.com/v8/finance/chart/MSFT'
+
+
+def _response(url, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.url = url
+    return response
+
+
+class TestFailover(unittest.TestCase):
+    def setUp(self):
+        failover.get_circuit_breaker().reset()
+        yf.config.network.failover = True
+
+    def tearDown(self):
+        yf.config.network.failover = False
+        yf.config.network.failover_cooldown = 30
+        failover.get_circuit_breaker().reset()
+
+    def test_alternate_url(self):
+        self.assertEqual(failover.alternate_url(QUERY2 + '?a=1'), QUERY1 + '?a=1')
+        self.assertEqual(failover.alternate_url(QUERY1), QUERY2)
+        self.assertIsNone(failover.alternate_url('https://finance.yahoo.com/quote/MSFT'))
+
+    def test_circuit_breaker_routes_around_host(self):
+        breaker = failover.get_circuit_breaker()
+        self.assertEqual(failover.route(QUERY2), (QUERY2, QUERY1))
+        for _ in range(4):
+            breaker.record_failure('query2.finance.yahoo.com')
+        self.assertEqual(failover.route(QUERY2), (QUERY2, QUERY1))
+        breaker.record_failure('query2.finance.yahoo.com')
+        self.assertEqual(failover.route(QUERY2), (QUERY1, None))
+
+        # After cooldown a trial request is allowed, one more failure re-opens
+        yf.config.network.failover_cooldown = 0
+        self.assertEqual(failover.route(QUERY2), (QUERY2, QUERY1))
+        yf.config.network.failover_cooldown = 30
+        breaker.record_failure('query2.finance.yahoo.com')
+        self.assertEqual(failover.route(QUERY2), (QUERY1, None))
+
+    def test_success_resets(self):
+        breaker = failover.get_circuit_breaker()
+        for _ in range(4):
+            breaker.record_failure('query2.finance.yahoo.com')
+        breaker.record_success('query2.finance.yahoo.com')
+        breaker.record_failure('query2.finance.yahoo.com')
+        self.assertFalse(breaker.is_open('query2.finance.yahoo.com'))
+
+    def test_send_fails_over(self):
+        for _ in range(5):
+            failover.get_circuit_breaker().record_failure('query2.finance.yahoo.com')
+        request_method = MagicMock(side_effect=lambda **kwargs: _response(kwargs['url']), __name__='get')
+        response = YfData()._send(request_method, {'url': QUERY2, 'params': {}})
+        self.assertEqual(response.url, QUERY1)
+
+
+def _slow_query2(request_method, request_args, abandoned=None):
+    if 'query2' in request_args['url']:
+        time.sleep(0.5)
+    return _response(request_args['url'])
+
+
+async def _slow_query2_async(request_method, request_args):
+    if 'query2' in request_args['url']:
+        await asyncio.sleep(0.5)
+    return _response(request_args['url'])
+
+
+class TestHedging(unittest.TestCase):
+    def setUp(self):
+        yf.config.network.hedge = True
+
+    def tearDown(self):
+        yf.config.network.hedge = False
+
+    def test_hedge_slow_request(self):
+        with patch.object(YfData, '_tracked_request', side_effect=_slow_query2), \
+                patch.object(failover.LatencyTracker, 'hedge_delay', return_value=0.05), \
+                patch.object(RateLimiter, 'acquire') as acquire:
+            response = YfData()._send(MagicMock(__name__='get'), {'url': QUERY2, 'params': {}})
+        self.assertEqual(response.url, QUERY1)
+        # Hedge waited for rate limiter
+        acquire.assert_called_once_with(QUERY1)
+
+    def test_hedge_loser_not_recorded(self):
+        def failing_query2(request_method, request_args):
+            if 'query2' in request_args['url']:
+                time.sleep(0.3)
+                raise ConnectionError("slow host gave up")
+            return _response(request_args['url'])
+
+        with patch.object(YfData, '_timed_request', side_effect=failing_query2), \
+                patch.object(failover.LatencyTracker, 'hedge_delay', return_value=0.05), \
+                patch.object(failover.LatencyTracker, 'record') as record_latency, \
+                patch.object(failover.CircuitBreaker, 'record_success') as record_success, \
+                patch.object(failover.CircuitBreaker, 'record_failure') as record_failure:
+            response = YfData()._send(MagicMock(__name__='get'), {'url': QUERY2, 'params': {}})
+            time.sleep(0.5)  # loser finishes
+        self.assertEqual(response.url, QUERY1)
+        record_success.assert_called_once_with('query1.finance.yahoo.com')
+        record_latency.assert_called_once()
+        record_failure.assert_not_called()
+
+    def test_hedge_delay_excludes_queueing(self):
+        def fast_query1(request_method, request_args, abandoned=None):
+            time.sleep(0.1)
+            return _response(request_args['url'])
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        executor.submit(time.sleep, 0.3)  # busy
+        with patch.object(failover, 'get_executor', return_value=executor), \
+                patch.object(YfData, '_tracked_request', side_effect=fast_query1) as tracked, \
+                patch.object(failover.LatencyTracker, 'hedge_delay', return_value=0.2):
+            response = YfData()._send(MagicMock(__name__='get'), {'url': QUERY2, 'params': {}})
+        executor.shutdown()
+        self.assertEqual(response.url, QUERY2)
+        self.assertEqual(tracked.call_count, 1)
+
+    def test_no_hedge_when_fast(self):
+        with patch.object(YfData, '_tracked_request', side_effect=_slow_query2) as tracked, \
+                patch.object(failover.LatencyTracker, 'hedge_delay', return_value=1.0):
+            response = YfData()._send(MagicMock(__name__='get'), {'url': QUERY1, 'params': {}})
+        self.assertEqual(response.url, QUERY1)
+        self.assertEqual(tracked.call_count, 1)
+
+    def test_hedge_async(self):
+        async def run():
+            with patch.object(AsyncYfData, '_tracked_request', side_effect=_slow_query2_async), \
+                    patch.object(failover.LatencyTracker, 'hedge_delay', return_value=0.05), \
+                    patch.object(RateLimiter, 'acquire_async') as acquire_async:
+                response = await AsyncYfData()._send(MagicMock(), {'url': QUERY2, 'params': {}})
+            acquire_async.assert_awaited_once_with(QUERY1)
+            return response
+        self.assertEqual(asyncio.run(run()).url, QUERY1)
+
+    def test_hedge_delay_percentile(self):
+        tracker = failover.LatencyTracker()
+        self.assertEqual(tracker.hedge_delay('chart'), failover._DEFAULT_HEDGE_DELAY)
+        for i in range(100):
+            tracker.record('chart', i / 100)
+        self.assertAlmostEqual(tracker.hedge_delay('chart'), 0.95)
+
+
+if __name__ == '__main__':
+    unittest.main()
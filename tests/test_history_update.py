@@ -0,0 +1,94 @@
+"""
+Tests for incremental history updates, offline with mocked chart responses
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_history_update
+
+"""
+from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
+
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from tests.chart_fixtures import DAY, START, OLD, WITH_DIVIDEND, WITH_SPLIT, NO_ACTIONS, chart_response
+from yfinance.data import YfData
+
+
+class TestHistoryUpdate(TempCacheDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        yf.cache.get_tz_cache().store("AAA", "UTC")
+        self.chart = OLD
+        self.requested = []
+        self.patcher = patch.object(YfData, 'cache_get', side_effect=self._cache_get)
+        self.patcher.start()
+        patch.object(YfData, 'get', side_effect=self._cache_get).start()
+
+    def tearDown(self):
+        patch.stopall()
+        super().tearDown()
+
+    def _cache_get(self, url, params=None, timeout=30):
+        self.requested.append(params)
+        return chart_response(self.chart, params["period1"], params["period2"])
+
+    def _check_update(self, new_chart, **kwargs):
+        dat = yf.Ticker("AAA")
+        old = dat.history(start="1970-01-11", **kwargs)
+        self.assertEqual(len(old), 3)
+
+        self.chart = new_chart
+        self.requested.clear()
+        updated = yf.Ticker("AAA").history_update(old, **kwargs)
+        # Only the tail was requested, from the last existing bar
+        self.assertEqual([p["period1"] for p in self.requested], [START + 2 * DAY])
+
+        expected = yf.Ticker("AAA").history(start="1970-01-11", **kwargs)
+        pd.testing.assert_frame_equal(updated, expected, check_freq=False)
+
+    def test_no_new_actions(self):
+        # Last bar was incomplete, so is replaced
+        self._check_update(NO_ACTIONS)
+
+    def test_new_dividend(self):
+        self._check_update(WITH_DIVIDEND)
+
+    def test_new_dividend_unadjusted(self):
+        self._check_update(WITH_DIVIDEND, auto_adjust=False)
+
+    def test_new_dividend_back_adjust(self):
+        self._check_update(WITH_DIVIDEND, auto_adjust=False, back_adjust=True)
+
+    def test_new_split(self):
+        self._check_update(WITH_SPLIT)
+
+    def test_new_split_no_actions(self):
+        self._check_update(WITH_SPLIT, actions=False, auto_adjust=False)
+
+    def test_empty(self):
+        self.chart = NO_ACTIONS
+        df = yf.Ticker("AAA").history_update(pd.DataFrame())
+        self.assertEqual(len(df), 5)
+
+    def test_download_since(self):
+        kwargs = dict(auto_adjust=True, actions=True, progress=False, threads=False)
+        for fmt in ("wide", "long"):
+            self.chart = OLD
+            old = yf.download(["AAA"], start="1970-01-11", format=fmt, **kwargs)
+            self.chart = WITH_DIVIDEND
+            self.requested.clear()
+            updated = yf.download(["AAA"], since=old, format=fmt, **kwargs)
+            self.assertEqual([p["period1"] for p in self.requested], [START + 2 * DAY])
+            expected = yf.download(["AAA"], start="1970-01-11", format=fmt, **kwargs)
+            pd.testing.assert_frame_equal(updated, expected, check_freq=False)
+
+    def test_download_since_invalid(self):
+        with self.assertRaises(ValueError):
+            yf.download(["AAA"], since=pd.DataFrame(), engine="async", auto_adjust=True, progress=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
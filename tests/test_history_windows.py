@@ -0,0 +1,138 @@
+"""
+Tests for fetching long intraday ranges in several windows, offline with mocked chart responses
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_history_windows
+
+"""
+from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from yfinance.data import AsyncYfData, YfData
+from yfinance.scrapers.history import PriceHistory
+
+DAY = 86400
+NOW = int(time.time()) // DAY * DAY
+# 1m bars 09:00-09:59 UTC each day for the last 40 days
+BARS = [d + 9 * 3600 + m * 60 for d in range(NOW - 40 * DAY, NOW, DAY) for m in range(60)]
+
+
+class TestHistoryWindows(TempCacheDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        yf.cache.get_tz_cache().store("AAA", "UTC")
+        self.requested = []
+        self.lock = threading.Lock()
+        patch.object(YfData, 'get', side_effect=self._get).start()
+        patch.object(YfData, 'cache_get', side_effect=self._get).start()
+
+    def tearDown(self):
+        patch.stopall()
+        super().tearDown()
+
+    def _get(self, url, params=None, timeout=30):
+        # Like Yahoo: max 8 days of 1m per request, limited lookback,
+        # and the live price appended to every response
+        with self.lock:
+            self.requested.append(dict(params))
+        response = MagicMock()
+        response.text = ""
+        if params["period2"] - params["period1"] > 8 * DAY or params["period1"] < NOW - 25 * DAY:
+            response.json.return_value = {"chart": {"result": None, "error": {"code": "Unprocessable Entity",
+                                                                               "description": "1m data not available"}}}
+            return response
+        ts = [t for t in BARS if params["period1"] <= t < params["period2"]] + [BARS[-1]]
+        close = [float(t // 60 % 1000) for t in ts]
+        response.json.return_value = {"chart": {"result": [{
+            "meta": {"instrumentType": "EQUITY", "exchangeTimezoneName": "UTC", "currency": "USD",
+                     "priceHint": 2, "validRanges": ["1d", "5d", "1mo", "max"]},
+            "timestamp": ts,
+            "indicators": {"quote": [{"open": close, "high": close, "low": close, "close": close,
+                                      "volume": [1] * len(ts)}],
+                           "adjclose": [{"adjclose": close}]},
+            "events": {},
+        }], "error": None}}
+        return response
+
+    def _expected_index(self, start, end):
+        bars = [t for t in BARS if start <= t < end]
+        return pd.to_datetime(bars, unit="s", utc=True)
+
+    def test_split_windows(self):
+        start = NOW - 20 * DAY
+        params = {"interval": "1m", "period1": start, "period2": start + 20 * DAY}
+        windows = PriceHistory._split_windows(params)
+        self.assertEqual([(w["period1"] - start, w["period2"] - start) for w in windows],
+                         [(0, 8 * DAY), (8 * DAY, 16 * DAY), (16 * DAY, 20 * DAY)])
+        params = {"interval": "1d", "period1": 0, "period2": 200 * DAY}
+        self.assertEqual(PriceHistory._split_windows(params), [params])
+
+    def test_windows_within_lookback(self):
+        for interval, days in (("1m", 30), ("5m", 60), ("1h", 730)):
+            with self.subTest(interval=interval):
+                earliest = time.time() - days * DAY
+                params = {"interval": interval, "range": "2y" if interval != "1h" else "5y"}
+                with self.assertLogs("yfinance", level="WARNING") as logs:
+                    windows = PriceHistory._split_windows(params, "AAA")
+                self.assertEqual(len(logs.output), 1)
+                self.assertIn(f"must be within the last {days} days", logs.output[0])
+                self.assertGreaterEqual(min(w["period1"] for w in windows), earliest)
+                self.assertEqual(windows[0]["period1"], min(w["period1"] for w in windows))
+
+    def test_history_clamped_to_lookback(self):
+        start = NOW - 40 * DAY
+        with self.assertLogs("yfinance", level="WARNING"):
+            df = yf.Ticker("AAA").history(start=pd.Timestamp(start, unit="s"), end=pd.Timestamp(NOW, unit="s"),
+                                          interval="1m")
+        self.assertFalse(df.empty)
+        self.assertGreaterEqual(min(p["period1"] for p in self.requested), time.time() - 30 * DAY)
+
+    def test_long_range_fetched_in_windows(self):
+        start, end = NOW - 20 * DAY, NOW
+        df = yf.Ticker("AAA").history(start=pd.Timestamp(start, unit="s"), end=pd.Timestamp(end, unit="s"),
+                                      interval="1m", auto_adjust=False)
+        self.assertEqual(len(self.requested), 3)
+        self.assertTrue(df.index.equals(self._expected_index(start, end).rename("Datetime")))
+        self.assertEqual(df["Close"].iloc[0], float(df.index[0].value // 60_000_000_000 % 1000))
+
+    def test_max_gets_30_days(self):
+        now = pd.Timestamp.now("UTC")
+        df = yf.Ticker("AAA").history(period="max", interval="1m")
+        self.assertEqual(len(self.requested), 4)
+        # Window beyond Yahoo's lookback failed, others are kept
+        self.assertGreater(df.index[0], now - pd.Timedelta(days=23))
+        self.assertLess(df.index[0], now - pd.Timedelta(days=20))
+        self.assertFalse(df.index.duplicated().any())
+
+    def test_period_converted(self):
+        df = yf.Ticker("AAA").history(period="5d", interval="1m")
+        self.assertEqual(self.requested[0].get("range"), "5d")
+        self.requested.clear()
+        df = yf.Ticker("AAA").history(period="1mo", interval="1m")
+        self.assertGreater(len(self.requested), 1)
+        self.assertNotIn("range", self.requested[0])
+        self.assertFalse(df.empty)
+
+    def test_async(self):
+        start, end = NOW - 20 * DAY, NOW
+
+        async def get(url, params=None, timeout=30):
+            return self._get(url, params, timeout)
+
+        with patch.object(AsyncYfData, 'get', side_effect=get):
+            df = asyncio.run(yf.Ticker("AAA").history_async(start=pd.Timestamp(start, unit="s"),
+                                                            end=pd.Timestamp(end, unit="s"), interval="1m"))
+        self.assertEqual(len(self.requested), 3)
+        self.assertTrue(df.index.equals(self._expected_index(start, end).rename("Datetime")))
+
+
+if __name__ == '__main__':
+    unittest.main()
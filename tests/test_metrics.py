@@ -0,0 +1,75 @@
+"""
+Tests for request metrics
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_metrics
+
+"""
+from tests.context import yfinance as yf
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from yfinance import metrics
+from yfinance.data import YfData, _CrumbSnapshot
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_snapshot_and_prometheus(self):
+        registry = metrics.MetricsRegistry()
+        registry.inc('yfinance_requests_total', {'endpoint': 'chart', 'method': 'GET'})
+        registry.inc('yfinance_requests_total', {'method': 'GET', 'endpoint': 'chart'})
+        registry.observe('yfinance_request_duration_seconds', 0.3, {'endpoint': 'chart'})
+
+        snap = registry.snapshot()
+        self.assertEqual(snap['yfinance_requests_total'], [{'labels': {'endpoint': 'chart', 'method': 'GET'}, 'value': 2}])
+        h = snap['yfinance_request_duration_seconds'][0]['value']
+        self.assertEqual(h['count'], 1)
+        self.assertEqual(h['buckets'][0.25], 0)
+        self.assertEqual(h['buckets'][0.5], 1)
+
+        text = registry.prometheus_text()
+        self.assertIn('# TYPE yfinance_requests_total counter', text)
+        self.assertIn('yfinance_requests_total{endpoint="chart",method="GET"} 2', text)
+        self.assertIn('yfinance_request_duration_seconds_bucket{endpoint="chart",le="+Inf"} 1', text)
+        self.assertIn('yfinance_request_duration_seconds_count{endpoint="chart"} 1', text)
+
+
+class TestRequestMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        yf.config.debug.metrics = True
+
+    def tearDown(self):
+        yf.config.debug.metrics = False
+        metrics.reset()
+
+    def _make_request(self, status_codes):
+        responses = []
+        for code in status_codes:
+            r = MagicMock()
+            r.status_code = code
+            r.content = b'12345'
+            responses.append(r)
+        request_method = MagicMock(side_effect=responses, __name__='get')
+        with patch.object(YfData, '_get_crumb_snapshot', return_value=_CrumbSnapshot('abc', 'basic', 0)), \
+                patch.object(YfData, '_toggle_cookie_strategy'):
+            YfData()._make_request('https://query2.finance.yahoo.com/v8/finance/chart/MSFT', request_method)
+
+    def test_request_counted(self):
+        self._make_request([401, 200])
+        snap = metrics.snapshot()
+        self.assertEqual(snap['yfinance_requests_total'], [{'labels': {'endpoint': 'chart', 'method': 'GET'}, 'value': 2}])
+        self.assertEqual(snap['yfinance_response_bytes_total'][0]['value'], 10)
+        self.assertEqual(snap['yfinance_http_errors_total'], [{'labels': {'endpoint': 'chart', 'status': '4xx'}, 'value': 1}])
+        self.assertEqual(snap['yfinance_retries_total'], [{'labels': {'endpoint': 'chart', 'reason': 'cookie_strategy'}, 'value': 1}])
+        self.assertEqual(snap['yfinance_request_duration_seconds'][0]['value']['count'], 2)
+
+    def test_disabled(self):
+        yf.config.debug.metrics = False
+        self._make_request([200])
+        self.assertEqual(metrics.snapshot(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,335 @@
+"""
+Tests for multi-ticker download, offline with mocked chart responses
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_multi
+
+"""
+from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
+
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from yfinance.data import YfData
+from yfinance.exceptions import YFRateLimitError
+from yfinance.multi import _union_concat
+
+
+def _chart_json(timestamps, close):
+    n = len(timestamps)
+    return {
+        "chart": {
+            "result": [
+                {
+                    "meta": {"instrumentType": "EQUITY", "exchangeTimezoneName": "UTC", "currency": "USD"},
+                    "timestamp": timestamps,
+                    "indicators": {
+                        "quote": [{"open": close, "high": close, "low": close,
+                                   "close": close, "volume": [10] * n}],
+                        "adjclose": [{"adjclose": close}],
+                    },
+                    "events": {},
+                }
+            ],
+            "error": None,
+        }
+    }
+
+
+# Ragged histories, like a real universe
+CHARTS = {
+    "AAA": _chart_json([0, 86400, 172800], [1.0, 2.0, 3.0]),
+    "BBB": _chart_json([86400, 172800], [20.0, 30.0]),
+    "CCC": _chart_json([0], [100.0]),
+}
+
+
+def _cache_get(url, params=None, timeout=30):
+    ticker = url.rsplit('/', 1)[-1]
+    if ticker not in CHARTS:
+        raise Exception(f"No data for {ticker}")
+    response = MagicMock()
+    response.json.return_value = CHARTS[ticker]
+    response.text = ""
+    response.status_code = 200
+    return response
+
+
+class TestDownloadBase(TempCacheDirMixin, unittest.TestCase):
+    tickers = ["AAA", "BBB", "CCC"]
+    kwargs = dict(start="1970-01-01", end="1970-01-05", auto_adjust=False, progress=False)
+
+    def setUp(self):
+        super().setUp()
+        tz_cache = yf.cache.get_tz_cache()
+        for t in self.tickers + ["BAD"]:
+            tz_cache.store(t, "UTC")
+        self.patcher = patch.object(YfData, 'cache_get', side_effect=_cache_get)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        super().tearDown()
+
+
+class TestDownloadIter(TestDownloadBase):
+    def test_yields_each_ticker(self):
+        for threads in (False, True):
+            results = dict(yf.download_iter(self.tickers + ["BAD"], threads=threads, **self.kwargs))
+            self.assertEqual(sorted(results.keys()), ["AAA", "BAD", "BBB", "CCC"])
+            self.assertIsInstance(results["BAD"], Exception)
+            df = yf.download(self.tickers, threads=False, **self.kwargs)
+            for t in self.tickers:
+                self.assertEqual(results[t]["Close"].tolist(), df[("Close", t)].dropna().tolist())
+
+    def test_does_not_touch_shared_state(self):
+        yf.shared._DFS = {"XYZ": None}
+        list(yf.download_iter(self.tickers, **self.kwargs))
+        self.assertEqual(yf.shared._DFS, {"XYZ": None})
+
+    def test_stop_early(self):
+        it = yf.download_iter(self.tickers * 10, threads=2, **self.kwargs)
+        ticker, df = next(it)
+        it.close()
+        self.assertIn(ticker, self.tickers)
+
+
+class TestDownloadLong(TestDownloadBase):
+    def test_long_matches_wide(self):
+        wide = yf.download(self.tickers, threads=False, actions=True, **self.kwargs)
+        long = yf.download(self.tickers, threads=False, actions=True, format="long", **self.kwargs)
+        self.assertEqual(list(long.columns), ["Ticker", "Date", "Open", "High", "Low", "Close",
+                                              "Adj Close", "Volume", "Dividends", "Stock Splits"])
+        # 3 + 2 + 1 rows, no NaN padding
+        self.assertEqual(len(long), 6)
+        self.assertEqual(long["Volume"].dtype, "int64")
+
+        expected = wide.stack(level="Ticker", future_stack=True).dropna(how="all").reset_index()
+        expected = expected.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+        actual = long.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+        for c in ["Open", "Close", "Adj Close", "Dividends"]:
+            self.assertEqual(actual[c].tolist(), expected[c].tolist())
+        self.assertEqual(actual["Ticker"].astype(str).tolist(), expected["Ticker"].tolist())
+        self.assertTrue((actual["Date"] == expected["Date"]).all())
+
+    def test_long_keeps_tz(self):
+        long = yf.download(self.tickers, threads=False, ignore_tz=False, format="long", **self.kwargs)
+        self.assertEqual(str(long["Date"].dt.tz), "UTC")
+
+    def test_long_all_failed(self):
+        long = yf.download(["BAD"], threads=False, format="long", **self.kwargs)
+        self.assertTrue(long.empty)
+        self.assertIn("Close", long.columns)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            yf.download(self.tickers, format="tall", **self.kwargs)
+
+    def test_arrow(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            with self.assertRaises(yf.exceptions.YFException):
+                yf.download(self.tickers, threads=False, format="arrow", **self.kwargs)
+            return
+        table = yf.download(self.tickers, threads=False, format="arrow", **self.kwargs)
+        self.assertEqual(table.num_rows, 6)
+        self.assertEqual(table.column_names[:2], ["Ticker", "Date"])
+
+
+class TestDownloadProcesses(TestDownloadBase):
+    def test_matches_in_process(self):
+        expected = yf.download(self.tickers, threads=False, **self.kwargs)
+        for threads in (False, 2):
+            actual = yf.download(self.tickers, threads=threads, processes=2, **self.kwargs)
+            pd.testing.assert_frame_equal(actual, expected)
+
+    def test_worker_error_reported(self):
+        with patch.dict(CHARTS, {"BAD": {"chart": {"result": None, "error": {"description": "bad"}}}}):
+            df = yf.download(["AAA", "BAD"], threads=2, processes=1, **self.kwargs)
+        self.assertTrue(df[("Close", "BAD")].isna().all())
+        self.assertIn("YFPricesMissingError", yf.shared._ERRORS["BAD"])
+        self.assertIn("Traceback", yf.shared._TRACEBACKS["BAD"])
+
+
+class TestPrefetchTz(TestDownloadBase):
+    def setUp(self):
+        super().setUp()
+        # Cold cache, except AAA
+        yf.set_tz_cache_location(tempfile.mkdtemp(dir=self.tempCacheDir.name))
+        yf.cache.get_tz_cache().store("AAA", "UTC")
+
+    def test_missing_fetched_in_bulk(self):
+        quotes = {"quoteResponse": {"result": [{"symbol": "BBB", "exchangeTimezoneName": "UTC"},
+                                               {"symbol": "CCC", "exchangeTimezoneName": "Asia/Tokyo"}]}}
+        with patch.object(YfData, 'get_raw_json', return_value=quotes) as get_raw_json:
+            df = yf.download(self.tickers, threads=2, **self.kwargs)
+        get_raw_json.assert_called_once()
+        self.assertEqual(get_raw_json.call_args.kwargs["params"]["symbols"], "BBB,CCC")
+        self.assertEqual(yf.cache.get_tz_cache().lookup_many(self.tickers),
+                         {"AAA": "UTC", "BBB": "UTC", "CCC": "Asia/Tokyo"})
+        # No per-ticker timezone requests
+        self.assertFalse([c for c in YfData.cache_get.call_args_list if c.kwargs["params"].get("range") == "1d"])
+        self.assertEqual(df[("Close", "CCC")].dropna().tolist(), [100.0])
+
+    def test_tickers(self):
+        quotes = {"quoteResponse": {"result": [{"symbol": t, "exchangeTimezoneName": "UTC"} for t in ["BBB", "CCC"]]}}
+        dat = yf.Tickers(self.tickers)
+        with patch.object(YfData, 'get_raw_json', return_value=quotes) as get_raw_json:
+            dat.download(threads=False, **self.kwargs)
+        # Only download() resolves timezones, Tickers reuses them from the cache
+        get_raw_json.assert_called_once()
+        self.assertEqual(dat.tickers["AAA"]._tz, "UTC")
+        self.assertEqual(dat.tickers["CCC"]._tz, "UTC")
+
+    def test_quote_failure_falls_back(self):
+        with patch.object(YfData, 'get_raw_json', side_effect=Exception("blocked")):
+            tzs = yf.multi._prefetch_tz(self.tickers)
+        self.assertEqual(tzs, {"AAA": "UTC"})
+
+    def test_quote_rate_limited(self):
+        with patch.object(yf.multi, '_TZ_QUOTE_CHUNK', 1), \
+                patch.object(YfData, 'get_raw_json', side_effect=YFRateLimitError()) as get_raw_json:
+            tzs = yf.multi._prefetch_tz(self.tickers)
+            df = yf.download(self.tickers, threads=False, **self.kwargs)
+        self.assertEqual(tzs, {"AAA": "UTC"})
+        # Stops at the first rate-limited chunk
+        self.assertEqual(get_raw_json.call_count, 2)
+        self.assertEqual(df[("Close", "CCC")].dropna().tolist(), [100.0])
+
+
+class TestResolveIsins(TestDownloadBase):
+    ISINS = {"US000000AAA0": "AAA", "US000000BBB0": "BBB", "US000000CCC0": "CCC"}
+
+    def test_cached_and_concurrent(self):
+        yf.cache.get_isin_cache().store("US000000AAA0", "AAA")
+        lock = threading.Lock()
+        active = [0, 0]  # current, max
+
+        def search(isin):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return self.ISINS.get(isin, "")
+
+        with patch.object(yf.utils, 'get_ticker_by_isin', side_effect=search) as get_ticker_by_isin:
+            df = yf.download(list(self.ISINS), threads=False, **self.kwargs)
+        self.assertEqual(sorted(c.args[0] for c in get_ticker_by_isin.call_args_list),
+                         ["US000000BBB0", "US000000CCC0"])
+        self.assertEqual(active[1], 2)
+        self.assertEqual(sorted(df["Close"].columns), sorted(self.ISINS))
+        self.assertEqual(yf.cache.get_isin_cache().lookup_many(self.ISINS), self.ISINS)
+
+        # Second time, all from cache
+        with patch.object(yf.utils, 'get_ticker_by_isin') as get_ticker_by_isin:
+            yf.download(list(self.ISINS), threads=False, **self.kwargs)
+        get_ticker_by_isin.assert_not_called()
+
+
+class TestUnionConcat(unittest.TestCase):
+    @staticmethod
+    def _df(dates, tz=None, repaired=False):
+        idx = pd.DatetimeIndex(dates, name="Date")
+        if tz is not None:
+            idx = idx.tz_localize(tz)
+        n = len(idx)
+        df = pd.DataFrame({"Open": np.arange(n) + 1.0, "Close": np.arange(n) + 2.0,
+                           "Volume": np.arange(n, dtype=np.int64)}, index=idx)
+        if repaired:
+            df["Repaired?"] = False
+        return df
+
+    def _check_matches_concat(self, dfs):
+        expected = pd.concat(list(dfs.values()), axis=1, sort=True, keys=list(dfs.keys()), names=["Ticker", "Price"])
+        actual = _union_concat(dict(dfs))
+        expected.index = pd.to_datetime(expected.index, utc=actual.index.tz is not None)
+        pd.testing.assert_frame_equal(actual, expected, check_index_type=False, check_names=False, check_freq=False)
+
+    def test_ragged(self):
+        self._check_matches_concat({"A": self._df(["2020-01-01", "2020-01-02", "2020-01-03"]),
+                                    "B": self._df(["2020-01-02", "2020-01-06"])})
+
+    def test_identical_index_keeps_dtypes(self):
+        dfs = {"A": self._df(["2020-01-01", "2020-01-02"], repaired=True),
+               "B": self._df(["2020-01-01", "2020-01-02"], repaired=True)}
+        self._check_matches_concat(dfs)
+        self.assertEqual(_union_concat(dfs)[("A", "Volume")].dtype, np.int64)
+
+    def test_mixed_dtypes_ragged(self):
+        self._check_matches_concat({"A": self._df(["2020-01-01", "2020-01-02"], repaired=True),
+                                    "B": self._df(["2020-01-02"])})
+
+    def test_mixed_timezones(self):
+        self._check_matches_concat({"A": self._df(["2020-01-01", "2020-01-02"], tz="America/New_York"),
+                                    "B": self._df(["2020-01-02"], tz="Asia/Tokyo")})
+
+    def test_failed_ticker(self):
+        self._check_matches_concat({"A": self._df(["2020-01-01", "2020-01-02"]),
+                                    "E": yf.utils.empty_df()})
+
+    def test_unsorted_longest(self):
+        self._check_matches_concat({"A": self._df(["2020-01-03", "2020-01-01", "2020-01-02"]),
+                                    "B": self._df(["2020-01-02", "2020-01-01"])})
+
+    def test_duplicate_timestamps_keep_last(self):
+        a = self._df(["2020-01-01", "2020-01-02", "2020-01-02"])
+        data = _union_concat({"A": a, "B": self._df(["2020-01-02"])})
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[("A", "Close")].tolist(), [2.0, 4.0])
+
+
+class TestDownloadConcurrent(TestDownloadBase):
+    def test_concurrent_downloads_isolated(self):
+        def slow_cache_get(url, params=None, timeout=30):
+            time.sleep(0.01)
+            return _cache_get(url, params, timeout)
+
+        results = {}
+
+        def run(tickers):
+            results[tuple(tickers)] = yf.download(tickers, threads=2, **self.kwargs)
+
+        groups = [["AAA", "BBB"], ["CCC"], ["BBB", "CCC"], ["AAA", "BAD"]]
+        with patch.object(YfData, 'cache_get', side_effect=slow_cache_get):
+            threads = [threading.Thread(target=run, args=(g,)) for g in groups for _ in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        for g in groups:
+            df = results[tuple(g)]
+            self.assertEqual(sorted(df["Close"].columns), sorted(g))
+        self.assertTrue(results[("AAA", "BAD")][("Close", "BAD")].isna().all())
+
+    def test_errors_published_to_shared(self):
+        yf.download(self.tickers + ["BAD"], threads=False, **self.kwargs)
+        self.assertEqual(list(yf.shared._ERRORS.keys()), ["BAD"])
+        self.assertEqual(sorted(yf.shared._DFS.keys()), ["AAA", "BAD", "BBB", "CCC"])
+
+    def test_adjust_error_published_to_shared(self):
+        kwargs = dict(self.kwargs, auto_adjust=True)
+        with patch.object(yf.utils, 'auto_adjust', side_effect=ValueError("bad adjust")):
+            for threads in (False, 2):
+                with self.subTest(threads=threads):
+                    df = yf.download(["AAA"], threads=threads, **kwargs)
+                    self.assertTrue(df.empty)
+                    self.assertIn("bad adjust", yf.shared._ERRORS["AAA"])
+            # Ticker.history() only logs it, leaving download()'s state alone
+            yf.shared._ERRORS.clear()
+            yf.Ticker("AAA").history(start=kwargs["start"], end=kwargs["end"])
+        self.assertEqual(yf.shared._ERRORS, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for the local price store, offline with mocked chart responses
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_price_store
+
+"""
+from tests.context import yfinance as yf
+from tests.context import TempCacheDirMixin
+
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from tests.chart_fixtures import DAY, START, OLD, WITH_DIVIDEND, WITH_SPLIT, NO_ACTIONS, chart_response
+from yfinance.data import YfData
+
+
+def _day(i):
+    return pd.Timestamp(START + i * DAY, unit="s")
+
+
+class TestPriceStore(TempCacheDirMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        yf.cache.get_tz_cache().store("AAA", "UTC")
+        self.chart = OLD
+        self.requested = []
+        patch.object(YfData, 'cache_get', side_effect=self._get).start()
+        patch.object(YfData, 'get', side_effect=self._get).start()
+
+    def tearDown(self):
+        patch.stopall()
+        yf.cache._PriceDBManager.close_db()
+        super().tearDown()
+
+    def _get(self, url, params=None, timeout=30):
+        self.requested.append((params["period1"], params["period2"]))
+        return chart_response(self.chart, params["period1"], params["period2"])
+
+    def _check(self, start, end, requested, **kwargs):
+        self.requested.clear()
+        df = yf.Ticker("AAA").history(start=_day(start), end=_day(end), store=True, **kwargs)
+        self.assertEqual(self.requested, requested)
+        expected = yf.Ticker("AAA").history(start=_day(start), end=_day(end), **kwargs)
+        pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+    def test_served_from_store(self):
+        self._check(0, 3, [(START, START + 3 * DAY)])
+        self._check(0, 3, [])
+        self._check(1, 2, [], auto_adjust=False)
+        self._check(0, 3, [], actions=False, rounding=True)
+
+    def test_fetch_later_only(self):
+        self._check(0, 2, [(START, START + 2 * DAY)])
+        self.chart = NO_ACTIONS
+        # From last stored bar
+        self._check(0, 5, [(START + DAY, START + 5 * DAY)])
+        self._check(0, 5, [])
+
+    def test_fetch_earlier_only(self):
+        self.chart = NO_ACTIONS
+        self._check(3, 5, [(START + 3 * DAY, START + 5 * DAY)])
+        # To first stored bar
+        self._check(0, 5, [(START, START + 3 * DAY + 1)])
+        self._check(0, 5, [])
+
+    def test_new_dividend(self):
+        for kwargs in (dict(), dict(auto_adjust=False), dict(auto_adjust=False, back_adjust=True)):
+            with self.subTest(**kwargs):
+                self.chart = OLD
+                yf.cache.get_price_store().delete("AAA|1d|prepost=0|repair=0")
+                self._check(0, 3, [(START, START + 3 * DAY)], **kwargs)
+                self.chart = WITH_DIVIDEND
+                self._check(0, 5, [(START + 2 * DAY, START + 5 * DAY)], **kwargs)
+                self._check(0, 5, [], **kwargs)
+
+    def test_new_split(self):
+        self._check(0, 3, [(START, START + 3 * DAY)])
+        self.chart = WITH_SPLIT
+        self._check(0, 5, [(START + 2 * DAY, START + 5 * DAY)])
+        self._check(0, 5, [], auto_adjust=False)
+
+    def test_store_out_of_date(self):
+        self._check(1, 3, [(START + DAY, START + 3 * DAY)])
+        # Earlier bars fetched now are adjusted for a dividend the store hasn't seen
+        self.chart = WITH_DIVIDEND
+        self._check(0, 3, [(START, START + DAY + 1), (START, START + 3 * DAY)])
+        self._check(0, 3, [])
+
+    def test_download(self):
+        kwargs = dict(start=_day(0), end=_day(3), auto_adjust=True, progress=False, threads=False)
+        df = yf.download(["AAA"], store=True, **kwargs)
+        self.requested.clear()
+        pd.testing.assert_frame_equal(yf.download(["AAA"], store=True, **kwargs), df)
+        self.assertEqual(self.requested, [])
+        pd.testing.assert_frame_equal(yf.download(["AAA"], **kwargs), df)
+
+    def test_download_invalid(self):
+        with self.assertRaises(ValueError):
+            yf.download(["AAA"], store=True, engine="async", auto_adjust=True, progress=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
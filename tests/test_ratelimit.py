@@ -0,0 +1,74 @@
+"""
+Tests for rate limiter
+
+To run all tests in suite from commandline:
+   python -m unittest tests.test_ratelimit
+
+"""
+from tests.context import yfinance as yf
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from yfinance.data import YfData, _CrumbSnapshot
+from yfinance.exceptions import YFRateLimitError
+from yfinance.ratelimit import RateLimiter, _TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_paced(self):
+        with patch('yfinance.ratelimit._time.monotonic', return_value=100.0):
+            bucket = _TokenBucket(rate=2, burst=3)
+            self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+            # Queued callers wait successively longer
+            self.assertAlmostEqual(bucket.reserve(), 0.5)
+            self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_backoff_and_recovery(self):
+        bucket = _TokenBucket(rate=10, burst=1)
+        bucket.penalise()
+        self.assertEqual(bucket.rate, 5)
+        for _ in range(4):
+            bucket.penalise()
+        self.assertEqual(bucket.rate, 0.5)  # floor
+        bucket.reward()
+        self.assertAlmostEqual(bucket.rate, 0.7)
+        for _ in range(100):
+            bucket.reward()
+        self.assertEqual(bucket.rate, 10)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        yf.config.network.rate_limit = 10
+
+    def tearDown(self):
+        yf.config.network.rate_limit = None
+
+    def test_disabled(self):
+        yf.config.network.rate_limit = None
+        limiter = RateLimiter()
+        limiter.acquire('https://query1.finance.yahoo.com/x')
+        self.assertEqual(limiter.stats(), {})
+
+    def test_bucket_per_host(self):
+        limiter = RateLimiter()
+        limiter.on_response('https://query1.finance.yahoo.com/x', 429)
+        limiter.acquire('https://query2.finance.yahoo.com/x')
+        self.assertEqual(limiter.stats(), {'query1.finance.yahoo.com': 5, 'query2.finance.yahoo.com': 10})
+
+    def test_make_request_backs_off_on_429(self):
+        limiter = RateLimiter()
+        response = MagicMock()
+        response.status_code = 429
+        session_get = MagicMock(return_value=response)
+        with patch('yfinance.data.get_rate_limiter', return_value=limiter), \
+                patch.object(YfData, '_get_crumb_snapshot', return_value=_CrumbSnapshot('abc', 'basic', 0)), \
+                patch.object(YfData, '_toggle_cookie_strategy'):
+            with self.assertRaises(YFRateLimitError):
+                YfData()._make_request('https://query2.finance.yahoo.com/x', session_get)
+        self.assertEqual(limiter.stats(), {'query2.finance.yahoo.com': 2.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,8 +14,13 @@ from unittest import TestSuite
 import pandas as pd
 
 import unittest
+import numpy as np
 
-from yfinance.utils import is_valid_period_format, _dts_in_same_interval, _parse_user_dt
+import json
+
+from yfinance.config import YfConfig
+from yfinance.utils import is_valid_period_format, _dts_in_same_interval, _parse_user_dt, json_loads, response_json
+from yfinance.utils import parse_actions, parse_quotes, safe_merge_dfs
 
 
 class TestPandas(unittest.TestCase):
@@ -182,6 +187,114 @@ class TestDateIntervalCheck(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.assertEqual(_parse_user_dt(float(epoch), exchange_tz), expected)
 
+class TestJsonDecoder(unittest.TestCase):
+    def tearDown(self):
+        YfConfig.network.json_decoder = 'auto'
+
+    def test_decoders_agree(self):
+        payload = b'{"chart": {"result": [{"timestamp": [1, 2], "close": [1.5, null]}], "error": null}}'
+        expected = json.loads(payload)
+        for decoder in ('auto', 'stdlib'):
+            YfConfig.network.json_decoder = decoder
+            self.assertEqual(json_loads(payload), expected)
+            self.assertEqual(json_loads(payload.decode()), expected)
+
+    def test_callable_decoder(self):
+        YfConfig.network.json_decoder = lambda data: {'custom': True}
+        self.assertEqual(json_loads(b'{}'), {'custom': True})
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads(b'<html>Will be right back</html>')
+
+    def test_nan_falls_back_to_stdlib(self):
+        self.assertTrue(pd.isna(json_loads(b'{"a": NaN}')['a']))
+
+    def test_response_json(self):
+        class Response:
+            content = b'{"a": 1}'
+        self.assertEqual(response_json(Response()), {'a': 1})
+
+
+class TestParseChart(unittest.TestCase):
+    chart = {
+        "timestamp": [86400, 0, 172800],
+        "indicators": {
+            "quote": [{"open": [2.0, 1, None], "high": [2.5, 1.5, None], "low": [1.5, 0.5, None],
+                       "close": [2.0, 1.0, None], "volume": [200, 100, None]}],
+            "adjclose": [{"adjclose": [1.9, 0.9, None]}],
+        },
+        "events": {
+            "dividends": {"86400": {"amount": 0.1, "date": 86400, "currency": ""},
+                          "0": {"amount": 0.2, "date": 0, "currency": ""}},
+            "splits": {"0": {"date": 0, "numerator": 3, "denominator": 2, "splitRatio": "3:2"}},
+        },
+    }
+
+    def test_parse_quotes(self):
+        quotes = parse_quotes(self.chart)
+        self.assertEqual(quotes.columns.tolist(), ["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+        self.assertEqual(quotes.index.tolist(), pd.to_datetime([0, 86400, 172800], unit="s").tolist())
+        self.assertEqual(quotes["Open"].dtype, "float64")
+        self.assertEqual(quotes["Open"].tolist()[:2], [1.0, 2.0])
+        self.assertTrue(quotes.iloc[2].isna().all())
+        self.assertEqual(quotes["Adj Close"].tolist()[:2], [0.9, 1.9])
+        self.assertEqual(quotes["Volume"].tolist()[:2], [100.0, 200.0])
+
+    def test_parse_quotes_int_volume(self):
+        chart = {"timestamp": [0], "indicators": {"quote": [{"open": [1.0], "high": [1.0], "low": [1.0],
+                                                             "close": [1.0], "volume": [5]}]}}
+        quotes = parse_quotes(chart)
+        self.assertEqual(quotes["Volume"].dtype, "int64")
+        self.assertEqual(quotes["Adj Close"].tolist(), [1.0])
+
+    def test_parse_actions(self):
+        dividends, splits, capital_gains = parse_actions(self.chart)
+        self.assertEqual(dividends.columns.tolist(), ["Dividends"])
+        self.assertEqual(dividends["Dividends"].tolist(), [0.2, 0.1])
+        self.assertEqual(dividends.index.tolist(), pd.to_datetime([0, 86400], unit="s").tolist())
+        self.assertEqual(splits["Stock Splits"].tolist(), [1.5])
+        self.assertTrue(capital_gains.empty)
+        self.assertEqual(capital_gains.columns.tolist(), ["Capital Gains"])
+
+
+class TestSafeMergeDfs(unittest.TestCase):
+    def _prices(self, index):
+        close = np.arange(1.0, len(index) + 1)
+        return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close,
+                             "Adj Close": close, "Volume": np.ones(len(index), dtype=np.int64)}, index=index)
+
+    def test_daily(self):
+        prices = self._prices(pd.date_range("2024-01-02", periods=5, freq="B", tz="UTC"))
+        divs = pd.DataFrame({"Dividends": [0.1, 0.2, 0.3]},
+                            index=pd.to_datetime(["2023-12-29", "2024-01-03", "2024-01-12"]).tz_localize("UTC"))
+        df = safe_merge_dfs(prices, divs, "1d")
+        # Out-of-range dividends get a new row of NaN prices
+        self.assertEqual(len(df), 7)
+        self.assertEqual(df["Dividends"].dropna().tolist(), [0.1, 0.2, 0.3])
+        self.assertTrue(np.isnan(df.loc[pd.Timestamp("2023-12-29", tz="UTC"), "Close"]))
+        self.assertEqual(df.loc[pd.Timestamp("2024-01-12", tz="UTC"), "Volume"], 0)
+
+    def test_weekly_aggregates(self):
+        prices = self._prices(pd.date_range("2024-01-01", periods=4, freq="W-MON", tz="UTC"))
+        splits = pd.DataFrame({"Stock Splits": [2.0, 3.0]},
+                              index=pd.to_datetime(["2024-01-09", "2024-01-11"]).tz_localize("UTC"))
+        df = safe_merge_dfs(prices, splits, "1wk")
+        self.assertEqual(df["Stock Splits"].dropna().tolist(), [6.0])
+        self.assertEqual(df["Stock Splits"].dropna().index[0], pd.Timestamp("2024-01-08", tz="UTC"))
+
+    def test_intraday(self):
+        index = pd.date_range("2024-01-02 14:30", periods=3, freq="30min", tz="UTC").append(
+            pd.date_range("2024-01-03 14:30", periods=3, freq="30min", tz="UTC"))
+        divs = pd.DataFrame({"Dividends": [0.1, 0.2]},
+                            index=pd.to_datetime(["2023-06-01", "2024-01-03"]).tz_localize("UTC"))
+        df = safe_merge_dfs(self._prices(index), divs, "30m")
+        # Out-of-range dropped, in-range mapped to first bar of its day
+        self.assertEqual(len(df), 6)
+        self.assertEqual(df["Dividends"].dropna().tolist(), [0.2])
+        self.assertEqual(df["Dividends"].dropna().index[0], pd.Timestamp("2024-01-03 14:30", tz="UTC"))
+
+
 if __name__ == "__main__":
     unittest.main()
 
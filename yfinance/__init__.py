@@ -20,23 +20,23 @@
 #
 
 from . import version
-from .search import Search
-from .lookup import Lookup
+from .search import Search, AsyncSearch
+from .lookup import Lookup, AsyncLookup
 from .ticker import Ticker
-from .calendars import Calendars
+from .calendars import Calendars, AsyncCalendars
 from .tickers import Tickers
-from .multi import download
+from .multi import download, download_async, download_iter
 from .live import WebSocket, AsyncWebSocket
 from .utils import enable_debug_mode
 from .cache import set_tz_cache_location
 from .domain.sector import Sector
 from .domain.industry import Industry
 from .domain.market import Market
-from .data import YfData
+from .data import YfData, AsyncYfData
 from .config import YfConfig as config
 
 from .screener.query import EquityQuery, FundQuery
-from .screener.screener import screen, PREDEFINED_SCREENER_QUERIES
+from .screener.screener import screen, screen_async, PREDEFINED_SCREENER_QUERIES
 
 __version__ = version.version
 __author__ = "Ran Aroussi"
@@ -44,9 +44,11 @@ __author__ = "Ran Aroussi"
 import warnings
 warnings.filterwarnings('default', category=DeprecationWarning, module='^yfinance')
 
-__all__ = ['download', 'Market', 'Search', 'Lookup', 'Ticker', 'Tickers', 'enable_debug_mode', 'set_tz_cache_location', 'Sector', 'Industry', 'WebSocket', 'AsyncWebSocket', 'Calendars', 'config']
+__all__ = ['download', 'download_iter', 'Market', 'Search', 'Lookup', 'Ticker', 'Tickers', 'enable_debug_mode', 'set_tz_cache_location', 'Sector', 'Industry', 'WebSocket', 'AsyncWebSocket', 'Calendars', 'config']
+# asyncio stuff:
+__all__ += ['AsyncSearch', 'AsyncLookup', 'AsyncCalendars', 'AsyncYfData', 'download_async']
 # screener stuff:
-__all__ += ['EquityQuery', 'FundQuery', 'screen', 'PREDEFINED_SCREENER_QUERIES']
+__all__ += ['EquityQuery', 'FundQuery', 'screen', 'screen_async', 'PREDEFINED_SCREENER_QUERIES']
 
 # Config stuff:
 _NOTSET=object()
@@ -21,6 +21,7 @@
 
 from __future__ import print_function
 
+import asyncio
 import json as _json
 import warnings
 import threading
@@ -34,9 +35,9 @@ from pydantic import ValidationError
 
 
 from . import utils, cache
-from .chart import ChartResponse
+from .chart import ChartResponse, chart_meta
 from .const import _BASE_URL_, _ROOT_URL_, _QUERY1_URL_, _SENTINEL_, _MIC_TO_YAHOO_SUFFIX
-from .data import YfData
+from .data import YfData, AsyncYfData
 from .config import YfConfig
 from .exceptions import YFDataException, YFEarningsDateMissing, YFRateLimitError
 from .live import WebSocket
@@ -84,7 +85,7 @@ class TickerBase:
                 ticker = base_symbol
 
         self.ticker = ticker.upper()
-        self.session = session or requests.Session(impersonate="chrome")
+        self.session = session
         self._tz = None
 
         self._isin = None
@@ -134,6 +135,22 @@ class TickerBase:
     def history(self, *args, **kwargs) -> pd.DataFrame:
         return self._lazy_load_price_history().history(*args, **kwargs)
 
+    def history_update(self, df, *args, **kwargs) -> pd.DataFrame:
+        """
+        Extend a previous history() result with only the missing recent prices.
+        """
+        return self._lazy_load_price_history().history_update(df, *args, **kwargs)
+
+    async def history_async(self, *args, **kwargs) -> pd.DataFrame:
+        """
+        Awaitable version of history(), for use inside an asyncio event loop.
+        """
+        if self._price_history is None:
+            tz = await self._get_ticker_tz_async(timeout=10)
+            if self._price_history is None:
+                self._price_history = PriceHistory(self._data, self.ticker, tz)
+        return await self._price_history.history_async(*args, **kwargs)
+
     # ------------------------
 
     def _lazy_load_price_history(self):
@@ -141,6 +158,41 @@ class TickerBase:
             self._price_history = PriceHistory(self._data, self.ticker, self._get_ticker_tz(timeout=10))
         return self._price_history
 
+    async def _get_ticker_tz_async(self, timeout):
+        if self._tz is not None:
+            return self._tz
+        c = cache.get_tz_cache()
+        tz = c.lookup(self.ticker)
+        if tz and utils.is_valid_timezone(tz):
+            self._tz = tz
+            return tz
+
+        tz = await self._fetch_ticker_tz_async(timeout)
+        if utils.is_valid_timezone(tz):
+            c.store(self.ticker, tz)
+            self._tz = tz
+            return tz
+
+        # Rare failure, let sync path handle fallback to info
+        return await asyncio.to_thread(self._get_ticker_tz, timeout)
+
+    async def _fetch_ticker_tz_async(self, timeout):
+        logger = utils.get_yf_logger()
+        params = {"range": "1d", "interval": "1d"}
+        url = f"{_BASE_URL_}/v8/finance/chart/{self.ticker}"
+        try:
+            response = await AsyncYfData().get(url=url, params=params, timeout=timeout)
+            data = utils.response_json(response)
+        except YFRateLimitError:
+            # Must propagate this
+            raise
+        except Exception as err:
+            if not YfConfig.debug.hide_exceptions:
+                raise
+            logger.error(f"Failed to get ticker '{self.ticker}' reason: {err}")
+            return None
+        return self._tz_from_chart(data)
+
     def _get_ticker_tz(self, timeout):
         if self._tz is not None:
             return self._tz
@@ -186,11 +238,30 @@ class TickerBase:
 
         try:
             response = self._data.cache_get(url=url, params=params, timeout=timeout)
-            data = response.json()
-            chart = ChartResponse.model_validate(data)
+            data = utils.response_json(response)
         except YFRateLimitError:
             # Must propagate this
             raise
+        except (requests.exceptions.RequestException, ValueError) as err:
+            if not YfConfig.debug.hide_exceptions:
+                raise
+            logger.error(f"Failed to get ticker '{self.ticker}' reason: {err}")
+            return None
+        except Exception as err:
+            if not YfConfig.debug.hide_exceptions:
+                raise
+            logger.error(f"Failed to get ticker '{self.ticker}' reason: {err}")
+            return None
+        return self._tz_from_chart(data)
+
+    def _tz_from_chart(self, data):
+        if not YfConfig.debug.validate_chart:
+            return self._tz_from_chart_meta(data)
+
+        logger = utils.get_yf_logger()
+
+        try:
+            chart = ChartResponse.model_validate(data)
         except ValidationError as err:
             logger.error(
                 f"Could not validate chart response for ticker '{self.ticker}' reason: {err}"
@@ -200,43 +271,65 @@ class TickerBase:
             logger.debug(f" {data}")
             logger.debug("-------------")
             return None
-        except (requests.exceptions.RequestException, ValueError) as err:
-            if not YfConfig.debug.hide_exceptions:
-                raise
-            logger.error(f"Failed to get ticker '{self.ticker}' reason: {err}")
-            return None
         except Exception as err:
             if not YfConfig.debug.hide_exceptions:
                 raise
             logger.error(f"Failed to get ticker '{self.ticker}' reason: {err}")
             return None
+
+        error = chart.chart.error
+        if error:
+            # explicit error from yahoo API
+            logger.debug(
+                f"Got error from yahoo api for ticker {self.ticker}, Error: {error}"
+            )
         else:
-            error = chart.chart.error
-            if error:
-                # explicit error from yahoo API
-                logger.debug(
-                    f"Got error from yahoo api for ticker {self.ticker}, Error: {error}"
-                )
-            else:
-                try:
-                    return chart.chart.result[0].meta.exchangeTimezoneName
-                except (IndexError, AttributeError) as err:
-                    if not YfConfig.debug.hide_exceptions:
-                        raise
-                    logger.error(
-                        f"Could not get exchangeTimezoneName for ticker '{self.ticker}' reason: {err}"
-                    )
-                    logger.debug("Got response: ")
-                    logger.debug("-------------")
-                    logger.debug(f" {data}")
-                    logger.debug("-------------")
-                except Exception:
-                    logger.exception(
-                        f"Unexpected error extracting timezone for ticker '{self.ticker}'"
-                    )
+            try:
+                return chart.chart.result[0].meta.exchangeTimezoneName
+            except (IndexError, AttributeError) as err:
+                if not YfConfig.debug.hide_exceptions:
                     raise
+                logger.error(
+                    f"Could not get exchangeTimezoneName for ticker '{self.ticker}' reason: {err}"
+                )
+                logger.debug("Got response: ")
+                logger.debug("-------------")
+                logger.debug(f" {data}")
+                logger.debug("-------------")
+            except Exception:
+                logger.exception(
+                    f"Unexpected error extracting timezone for ticker '{self.ticker}'"
+                )
+                raise
         return None
 
+    def _tz_from_chart_meta(self, data):
+        # Read timezone from chart meta, without validating the price arrays
+        logger = utils.get_yf_logger()
+
+        try:
+            error = data["chart"].get("error")
+        except (KeyError, TypeError, AttributeError):
+            error = None
+        if error:
+            # explicit error from yahoo API
+            logger.debug(
+                f"Got error from yahoo api for ticker {self.ticker}, Error: {error}"
+            )
+            return None
+
+        try:
+            return chart_meta(data).get("exchangeTimezoneName")
+        except ValueError as err:
+            logger.error(
+                f"Could not read chart response for ticker '{self.ticker}' reason: {err}"
+            )
+            logger.debug("Got response: ")
+            logger.debug("-------------")
+            logger.debug(f" {data}")
+            logger.debug("-------------")
+            return None
+
     def get_recommendations(self, as_dict=False):
         """
         Returns a DataFrame with the recommendations
@@ -530,7 +623,7 @@ class TickerBase:
         shares_url = f"{ts_url_base}&period1={int(start.timestamp())}&period2={int(end.timestamp())}"
         try:
             json_data = self._data.cache_get(url=shares_url)
-            json_data = json_data.json()
+            json_data = utils.response_json(json_data)
         except (_json.JSONDecodeError, requests.exceptions.RequestException):
             if not YfConfig.debug.hide_exceptions:
                 raise
@@ -627,7 +720,7 @@ class TickerBase:
         if data is None or "Will be right back" in data.text:
             raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
         try:
-            data = data.json()
+            data = utils.response_json(data)
         except _json.JSONDecodeError:
             if not YfConfig.debug.hide_exceptions:
                 raise
@@ -774,7 +867,7 @@ class TickerBase:
             "includeFields": ["startdatetime", "timeZoneShortName", "epsestimate", "epsactual", "epssurprisepct", "eventtype"]
         }
         response = self._data.post(url, params=params, body=body)
-        json_data = response.json()
+        json_data = utils.response_json(response)
 
         # Extract data
         columns = [row['label'] for row in json_data['finance']['result'][0]['documents'][0]['columns']]
@@ -1,4 +1,5 @@
 import peewee as _peewee
+from collections import OrderedDict as _OrderedDict
 from threading import Lock, Thread
 import os as _os
 import platformdirs as _ad
@@ -11,6 +12,7 @@ from .utils import get_yf_logger
 
 _cache_init_lock = Lock()
 _MAX_AGE = _dt.timedelta(days=30)
+_BULK_CHUNK = 300  # rows per query in bulk reads/writes
 
 
 
@@ -31,6 +33,12 @@ class _TzCacheDummy:
     def store(self, tkr, tz):
         pass
 
+    def lookup_many(self, tkrs):
+        return {}
+
+    def store_many(self, tzs):
+        pass
+
     @property
     def tz_db(self):
         return None
@@ -249,6 +257,63 @@ class _TzCache:
                     return
                 _time.sleep(0.1)
 
+    def lookup_many(self, keys):
+        # Like lookup() for many keys, in one query per chunk. Returns dict of keys found
+        if self.dummy:
+            return {}
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return {}
+
+        keys = list(keys)
+        cutoff = _dt.datetime.now() - _MAX_AGE
+        values = {}
+        try:
+            # Stay below SQLite's limit on query parameters
+            for i in range(0, len(keys), _BULK_CHUNK):
+                query = _TZ_KV.select().where(_TZ_KV.key.in_(keys[i:i + _BULK_CHUNK]), _TZ_KV.updated_at >= cutoff)
+                for row in query:
+                    if row.value is not None:
+                        values[row.key] = row.value
+        except _peewee.OperationalError as err:
+            get_yf_logger().info(f"Failed to read TzCache for {len(keys)} keys: {err}")
+        return values
+
+    def store_many(self, values):
+        # Like store() for dict of key -> value, in one transaction
+        if self.dummy or not values:
+            return
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return
+
+        db = self.get_db()
+        if db is None:
+            return
+
+        now = _dt.datetime.now()
+        rows = [{'key': k, 'value': v, 'updated_at': now} for k, v in values.items()]
+        for attempt in range(3):
+            try:
+                with db.atomic():
+                    for i in range(0, len(rows), _BULK_CHUNK):
+                        _TZ_KV.insert_many(rows[i:i + _BULK_CHUNK]).on_conflict_replace().execute()
+                return
+            except _peewee.OperationalError as err:
+                if "database is locked" not in str(err).lower() or attempt == 2:
+                    get_yf_logger().info(
+                        f"Failed to store TzCache for {len(rows)} keys: {err}. "
+                        "TzCache will continue without storing."
+                    )
+                    return
+                _time.sleep(0.1)
+
     def _start_cleanup(self):
         if self._cleanup_started:
             return
@@ -496,6 +561,12 @@ class _ISINCacheDummy:
     def store(self, isin, tkr):
         pass
 
+    def lookup_many(self, isins):
+        return {}
+
+    def store_many(self, tkrs):
+        pass
+
     @property
     def tz_db(self):
         return None
@@ -675,11 +746,745 @@ class _ISINCache:
                     q = _ISIN_KV.update(value=value, created_at=_dt.datetime.now()).where(_ISIN_KV.key == key)
                     q.execute()
 
+    def lookup_many(self, keys):
+        # Like lookup() for many keys, in one query per chunk. Returns dict of keys found
+        if self.dummy:
+            return {}
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return {}
+
+        keys = list(keys)
+        values = {}
+        try:
+            for i in range(0, len(keys), _BULK_CHUNK):
+                for row in _ISIN_KV.select().where(_ISIN_KV.key.in_(keys[i:i + _BULK_CHUNK])):
+                    if row.value:
+                        values[row.key] = row.value
+        except _peewee.OperationalError as err:
+            get_yf_logger().info(f"Failed to read ISINCache for {len(keys)} keys: {err}")
+        return values
+
+    def store_many(self, values):
+        # Like store() for dict of key -> value, in one transaction
+        if self.dummy or not values:
+            return
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return
+
+        db = self.get_db()
+        if db is None:
+            return
+
+        now = _dt.datetime.now()
+        one_week_ago = now - _dt.timedelta(weeks=1)
+        rows = [{'key': k, 'value': v, 'created_at': now} for k, v in values.items()]
+        tkrs = list(set(values.values()))
+        try:
+            with db.atomic():
+                # Remove existing rows with same value that are older than 1 week
+                for i in range(0, len(tkrs), _BULK_CHUNK):
+                    _ISIN_KV.delete().where(_ISIN_KV.value.in_(tkrs[i:i + _BULK_CHUNK]) &
+                                            (_ISIN_KV.created_at < one_week_ago)).execute()
+                for i in range(0, len(rows), _BULK_CHUNK):
+                    _ISIN_KV.insert_many(rows[i:i + _BULK_CHUNK]).on_conflict_replace().execute()
+        except _peewee.OperationalError as err:
+            get_yf_logger().info(f"Failed to store ISINCache for {len(rows)} keys: {err}")
+
 
 def get_isin_cache():
     return _ISINCacheManager.get_isin_cache()
 
 
+# --------------
+# Response cache
+# --------------
+
+class _ResponseCacheException(Exception):
+    pass
+
+
+class _ResponseCacheDummy:
+    """Dummy cache to use if response cache is disabled"""
+
+    def lookup(self, key):
+        return None
+
+    def store(self, key, url, status_code, content, ttl, max_bytes=None):
+        pass
+
+    def clear(self):
+        pass
+
+    @property
+    def response_db(self):
+        return None
+
+
+class _ResponseCacheManager:
+    _response_cache = None
+
+    @classmethod
+    def get_response_cache(cls):
+        if cls._response_cache is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._response_cache
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        cls._response_cache = _ResponseCache()
+
+
+class _ResponseDBManager:
+    _db = None
+    _cache_dir = _os.path.join(_ad.user_cache_dir(), "py-yfinance")
+
+    @classmethod
+    def get_database(cls):
+        if cls._db is None:
+            cls._initialise()
+        return cls._db
+
+    @classmethod
+    def close_db(cls):
+        if cls._db is not None:
+            try:
+                cls._db.close()
+            except Exception:
+                # Must discard exceptions because Python trying to quit.
+                pass
+
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        if cache_dir is not None:
+            cls._cache_dir = cache_dir
+
+        if not _os.path.isdir(cls._cache_dir):
+            try:
+                _os.makedirs(cls._cache_dir)
+            except OSError as err:
+                raise _ResponseCacheException(f"Error creating ResponseCache folder: '{cls._cache_dir}' reason: {err}")
+        elif not (_os.access(cls._cache_dir, _os.R_OK) and _os.access(cls._cache_dir, _os.W_OK)):
+            raise _ResponseCacheException(f"Cannot read and write in ResponseCache folder: '{cls._cache_dir}'")
+
+        cls._db = _peewee.SqliteDatabase(
+            _os.path.join(cls._cache_dir, 'responses.db'),
+            pragmas={
+                "journal_mode": "wal",
+                "cache_size": -64,
+                "busy_timeout": 5000,
+            },
+            timeout=5,
+        )
+
+    @classmethod
+    def set_location(cls, new_cache_dir):
+        if cls._db is not None:
+            cls._db.close()
+            cls._db = None
+        cls._cache_dir = new_cache_dir
+
+    @classmethod
+    def get_location(cls):
+        return cls._cache_dir
+
+# close DB when Python exists
+_atexit.register(_ResponseDBManager.close_db)
+
+
+response_db_proxy = _peewee.Proxy()
+class _ResponseSchema(_peewee.Model):
+    key = _peewee.CharField(primary_key=True)
+    url = _peewee.TextField()
+    status_code = _peewee.IntegerField()
+    content = _peewee.BlobField()
+    size = _peewee.IntegerField()
+    # Unix timestamps. expires_at = NULL means never expires
+    expires_at = _peewee.FloatField(null=True)
+    last_access = _peewee.FloatField(index=True)
+
+    class Meta:
+        database = response_db_proxy
+        without_rowid = True
+
+
+class _ResponseCache:
+    """
+    Raw HTTP response bodies keyed on request, with expiry and
+    least-recently-used eviction once total size exceeds a byte budget.
+    """
+
+    def __init__(self):
+        self.initialised = -1
+        self.db = None
+        self.dummy = False
+        self._size_lock = Lock()
+        self._total_bytes = 0
+
+    def get_db(self):
+        if self.db is not None:
+            return self.db
+
+        try:
+            self.db = _ResponseDBManager.get_database()
+        except _ResponseCacheException as err:
+            get_yf_logger().info(f"Failed to create ResponseCache, reason: {err}. "
+                                 "ResponseCache will not be used. "
+                                 "Tip: You can direct cache to use a different location with 'set_tz_cache_location(mylocation)'")
+            self.dummy = True
+            return None
+        return self.db
+
+    def initialise(self):
+        if self.initialised != -1:
+            return
+
+        db = self.get_db()
+        if db is None:
+            self.initialised = 0  # failure
+            return
+
+        try:
+            db.connect(reuse_if_open=True)
+        except _peewee.OperationalError as e:
+            get_yf_logger().info(
+                f"Failed to open ResponseCache DB, reason: {e}. "
+                "ResponseCache will not be used. "
+                "Tip: You can direct cache to use a different location with 'set_tz_cache_location(mylocation)'"
+            )
+            self.dummy = True
+            self.initialised = 0
+            return
+
+        response_db_proxy.initialize(db)
+        try:
+            db.create_tables([_ResponseSchema])
+        except _peewee.OperationalError as e:
+            if 'WITHOUT' in str(e):
+                _ResponseSchema._meta.without_rowid = False
+                db.create_tables([_ResponseSchema])
+            else:
+                raise
+        self._total_bytes = _ResponseSchema.select(_peewee.fn.COALESCE(_peewee.fn.SUM(_ResponseSchema.size), 0)).scalar()
+        self.initialised = 1  # success
+
+    def lookup(self, key):
+        """
+        Return dict with 'url', 'status_code' & 'content' if an unexpired entry exists, else None.
+        """
+        if self.dummy:
+            return None
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return None
+
+        now = _time.time()
+        try:
+            row = _ResponseSchema.get(_ResponseSchema.key == key)
+        except _ResponseSchema.DoesNotExist:
+            return None
+        except _peewee.OperationalError as err:
+            get_yf_logger().debug(f"ResponseCache lookup failed for key {key}: {err}")
+            return None
+
+        try:
+            if row.expires_at is not None and row.expires_at <= now:
+                _ResponseSchema.delete().where(_ResponseSchema.key == key).execute()
+                with self._size_lock:
+                    self._total_bytes -= row.size
+                return None
+            _ResponseSchema.update(last_access=now).where(_ResponseSchema.key == key).execute()
+        except _peewee.OperationalError:
+            # Not critical, another process may be writing
+            pass
+
+        return {'url': row.url, 'status_code': row.status_code, 'content': bytes(row.content)}
+
+    def store(self, key, url, status_code, content, ttl, max_bytes=None):
+        """
+        :param ttl: seconds until entry expires, None = never
+        :param max_bytes: evict least-recently-used entries to keep total size under this
+        """
+        if self.dummy:
+            return
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return
+
+        db = self.get_db()
+        if db is None:
+            return
+
+        now = _time.time()
+        size = len(content)
+        if max_bytes is not None and size > max_bytes:
+            return
+        expires_at = None if ttl is None else now + ttl
+
+        for attempt in range(3):
+            try:
+                with db.atomic():
+                    old = _ResponseSchema.select(_ResponseSchema.size).where(_ResponseSchema.key == key).first()
+                    _ResponseSchema.insert(
+                        key=key, url=url, status_code=status_code, content=content,
+                        size=size, expires_at=expires_at, last_access=now,
+                    ).on_conflict_replace().execute()
+                with self._size_lock:
+                    self._total_bytes += size - (old.size if old is not None else 0)
+                break
+            except _peewee.OperationalError as err:
+                if "database is locked" not in str(err).lower() or attempt == 2:
+                    get_yf_logger().info(
+                        f"Failed to store ResponseCache for key {key}: {err}. "
+                        "ResponseCache will continue without storing."
+                    )
+                    return
+                _time.sleep(0.1)
+
+        if max_bytes is not None and self._total_bytes > max_bytes:
+            self._evict(max_bytes)
+
+    def _evict(self, max_bytes):
+        # Free down to 90% of budget, so not evicting on every store
+        target = int(max_bytes * 0.9)
+        db = self.get_db()
+        try:
+            with db.atomic():
+                now = _time.time()
+                _ResponseSchema.delete().where(_ResponseSchema.expires_at <= now).execute()
+                total = _ResponseSchema.select(_peewee.fn.COALESCE(_peewee.fn.SUM(_ResponseSchema.size), 0)).scalar()
+                if total > target:
+                    evict_keys = []
+                    query = _ResponseSchema.select(_ResponseSchema.key, _ResponseSchema.size).order_by(_ResponseSchema.last_access)
+                    for row in query:
+                        if total <= target:
+                            break
+                        evict_keys.append(row.key)
+                        total -= row.size
+                    for i in range(0, len(evict_keys), 500):
+                        _ResponseSchema.delete().where(_ResponseSchema.key.in_(evict_keys[i:i+500])).execute()
+            with self._size_lock:
+                self._total_bytes = total
+        except _peewee.OperationalError as err:
+            get_yf_logger().debug(f"ResponseCache eviction failed: {err}")
+
+    def clear(self):
+        if self.dummy:
+            return
+
+        if self.initialised == -1:
+            self.initialise()
+
+        if self.initialised == 0:  # failure
+            return
+
+        _ResponseSchema.delete().execute()
+        with self._size_lock:
+            self._total_bytes = 0
+
+
+def get_response_cache():
+    return _ResponseCacheManager.get_response_cache()
+
+
+# --------------
+# Price store
+# --------------
+
+class _PriceStoreException(Exception):
+    pass
+
+
+class _PriceStoreDummy:
+    """Dummy store to use if price store is disabled"""
+
+    def lookup(self, key):
+        return None
+
+    def read(self, key, start, end):
+        return []
+
+    def store(self, key, rows, start, end, price_hint, capital_gains):
+        pass
+
+    def rebase(self, key, before, split_ratio, div_ratio):
+        pass
+
+    def delete(self, key):
+        pass
+
+    @property
+    def price_db(self):
+        return None
+
+
+class _PriceStoreManager:
+    _price_store = None
+
+    @classmethod
+    def get_price_store(cls):
+        if cls._price_store is None:
+            with _cache_init_lock:
+                cls._initialise()
+        return cls._price_store
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        cls._price_store = _PriceStore()
+
+
+class _PriceDBManager:
+    _db = None
+    _cache_dir = _os.path.join(_ad.user_cache_dir(), "py-yfinance")
+
+    @classmethod
+    def get_database(cls):
+        if cls._db is None:
+            cls._initialise()
+        return cls._db
+
+    @classmethod
+    def close_db(cls):
+        if cls._db is not None:
+            try:
+                cls._db.close()
+            except Exception:
+                # Must discard exceptions because Python trying to quit.
+                pass
+
+
+    @classmethod
+    def _initialise(cls, cache_dir=None):
+        if cache_dir is not None:
+            cls._cache_dir = cache_dir
+
+        if not _os.path.isdir(cls._cache_dir):
+            try:
+                _os.makedirs(cls._cache_dir)
+            except OSError as err:
+                raise _PriceStoreException(f"Error creating PriceStore folder: '{cls._cache_dir}' reason: {err}")
+        elif not (_os.access(cls._cache_dir, _os.R_OK) and _os.access(cls._cache_dir, _os.W_OK)):
+            raise _PriceStoreException(f"Cannot read and write in PriceStore folder: '{cls._cache_dir}'")
+
+        cls._db = _peewee.SqliteDatabase(
+            _os.path.join(cls._cache_dir, 'prices.db'),
+            pragmas={
+                "journal_mode": "wal",
+                "cache_size": -64,
+                "busy_timeout": 5000,
+            },
+            timeout=5,
+        )
+
+    @classmethod
+    def set_location(cls, new_cache_dir):
+        if cls._db is not None:
+            cls._db.close()
+            cls._db = None
+        cls._cache_dir = new_cache_dir
+
+    @classmethod
+    def get_location(cls):
+        return cls._cache_dir
+
+# close DB when Python exists
+_atexit.register(_PriceDBManager.close_db)
+
+
+price_db_proxy = _peewee.Proxy()
+class _PriceSeries(_peewee.Model):
+    # One per ticker+interval+options. Bars in [start, end) are stored,
+    # unadjusted, as of the latest dividends & splits.
+    key = _peewee.CharField(primary_key=True)
+    start = _peewee.IntegerField()
+    end = _peewee.IntegerField()
+    price_hint = _peewee.IntegerField()
+    capital_gains = _peewee.BooleanField()
+
+    class Meta:
+        database = price_db_proxy
+        without_rowid = True
+
+
+class _PriceBar(_peewee.Model):
+    series = _peewee.CharField()
+    ts = _peewee.IntegerField()  # Unix timestamp
+    open = _peewee.FloatField(null=True)
+    high = _peewee.FloatField(null=True)
+    low = _peewee.FloatField(null=True)
+    close = _peewee.FloatField(null=True)
+    adjclose = _peewee.FloatField(null=True)
+    volume = _peewee.IntegerField(null=True)
+    dividends = _peewee.FloatField(null=True)
+    splits = _peewee.FloatField(null=True)
+    capital_gains = _peewee.FloatField(null=True)
+    repaired = _peewee.BooleanField(null=True)
+
+    class Meta:
+        database = price_db_proxy
+        primary_key = _peewee.CompositeKey('series', 'ts')
+        without_rowid = True
+
+
+_BAR_FIELDS = [_PriceBar.ts, _PriceBar.open, _PriceBar.high, _PriceBar.low, _PriceBar.close,
+               _PriceBar.adjclose, _PriceBar.volume, _PriceBar.dividends, _PriceBar.splits,
+               _PriceBar.capital_gains, _PriceBar.repaired]
+# Keep each insert under SQLite's 999 variables limit
+_BAR_CHUNK = 999 // (len(_BAR_FIELDS) + 1)
+
+
+class _PriceStore:
+    """
+    Persistent OHLCV bars, so repeat history requests only fetch
+    the date ranges not already stored.
+    """
+
+    def __init__(self):
+        self.initialised = -1
+        self.db = None
+        self.dummy = False
+        self._write_lock = Lock()
+
+    def get_db(self):
+        if self.db is not None:
+            return self.db
+
+        try:
+            self.db = _PriceDBManager.get_database()
+        except _PriceStoreException as err:
+            get_yf_logger().info(f"Failed to create PriceStore, reason: {err}. "
+                                 "PriceStore will not be used. "
+                                 "Tip: You can direct cache to use a different location with 'set_tz_cache_location(mylocation)'")
+            self.dummy = True
+            return None
+        return self.db
+
+    def initialise(self):
+        if self.initialised != -1:
+            return
+
+        db = self.get_db()
+        if db is None:
+            self.initialised = 0  # failure
+            return
+
+        try:
+            db.connect(reuse_if_open=True)
+        except _peewee.OperationalError as e:
+            get_yf_logger().info(
+                f"Failed to open PriceStore DB, reason: {e}. "
+                "PriceStore will not be used. "
+                "Tip: You can direct cache to use a different location with 'set_tz_cache_location(mylocation)'"
+            )
+            self.dummy = True
+            self.initialised = 0
+            return
+
+        price_db_proxy.initialize(db)
+        try:
+            db.create_tables([_PriceSeries, _PriceBar])
+        except _peewee.OperationalError as e:
+            if 'WITHOUT' in str(e):
+                _PriceSeries._meta.without_rowid = False
+                _PriceBar._meta.without_rowid = False
+                db.create_tables([_PriceSeries, _PriceBar])
+            else:
+                raise
+        self.initialised = 1  # success
+
+    def _ready(self):
+        if self.dummy:
+            return False
+        if self.initialised == -1:
+            self.initialise()
+        return self.initialised == 1
+
+    def lookup(self, key):
+        """
+        Return dict describing the stored range: 'start' & 'end' covered,
+        'first' & 'last' bar timestamps (None if no bars), 'price_hint' &
+        'capital_gains'. None if nothing stored.
+        """
+        if not self._ready():
+            return None
+
+        try:
+            series = _PriceSeries.get(_PriceSeries.key == key)
+            first, last = (_PriceBar.select(_peewee.fn.MIN(_PriceBar.ts), _peewee.fn.MAX(_PriceBar.ts))
+                           .where(_PriceBar.series == key).tuples().get())
+        except _PriceSeries.DoesNotExist:
+            return None
+        except _peewee.OperationalError as err:
+            get_yf_logger().debug(f"PriceStore lookup failed for {key}: {err}")
+            return None
+        return {'start': series.start, 'end': series.end, 'first': first, 'last': last,
+                'price_hint': series.price_hint, 'capital_gains': series.capital_gains}
+
+    def read(self, key, start, end):
+        """
+        Return stored bars in [start, end) as tuples ordered by timestamp:
+        (ts, open, high, low, close, adjclose, volume, dividends, splits, capital_gains, repaired)
+        """
+        if not self._ready():
+            return []
+
+        try:
+            return list(_PriceBar.select(*_BAR_FIELDS)
+                        .where((_PriceBar.series == key) & (_PriceBar.ts >= start) & (_PriceBar.ts < end))
+                        .order_by(_PriceBar.ts).tuples())
+        except _peewee.OperationalError as err:
+            get_yf_logger().debug(f"PriceStore read failed for {key}: {err}")
+            return []
+
+    def store(self, key, rows, start, end, price_hint, capital_gains):
+        """
+        Insert/replace bars and set the covered range to [start, end).
+        :param rows: tuples ordered as read() returns
+        """
+        if not self._ready():
+            return
+
+        columns = [f.name for f in _BAR_FIELDS]
+        data = [dict(zip(columns, row), series=key) for row in rows]
+        self._write(key, "store", lambda: self._store(key, data, start, end, price_hint, capital_gains))
+
+    def _store(self, key, data, start, end, price_hint, capital_gains):
+        for i in range(0, len(data), _BAR_CHUNK):
+            _PriceBar.insert_many(data[i:i + _BAR_CHUNK]).on_conflict_replace().execute()
+        _PriceSeries.insert(key=key, start=start, end=end, price_hint=price_hint,
+                            capital_gains=capital_gains).on_conflict_replace().execute()
+
+    def rebase(self, key, before, split_ratio, div_ratio):
+        """
+        Re-adjust bars before timestamp 'before' for newer splits & dividends,
+        like Yahoo does: prices / split_ratio, Adj Close also * div_ratio.
+        """
+        if not self._ready():
+            return
+
+        def _rebase():
+            _PriceBar.update(
+                open=_PriceBar.open / split_ratio,
+                high=_PriceBar.high / split_ratio,
+                low=_PriceBar.low / split_ratio,
+                close=_PriceBar.close / split_ratio,
+                adjclose=_PriceBar.adjclose * (div_ratio / split_ratio),
+                volume=_peewee.fn.ROUND(_PriceBar.volume * split_ratio),
+                dividends=_PriceBar.dividends / split_ratio,
+            ).where((_PriceBar.series == key) & (_PriceBar.ts < before)).execute()
+        self._write(key, "rebase", _rebase)
+
+    def delete(self, key):
+        if not self._ready():
+            return
+
+        def _delete():
+            _PriceBar.delete().where(_PriceBar.series == key).execute()
+            _PriceSeries.delete().where(_PriceSeries.key == key).execute()
+        self._write(key, "delete", _delete)
+
+    def _write(self, key, action, fn):
+        db = self.get_db()
+        for attempt in range(3):
+            try:
+                with self._write_lock, db.atomic():
+                    fn()
+                return
+            except _peewee.OperationalError as err:
+                if "database is locked" not in str(err).lower() or attempt == 2:
+                    get_yf_logger().info(
+                        f"Failed to {action} PriceStore for {key}: {err}. "
+                        "PriceStore will continue without storing."
+                    )
+                    return
+                _time.sleep(0.1)
+
+
+def get_price_store():
+    return _PriceStoreManager.get_price_store()
+
+
+# --------------
+# History cache
+# --------------
+
+class _HistoryCache:
+    """
+    Process-wide history() results in memory, with expiry and
+    least-recently-used eviction once total size exceeds a byte budget.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # key -> (df, metadata, size, expires_at)
+        self._entries = _OrderedDict()
+        self._total_bytes = 0
+
+    def lookup(self, key):
+        """
+        Return (DataFrame, metadata) copies if an unexpired entry exists, else None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            df, metadata, size, expires_at = entry
+            if expires_at is not None and expires_at <= _time.monotonic():
+                del self._entries[key]
+                self._total_bytes -= size
+                return None
+            self._entries.move_to_end(key)
+        return df.copy(), dict(metadata)
+
+    def store(self, key, df, metadata, ttl, max_bytes=None):
+        """
+        :param ttl: seconds until entry expires, None = never
+        :param max_bytes: evict least-recently-used entries to keep total size under this
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if max_bytes is not None and size > max_bytes:
+            return
+        expires_at = None if ttl is None else _time.monotonic() + ttl
+        entry = (df.copy(), dict(metadata or {}), size, expires_at)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[2]
+            self._entries[key] = entry
+            self._total_bytes += size
+            if max_bytes is not None:
+                while self._total_bytes > max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._total_bytes -= evicted[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+_history_cache = _HistoryCache()
+
+
+def get_history_cache():
+    return _history_cache
+
+
 # --------------
 # Utils
 # --------------
@@ -695,14 +1500,20 @@ def set_cache_location(cache_dir: str):
     _TzDBManager.close_db()
     _CookieDBManager.close_db()
     _ISINDBManager.close_db()
+    _ResponseDBManager.close_db()
+    _PriceDBManager.close_db()
 
     _TzCacheManager._tz_cache = None
     _CookieCacheManager._Cookie_cache = None
     _ISINCacheManager._isin_cache = None
+    _ResponseCacheManager._response_cache = None
+    _PriceStoreManager._price_store = None
 
     _TzDBManager.set_location(cache_dir)
     _CookieDBManager.set_location(cache_dir)
     _ISINDBManager.set_location(cache_dir)
+    _ResponseDBManager.set_location(cache_dir)
+    _PriceDBManager.set_location(cache_dir)
 
 def set_tz_cache_location(cache_dir: str):
     set_cache_location(cache_dir)
@@ -7,9 +7,9 @@ import pandas as pd
 from datetime import datetime, date, timedelta
 
 from .const import _QUERY1_URL_
-from .utils import log_indent_decorator, get_yf_logger, _parse_user_dt
-from .screener import screen
-from .data import YfData
+from .utils import log_indent_decorator, get_yf_logger, _parse_user_dt, response_json
+from .screener import screen, screen_async
+from .data import YfData, AsyncYfData
 from .exceptions import YFException
 
 
@@ -176,6 +176,7 @@ class Calendars:
     earnings_calendar = calendars.get_earnings_calendar(limit=50)
     print(earnings_calendar)
     ```"""
+    _data_cls = YfData
 
     def __init__(
         self,
@@ -193,7 +194,7 @@ class Calendars:
 
         self._logger = get_yf_logger()
         self.session = session or Session()
-        self._data: YfData = YfData(session=session)
+        self._data: YfData = self._data_cls(session=session)
 
         _start = self._parse_date_param(start)
         _end = self._parse_date_param(end)
@@ -219,6 +220,16 @@ class Calendars:
     def _get_data(
         self, calendar_type: str, query: CalendarQuery, limit=12, offset=0, force=False
     ) -> pd.DataFrame:
+        cached, params, body = self._prepare_request(calendar_type, query, limit, offset, force)
+        if cached is not None:
+            return cached
+
+        self._logger.debug(f"Fetching {calendar_type=} with {limit=}")
+        response: Response = self._data.post(_CALENDAR_URL_, params=params, body=body)
+        return self._process_response(calendar_type, response)
+
+    def _prepare_request(self, calendar_type: str, query: CalendarQuery, limit, offset, force):
+        """Returns (cached DataFrame or None, params, body)"""
         if calendar_type not in PREDEFINED_CALENDARS:
             raise YFException(f"Unknown calendar type: {calendar_type}")
 
@@ -238,14 +249,13 @@ class Calendars:
             if cache_body == body and calendar_type in self.calendars:
                 # Uses cache if force=False and new request has same body as previous
                 self._logger.debug(f"Getting {calendar_type=} from local cache")
-                return self.calendars[calendar_type]
+                return self.calendars[calendar_type], params, body
         self._cache_request_body[calendar_type] = body
+        return None, params, body
 
-        self._logger.debug(f"Fetching {calendar_type=} with {limit=}")
-        response: Response = self._data.post(_CALENDAR_URL_, params=params, body=body)
-
+    def _process_response(self, calendar_type: str, response: Response) -> pd.DataFrame:
         try:
-            json_data = response.json()
+            json_data = response_json(response)
         except json.JSONDecodeError:
             self._logger.error(f"{calendar_type}: Failed to retrieve calendar.")
             json_data = {}
@@ -315,6 +325,9 @@ class Calendars:
             self._logger.error("Failed to retrieve most active stocks.")
             return self._most_active_qy
 
+        return self._set_most_active_operands(json_raw, _market_cap)
+
+    def _set_most_active_operands(self, json_raw: dict, _market_cap: Optional[float]) -> CalendarQuery:
         raw = json_raw.get("quotes", [{}])
 
         self._most_active_qy = CalendarQuery("or", [])
@@ -380,13 +393,27 @@ class Calendars:
         :param force: if True, will re-query even if cache already exists
         :return: DataFrame with earnings calendar
         """
+        query = self._build_earnings_query(market_cap, start, end)
+        if filter_most_active and not offset:
+            # YF does not like filter most active while offsetting
+            query.append(self._get_most_active_operands(market_cap))
+
+        return self._get_data(
+            calendar_type="sp_earnings",
+            query=query,
+            limit=limit,
+            offset=offset,
+            force=force,
+        )
+
+    def _build_earnings_query(self, market_cap, start, end) -> CalendarQuery:
         _start = self._parse_date_param(start)
         _end = self._parse_date_param(end)
         if (start and not end) or (end and not start):
             warnings.warn(
                 "When prividing custom `start` and `end` parameters, you may want to specify both, to avoid unexpected behaviour.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=4,
             )
 
         query = CalendarQuery(
@@ -410,20 +437,10 @@ class Calendars:
                 warnings.warn(
                     f"market_cap {market_cap} is very low, did you mean to set it higher?",
                     UserWarning,
-                    stacklevel=2,
+                    stacklevel=4,
                 )
             query.append(CalendarQuery("gte", ["intradaymarketcap", market_cap]))
-        if filter_most_active and not offset:
-            # YF does not like filter most active while offsetting
-            query.append(self._get_most_active_operands(market_cap))
-
-        return self._get_data(
-            calendar_type="sp_earnings",
-            query=query,
-            limit=limit,
-            offset=offset,
-            force=force,
-        )
+        return query
 
     @log_indent_decorator
     def get_ipo_info_calendar(
@@ -544,3 +561,90 @@ class Calendars:
         if "splits" in self.calendars:
             return self.calendars["splits"]
         return self.get_splits_calendar()
+
+
+class AsyncCalendars(Calendars):
+    """
+    Awaitable Calendars, for use inside an asyncio event loop.
+    Every getter & property returns an awaitable, e.g.
+    ``df = await AsyncCalendars().get_earnings_calendar(limit=50)``
+
+    Arguments same as Calendars, except session must be a curl_cffi AsyncSession.
+    """
+    _data_cls = AsyncYfData
+
+    async def _get_data(
+        self, calendar_type: str, query: CalendarQuery, limit=12, offset=0, force=False
+    ) -> pd.DataFrame:
+        cached, params, body = self._prepare_request(calendar_type, query, limit, offset, force)
+        if cached is not None:
+            return cached
+
+        self._logger.debug(f"Fetching {calendar_type=} with {limit=}")
+        response = await self._data.post(_CALENDAR_URL_, params=params, body=body)
+        return self._process_response(calendar_type, response)
+
+    async def _get_most_active_operands(
+        self, _market_cap: Optional[float], force=False
+    ) -> CalendarQuery:
+        if not self._most_active_qy.is_empty and not force:
+            return self._most_active_qy
+
+        self._logger.debug("Fetching 200 most_active for earnings calendar")
+
+        try:
+            json_raw: dict = await screen_async(query="MOST_ACTIVES", count=200)
+        except exceptions.HTTPError:
+            self._logger.error("Failed to retrieve most active stocks.")
+            return self._most_active_qy
+
+        return self._set_most_active_operands(json_raw, _market_cap)
+
+    async def get_earnings_calendar(
+        self,
+        market_cap: Optional[float] = None,
+        filter_most_active: bool = True,
+        start=None,
+        end=None,
+        limit=12,
+        offset=0,
+        force=False,
+    ) -> pd.DataFrame:
+        """Awaitable version of Calendars.get_earnings_calendar()"""
+        query = self._build_earnings_query(market_cap, start, end)
+        if filter_most_active and not offset:
+            # YF does not like filter most active while offsetting
+            query.append(await self._get_most_active_operands(market_cap))
+
+        return await self._get_data(
+            calendar_type="sp_earnings",
+            query=query,
+            limit=limit,
+            offset=offset,
+            force=force,
+        )
+
+    async def _cached_or_fetch(self, calendar_type: str, getter) -> pd.DataFrame:
+        if calendar_type in self.calendars:
+            return self.calendars[calendar_type]
+        return await getter()
+
+    @property
+    def earnings_calendar(self) -> pd.DataFrame:
+        """Earnings calendar with default settings."""
+        return self._cached_or_fetch("sp_earnings", self.get_earnings_calendar)
+
+    @property
+    def ipo_info_calendar(self) -> pd.DataFrame:
+        """IPOs calendar with default settings."""
+        return self._cached_or_fetch("ipo_info", self.get_ipo_info_calendar)
+
+    @property
+    def economic_events_calendar(self) -> pd.DataFrame:
+        """Economic events calendar with default settings."""
+        return self._cached_or_fetch("economic_event", self.get_economic_events_calendar)
+
+    @property
+    def splits_calendar(self) -> pd.DataFrame:
+        """Splits calendar with default settings."""
+        return self._cached_or_fetch("splits", self.get_splits_calendar)
@@ -0,0 +1,132 @@
+import atexit as _atexit
+import base64
+import gzip
+import json
+import os as _os
+import threading
+import time as _time
+
+from .config import YfConfig
+from .exceptions import YFDataException
+from .utils import get_yf_logger
+
+
+class Cassette:
+    """
+    Record of request/response pairs, for fully offline replay.
+
+    Stored as gzipped JSON lines, one request per line. Identical requests
+    are replayed in recorded order, the last one repeating once exhausted.
+    """
+
+    def __init__(self, path, mode):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', not '{mode}'")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._file = None
+        self._entries = {}
+        self._replay_counts = {}
+        if mode == 'replay':
+            self._load()
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    def _load(self):
+        if not _os.path.isfile(self.path):
+            raise YFDataException(f"Cassette file not found: '{self.path}'")
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(entry['key'], []).append(entry)
+
+    def record(self, key, method, url, params, body, response, elapsed):
+        entry = {
+            'key': key,
+            'method': method,
+            'url': url,
+            'params': params,
+            'body': body,
+            'status_code': response.status_code,
+            'response_url': str(response.url),
+            'headers': dict(response.headers),
+            'content': base64.b64encode(response.content).decode('ascii'),
+            'elapsed': round(elapsed, 4),
+        }
+        line = json.dumps(entry, default=str) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, 'at', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            self._entries.setdefault(key, []).append(entry)
+
+    def replay(self, key, url, latency=False):
+        """
+        Return dict of recorded response fields, or raise if request was never recorded.
+        """
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise YFDataException(f"No recorded response in cassette '{self.path}' for request: {url}")
+            i = self._replay_counts.get(key, 0)
+            self._replay_counts[key] = i + 1
+            entry = entries[min(i, len(entries) - 1)]
+        if latency and entry['elapsed'] > 0:
+            _time.sleep(entry['elapsed'])
+        return {
+            'url': entry['response_url'],
+            'status_code': entry['status_code'],
+            'content': base64.b64decode(entry['content']),
+            'headers': entry['headers'],
+        }
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+_cassette = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette():
+    """
+    Return the Cassette configured by yf.config.network.cassette & cassette_mode, or None.
+    """
+    global _cassette
+    path = YfConfig.network.cassette
+    if path is None:
+        if _cassette is not None:
+            close_cassette()
+        return None
+    mode = YfConfig.network.cassette_mode or 'replay'
+    cassette = _cassette
+    if cassette is not None and cassette.path == path and cassette.mode == mode:
+        return cassette
+    with _cassette_lock:
+        if _cassette is None or _cassette.path != path or _cassette.mode != mode:
+            if _cassette is not None:
+                _cassette.close()
+            get_yf_logger().debug(f"Using cassette '{path}' in {mode} mode")
+            _cassette = Cassette(path, mode)
+        return _cassette
+
+
+def close_cassette():
+    global _cassette
+    with _cassette_lock:
+        if _cassette is not None:
+            _cassette.close()
+            _cassette = None
+
+
+# flush recording when Python exits
+_atexit.register(close_cassette)
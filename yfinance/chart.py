@@ -39,3 +39,23 @@ class Chart(BaseModel):
 
 class ChartResponse(BaseModel):
     chart: Chart
+
+
+def chart_meta(data: Any) -> Dict[str, Any]:
+    """
+    Return ``meta`` of the first chart result, checking only the structure
+    on the way to it. Much cheaper than ``ChartResponse.model_validate``
+    because the price arrays are not touched.
+    Raises ValueError if the structure is wrong.
+    """
+    try:
+        result = data["chart"]["result"]
+        meta = result[0]["meta"]
+    except (KeyError, IndexError, TypeError) as err:
+        raise ValueError(f"chart response has no result meta: {err!r}") from None
+    if not isinstance(meta, dict):
+        raise ValueError(f"chart result meta is {type(meta).__name__}, not dict")
+    tz = meta.get("exchangeTimezoneName")
+    if tz is not None and not isinstance(tz, str):
+        raise ValueError(f"chart exchangeTimezoneName is {type(tz).__name__}, not str")
+    return meta
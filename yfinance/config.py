@@ -16,7 +16,7 @@ class NestedConfig:
         return len(self.__dict__['data'])
 
     def __repr__(self):
-        return json.dumps(self.data, indent=4)
+        return json.dumps(self.data, indent=4, default=repr)
 
 class ConfigMgr:
     def __init__(self):
@@ -30,9 +30,42 @@ class ConfigMgr:
         n = self.__getattr__('network')
         n.proxy = None
         n.retries = 0
+        n.coalesce = True
+        n.rate_limit = None  # requests/second per host
+        n.rate_limit_burst = 5
+        n.max_connections = 10
+        n.http_version = None  # curl default, negotiates HTTP/2
+        n.hedge = False
+        n.hedge_percentile = 95
+        n.failover = False
+        n.failover_threshold = 5
+        n.failover_cooldown = 30
+        n.json_decoder = 'auto'  # or 'orjson', 'ujson', 'stdlib', or a callable
+        n.cassette = None  # path to record/replay file
+        n.cassette_mode = 'replay'
+        n.cassette_latency = False
+        c = self.__getattr__('cache')
+        c.responses = False
+        c.responses_max_mb = 512
+        # Seconds, None = forever. Endpoint families not listed are not cached.
+        c.responses_ttl = {
+            'chart': None,  # only requests with 'period2' in the past
+            'fundamentals-timeseries': 3 * 24 * 60 * 60,
+            'quoteSummary': 5 * 60,
+        }
+        c.history = False
+        c.history_max_mb = 256
+        # Seconds, None = forever. 'closed' = range has ended, 'open' = can still get new bars.
+        # Closed ranges still expire because new dividends & splits change adjusted prices.
+        c.history_ttl = {
+            'open': 60,
+            'closed': 24 * 60 * 60,
+        }
         d = self.__getattr__('debug')
         d.hide_exceptions = True
         d.logging = False
+        d.metrics = False
+        d.validate_chart = False  # validate whole chart response when probing timezone
 
     def __getattr__(self, key):
         if not self._initialised:
@@ -53,6 +86,6 @@ class ConfigMgr:
             self._load_option()
 
         all_options = self.options.copy()
-        return json.dumps(all_options, indent=4)
+        return json.dumps(all_options, indent=4, default=repr)
 
 YfConfig = ConfigMgr()
@@ -123,6 +123,21 @@ fundamentals_keys = {
 
 _PRICE_COLNAMES_ = ['Open', 'High', 'Low', 'Close', 'Adj Close']
 
+# Longest time range (seconds) Yahoo returns in one chart request, per intraday interval.
+# Longer ranges are fetched as several windows.
+_INTRADAY_MAX_WINDOW_ = {
+    '1m': 8 * 86400,
+    '2m': 60 * 86400, '5m': 60 * 86400, '15m': 60 * 86400, '30m': 60 * 86400, '90m': 60 * 86400,
+    '60m': 730 * 86400, '1h': 730 * 86400,
+}
+
+# How far back Yahoo serves each intraday interval, in seconds
+_INTRADAY_MAX_LOOKBACK_ = {
+    '1m': 30 * 86400,
+    '2m': 60 * 86400, '5m': 60 * 86400, '15m': 60 * 86400, '30m': 60 * 86400, '90m': 60 * 86400,
+    '60m': 730 * 86400, '1h': 730 * 86400,
+}
+
 quote_summary_valid_modules = (
     "summaryProfile",  # contains general information about the company
     "summaryDetail",  # prices + volume + market cap + etc
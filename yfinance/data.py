@@ -1,9 +1,16 @@
+import asyncio
 import functools
+from collections import namedtuple
+from contextlib import contextmanager
+import hashlib
+import json
 from functools import lru_cache
 import socket
 import time as _time
+import weakref
+from concurrent.futures import wait as futures_wait, FIRST_COMPLETED
 
-from curl_cffi import requests
+from curl_cffi import requests, CurlOpt
 from urllib.parse import urlsplit, urljoin
 from bs4 import BeautifulSoup
 import datetime
@@ -12,6 +19,9 @@ from frozendict import frozendict
 
 from . import utils, cache
 from .config import YfConfig
+from .ratelimit import get_rate_limiter
+from .cassette import get_cassette
+from . import metrics, failover
 import threading
 
 from .exceptions import YFException, YFDataException, YFRateLimitError
@@ -52,6 +62,172 @@ def lru_cache_freezeargs(func):
     return wrapped
 
 
+def _canonical_request_key(method, url, params=None, body=None, data=None):
+    """
+    Build a hashable key identifying a request, independent of params ordering.
+    """
+    if params:
+        params = tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    if body is not None:
+        body = json.dumps(body, sort_keys=True, default=str)
+    return method, url, params or None, body, data
+
+
+class _InFlightCall:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exception = None
+        self.thread_id = threading.get_ident()
+
+
+class _SingleFlight:
+    """
+    Coalesce concurrent identical requests: the first caller for a key performs
+    the request, callers arriving while it is in flight wait and share its result
+    (or exception). Nothing is cached once the request completes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+            elif call.thread_id == threading.get_ident():
+                # Re-entrant request from the leading thread, waiting would deadlock
+                call = None
+                leader = False
+            else:
+                self.coalesced += 1
+                metrics.inc('yfinance_coalesced_requests_total')
+                leader = False
+
+        if call is None:
+            return fn()
+
+        if not leader:
+            call.event.wait()
+            if call.exception is not None:
+                raise call.exception
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            return {'executed': self.executed, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
+
+    def reset_stats(self):
+        with self._lock:
+            self.executed = 0
+            self.coalesced = 0
+
+
+def _response_cache_ttl(url, params=None):
+    """
+    Seconds a response to this request can be served from the persistent
+    response cache: None = forever, 0 = do not cache.
+    """
+    if not YfConfig.cache.responses:
+        return 0
+    ttls = YfConfig.cache.responses_ttl or {}
+    family = utils.endpoint_family(url)
+    if family not in ttls:
+        return 0
+    if family == 'chart':
+        # Only a closed range won't change, same condition as PriceHistory uses for cache_get
+        period2 = (params or {}).get('period2')
+        if period2 is None or int(period2) + 30 * 60 > _time.time():
+            return 0
+    return ttls[family]
+
+
+def _response_cache_key(url, params=None):
+    return hashlib.sha256(repr(_canonical_request_key('GET', url, params)).encode()).hexdigest()
+
+
+class _CachedResponse:
+    """
+    Minimal stand-in for a curl_cffi Response, for responses not fetched over network.
+    """
+
+    def __init__(self, url, status_code, content, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self, **kwargs):
+        if kwargs:
+            return json.loads(self.content, **kwargs)
+        return utils.json_loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.exceptions.HTTPError(f"HTTP Error {self.status_code}: {self.url}")
+
+
+def _session_options():
+    """
+    Keyword arguments for sessions created by yfinance: keep connections alive
+    and multiplexed, since nearly all requests go to the same few Yahoo hosts.
+    """
+    curl_options = {CurlOpt.TCP_KEEPALIVE: 1, CurlOpt.PIPEWAIT: 1}
+    if YfConfig.network.max_connections:
+        curl_options[CurlOpt.MAXCONNECTS] = YfConfig.network.max_connections
+    options = {'impersonate': 'chrome', 'curl_options': curl_options}
+    if YfConfig.network.http_version:
+        options['http_version'] = YfConfig.network.http_version
+    return options
+
+
+def _request_method_name(request_method):
+    # e.g. Session.get -> 'GET'
+    return getattr(request_method, '__name__', 'get').upper()
+
+
+def _observe_response(request_method, request_args, response, elapsed):
+    if not metrics.enabled():
+        return
+    try:
+        n_bytes = len(response.content)
+    except Exception:
+        n_bytes = 0
+    metrics.observe_response(utils.endpoint_family(request_args['url']), _request_method_name(request_method),
+                             response.status_code, elapsed, n_bytes)
+
+
+# Immutable, so can be read without _cookie_lock. 'version' increments
+# whenever cookie/crumb is invalidated.
+_CrumbSnapshot = namedtuple('_CrumbSnapshot', ['crumb', 'strategy', 'version'])
+
+
 class SingletonMeta(type):
     """
     Metaclass that creates a Singleton instance.
@@ -88,9 +264,22 @@ class YfData(metaclass=SingletonMeta):
         # self._cookie_strategy = 'csrf'
 
         self._cookie_lock = threading.Lock()
+        self._crumb_version = 0
+        self._crumb_snapshot = None
+
+        self._singleflight = _SingleFlight()
+
+        # Idle sessions for concurrent requests, so connections survive across threads.
+        # Grows to the peak number of concurrent requests, e.g. download() threads.
+        # Only used if yfinance created the session, a user session is used as-is.
+        self._session_pool = []
+        self._session_pool_lock = threading.Lock()
+        self._own_session = None
+        if session is None:
+            self._own_session = session = requests.Session(**_session_options())
 
         self._session = None
-        self._set_session(session or requests.Session(impersonate="chrome"))
+        self._set_session(session)
 
     def _set_session(self, session):
         if session is None:
@@ -117,6 +306,30 @@ class YfData(metaclass=SingletonMeta):
             if YfConfig.network.proxy is not None:
                 self._session.proxies = YfConfig.network.proxy
 
+    @contextmanager
+    def _borrow_session(self):
+        """
+        Yield a session for exclusive use by one request. Pooled sessions share the
+        main session's cookies but each keeps its own connections alive, unlike
+        per-thread curl handles which are lost when a download thread exits.
+        """
+        if self._session is not self._own_session:
+            yield self._session
+            return
+
+        with self._session_pool_lock:
+            session = self._session_pool.pop() if self._session_pool else None
+        if session is None:
+            session = requests.Session(use_thread_local_curl=False, **_session_options())
+            session.cookies = self._session.cookies.jar
+        session.proxies = YfConfig.network.proxy
+        try:
+            yield session
+        finally:
+            # Always keep, a throwaway session would cost a new TCP/TLS handshake per request
+            with self._session_pool_lock:
+                self._session_pool.append(session)
+
     def _set_cookie_strategy(self, strategy, have_lock=False):
         if strategy == self._cookie_strategy:
             return
@@ -133,6 +346,9 @@ class YfData(metaclass=SingletonMeta):
                 self._cookie_strategy = 'csrf'
             self._cookie = None
             self._crumb = None
+            self._crumb_version += 1
+            self._crumb_snapshot = None
+            metrics.inc('yfinance_cookie_strategy_toggles_total', {'strategy': self._cookie_strategy})
         except Exception:
             self._cookie_lock.release()
             raise
@@ -347,13 +563,40 @@ class YfData(metaclass=SingletonMeta):
         utils.get_yf_logger().debug(f"crumb = '{self._crumb}'")
         return self._crumb
 
-    @utils.log_indent_decorator
     def _get_cookie_and_crumb(self, timeout=30):
+        snapshot = self._get_crumb_snapshot(timeout)
+        return snapshot.crumb, snapshot.strategy
+
+    def _get_crumb_snapshot(self, timeout=30):
+        # Fast path: once crumb established, every request reads it without locking
+        snapshot = self._crumb_snapshot
+        if snapshot is not None:
+            return snapshot
+        return self._fetch_crumb_snapshot(timeout)
+
+    def _toggle_cookie_strategy(self, version):
+        """
+        Switch to other cookie strategy, unless another thread already
+        invalidated the crumb version the caller was using.
+        """
+        with self._cookie_lock:
+            if version != self._crumb_version:
+                return
+            if self._cookie_strategy == 'basic':
+                self._set_cookie_strategy('csrf', have_lock=True)
+            else:
+                self._set_cookie_strategy('basic', have_lock=True)
+
+    @utils.log_indent_decorator
+    def _fetch_crumb_snapshot(self, timeout=30):
         crumb, strategy = None, None
 
         utils.get_yf_logger().debug(f"cookie_mode = '{self._cookie_strategy}'")
 
         with self._cookie_lock:
+            if self._crumb_snapshot is not None:
+                # Another thread fetched while we waited
+                return self._crumb_snapshot
             if self._cookie_strategy == 'csrf':
                 crumb = self._get_crumb_csrf()
                 if crumb is None:
@@ -368,11 +611,32 @@ class YfData(metaclass=SingletonMeta):
                     self._set_cookie_strategy('csrf', have_lock=True)
                     crumb = self._get_crumb_csrf()
             strategy = self._cookie_strategy
-        return crumb, strategy
+            snapshot = _CrumbSnapshot(crumb, strategy, self._crumb_version)
+            metrics.inc('yfinance_crumb_refreshes_total', {'strategy': strategy})
+            if crumb is not None:
+                self._crumb_snapshot = snapshot
+        return snapshot
+
+    def _coalesce(self, key, fn):
+        if not YfConfig.network.coalesce:
+            return fn()
+        return self._singleflight.do(key, fn)
+
+    def coalesce_stats(self):
+        """
+        Counters of the in-flight request coalescing: 'executed' requests were sent,
+        'coalesced' requests waited on an identical in-flight request instead.
+        """
+        return self._singleflight.stats()
 
     @utils.log_indent_decorator
     def get(self, url, params=None, timeout=30):
-        response = self._make_request(url, request_method = self._session.get, params=params, timeout=timeout)
+        key = _canonical_request_key('GET', url, params)
+        return self._coalesce(key, lambda: self._get(url, params, timeout))
+
+    def _get(self, url, params=None, timeout=30):
+        with self._borrow_session() as session:
+            response = self._make_request(url, request_method = session.get, params=params, timeout=timeout)
 
         # Accept cookie-consent if redirected to consent page
         if not self._is_this_consent_url(response.url):
@@ -386,7 +650,12 @@ class YfData(metaclass=SingletonMeta):
 
     @utils.log_indent_decorator
     def post(self, url, body=None, params=None, timeout=30, data=None):
-        return self._make_request(url, request_method = self._session.post, body=body, params=params, timeout=timeout, data=data)
+        key = _canonical_request_key('POST', url, params, body, data)
+        return self._coalesce(key, lambda: self._post(url, body, params, timeout, data))
+
+    def _post(self, url, body=None, params=None, timeout=30, data=None):
+        with self._borrow_session() as session:
+            return self._make_request(url, request_method = session.post, body=body, params=params, timeout=timeout, data=data)
 
     @utils.log_indent_decorator
     def _make_request(self, url, request_method, body=None, params=None, timeout=30, data=None):
@@ -406,62 +675,217 @@ class YfData(metaclass=SingletonMeta):
         if 'crumb' in params:
             raise YFException("Don't manually add 'crumb' to params dict, let data.py handle it")
 
-        crumb, strategy = self._get_cookie_and_crumb()
-        if crumb is not None:
-            crumbs = {'crumb': crumb}
-        else:
-            crumbs = {}
+        cassette = get_cassette()
+        if cassette is not None:
+            method, cassette_key = self._cassette_key(request_method, url, params, body, data)
+            if cassette.replaying:
+                return self._replay(cassette, cassette_key, url)
+        request_start = _time.perf_counter()
 
-        request_args = {
-            'url': url,
-            'params': {**params, **crumbs},
-            'timeout': timeout
-        }
-
-        if body:
-            request_args['json'] = body
-        
-        if data:
-            request_args['data'] = data
-            request_args['headers'] = {"Content-Type": "application/json"}
+        snapshot = self._get_crumb_snapshot()
+        request_args = self._build_request_args(url, params, snapshot.crumb, timeout, body, data)
 
+        rate_limiter = get_rate_limiter()
         for attempt in range(YfConfig.network.retries + 1):
             try:
-                response = request_method(**request_args)
+                rate_limiter.acquire(url)
+                response = self._send(request_method, request_args)
                 break
             except Exception as e:
                 if _is_transient_error(e) and attempt < YfConfig.network.retries:
+                    metrics.inc('yfinance_retries_total', {'endpoint': utils.endpoint_family(url), 'reason': 'transient'})
                     _time.sleep(2 ** attempt)
                 else:
                     raise
         utils.get_yf_logger().debug(f'response code={response.status_code}')
+        rate_limiter.on_response(url, response.status_code)
         if response.status_code >= 400:
             # Retry with other cookie strategy
-            if strategy == 'basic':
-                self._set_cookie_strategy('csrf')
-            else:
-                self._set_cookie_strategy('basic')
-            crumb, strategy = self._get_cookie_and_crumb(timeout)
-            request_args['params']['crumb'] = crumb
-            response = request_method(**request_args)
+            self._toggle_cookie_strategy(snapshot.version)
+            snapshot = self._get_crumb_snapshot(timeout)
+            request_args['params']['crumb'] = snapshot.crumb
+            metrics.inc('yfinance_retries_total', {'endpoint': utils.endpoint_family(url), 'reason': 'cookie_strategy'})
+            rate_limiter.acquire(url)
+            response = self._send(request_method, request_args)
             utils.get_yf_logger().debug(f'response code={response.status_code}')
+            rate_limiter.on_response(url, response.status_code)
 
             # Raise exception if rate limited
             if response.status_code == 429:
                 raise YFRateLimitError()
 
+        if cassette is not None:
+            cassette.record(cassette_key, method, url, params, body or data, response,
+                            _time.perf_counter() - request_start)
+
+        return response
+
+    def _send(self, request_method, request_args):
+        # Send request, routing around a failing host and hedging a slow one if enabled
+        if not (YfConfig.network.failover or YfConfig.network.hedge):
+            return self._timed_request(request_method, request_args)
+
+        url, alt_url = failover.route(request_args['url'])
+        if url != request_args['url']:
+            utils.get_yf_logger().debug(f"failing over to {url}")
+            metrics.inc('yfinance_failovers_total', {'endpoint': utils.endpoint_family(url)})
+            request_args = {**request_args, 'url': url}
+        if YfConfig.network.hedge and alt_url is not None:
+            return self._hedged_request(request_method, request_args, alt_url)
+        return self._tracked_request(request_method, request_args)
+
+    def _hedged_request(self, request_method, request_args, alt_url):
+        # Run request in background, if it's slower than usual then also send to
+        # alternate host. Requests need own session, because loser keeps running.
+        method_name = _request_method_name(request_method).lower()
+        family = utils.endpoint_family(request_args['url'])
+        executor = failover.get_executor()
+
+        # Set once a response is chosen, so the loser doesn't feed host stats
+        decided = threading.Event()
+
+        def send(args, started=None):
+            if started is not None:
+                started.set()
+            with self._borrow_session() as session:
+                return self._tracked_request(getattr(session, method_name), args, decided)
+
+        def send_hedge(args):
+            # Hedge is an extra request, so it must respect rate limit too
+            get_rate_limiter().acquire(args['url'])
+            if decided.is_set():
+                return None
+            return send(args)
+
+        # Time spent queued for an executor thread doesn't count as slow
+        started = threading.Event()
+        primary = executor.submit(send, request_args, started)
+        started.wait()
+        done, _ = futures_wait([primary], timeout=failover.get_latency_tracker().hedge_delay(family))
+        if done:
+            return primary.result()
+
+        utils.get_yf_logger().debug(f"hedging slow request to {alt_url}")
+        metrics.inc('yfinance_hedged_requests_total', {'endpoint': family})
+        hedge = executor.submit(send_hedge, {**request_args, 'url': alt_url})
+
+        pending = {primary, hedge}
+        error, fallback = None, None
+        try:
+            while pending:
+                done, pending = futures_wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    if f.exception() is not None:
+                        error = error or f.exception()
+                        continue
+                    response = f.result()
+                    if not failover.is_failure(response.status_code):
+                        return response
+                    fallback = fallback or response
+        finally:
+            decided.set()
+            for f in pending:
+                # Only stops a request still queued, a running one finishes unrecorded
+                f.cancel()
+        if fallback is not None:
+            return fallback
+        raise error
+
+    def _tracked_request(self, request_method, request_args, abandoned=None):
+        # Timed request, feeding circuit breaker & latency tracker,
+        # unless 'abandoned' event was set meanwhile e.g. lost hedge race
+        url = request_args['url']
+        breaker = failover.get_circuit_breaker()
+        start = _time.perf_counter()
+        try:
+            response = self._timed_request(request_method, request_args)
+        except Exception:
+            if abandoned is None or not abandoned.is_set():
+                breaker.record_failure(failover.host_of(url))
+            raise
+        if abandoned is not None and abandoned.is_set():
+            return response
+        if failover.is_failure(response.status_code):
+            breaker.record_failure(failover.host_of(url))
+        else:
+            breaker.record_success(failover.host_of(url))
+            failover.get_latency_tracker().record(utils.endpoint_family(url), _time.perf_counter() - start)
+        return response
+
+    @staticmethod
+    def _timed_request(request_method, request_args):
+        start = _time.perf_counter()
+        response = request_method(**request_args)
+        _observe_response(request_method, request_args, response, _time.perf_counter() - start)
+        return response
+
+    @staticmethod
+    def _cassette_key(request_method, url, params, body=None, data=None):
+        method = _request_method_name(request_method)
+        return method, repr(_canonical_request_key(method, url, params, body, data))
+
+    @staticmethod
+    def _replay(cassette, cassette_key, url):
+        response = _CachedResponse(**cassette.replay(cassette_key, url, YfConfig.network.cassette_latency))
+        utils.get_yf_logger().debug(f'replayed response code={response.status_code}')
+        if response.status_code == 429:
+            raise YFRateLimitError()
         return response
 
+    @staticmethod
+    def _build_request_args(url, params, crumb, timeout, body=None, data=None):
+        if crumb is not None:
+            crumbs = {'crumb': crumb}
+        else:
+            crumbs = {}
+
+        request_args = {
+            'url': url,
+            'params': {**params, **crumbs},
+            'timeout': timeout
+        }
+
+        if body:
+            request_args['json'] = body
+
+        if data:
+            request_args['data'] = data
+            request_args['headers'] = {"Content-Type": "application/json"}
+
+        return request_args
+
     @lru_cache_freezeargs
     @lru_cache(maxsize=cache_maxsize)
     def cache_get(self, url, params=None, timeout=30):
-        return self.get(url, params, timeout)
+        return self._persistent_get(url, params, timeout)
+
+    def _persistent_get(self, url, params=None, timeout=30):
+        # GET, using the on-disk response cache if enabled for this endpoint
+        ttl = _response_cache_ttl(url, params)
+        if ttl == 0:
+            return self.get(url, params, timeout)
+
+        key = _response_cache_key(url, params)
+        response_cache = cache.get_response_cache()
+        hit = response_cache.lookup(key)
+        if hit is not None:
+            utils.get_yf_logger().debug(f'response cache hit: {url}')
+            metrics.inc('yfinance_response_cache_hits_total', {'endpoint': utils.endpoint_family(url)})
+            return _CachedResponse(**hit)
+
+        response = self.get(url, params, timeout)
+        if response.status_code == 200:
+            max_bytes = YfConfig.cache.responses_max_mb
+            if max_bytes is not None:
+                max_bytes = int(max_bytes * 1024 * 1024)
+            response_cache.store(key, response.url, response.status_code, response.content, ttl, max_bytes)
+        return response
 
     def get_raw_json(self, url, params=None, timeout=30):
         utils.get_yf_logger().debug(f'get_raw_json(): {url}')
-        response = self.get(url, params=params, timeout=timeout)
+        response = self._persistent_get(url, params=params, timeout=timeout)
         response.raise_for_status()
-        return response.json()
+        return utils.response_json(response)
 
     def _is_this_consent_url(self, response_url: str) -> bool:
         """
@@ -494,12 +918,26 @@ class YfData(metaclass=SingletonMeta):
         Returns:
             response (requests.Response) : Reponse instance received from the server after accepting cookie-consent post.
         """
+        post_args = self._build_consent_form_post(consent_resp)
+        if post_args is None:
+            return consent_resp
+        response = self._session.post(**post_args, timeout=timeout, allow_redirects=True)
+        return response
+
+    @staticmethod
+    def _build_consent_form_post(consent_resp):
+        """
+        Fill in the cookie-consent form, shared by sync and async clients.
+
+        Returns:
+            dict of 'url', 'data' & 'headers' to POST, or None if page has no form.
+        """
         soup = BeautifulSoup(consent_resp.text, "html.parser")
     
         # Heuristic: pick the first form; Yahoo's CMP tends to have a single form for consent
         form = soup.find("form")
         if not form:
-            return consent_resp
+            return None
     
         # action : URL to send "Accept Cookies"
         action = form.get("action") or consent_resp.url
@@ -538,7 +976,245 @@ class YfData(metaclass=SingletonMeta):
     
         # Submit the form with "Referer". Some servers check this header as a simple CSRF protection measure.
         headers = {"Referer": consent_resp.url}
-        response = self._session.post(
-            action, data=data, headers=headers, timeout=timeout, allow_redirects=True
-        )
+        return {'url': action, 'data': data, 'headers': headers}
+
+
+class _AsyncLoopState:
+    """Per-event-loop session & lock, because curl_cffi's AsyncSession binds to one loop."""
+
+    def __init__(self, session):
+        self.session = session
+        self.lock = asyncio.Lock()
+        self.crumb_snapshot = None
+
+
+class AsyncYfData(metaclass=SingletonMeta):
+    """
+    Asyncio counterpart of YfData, for use inside an event loop.
+    Cookie & crumb are shared with the YfData singleton, so cookie strategy
+    and persistent cookie cache behave exactly as for synchronous fetches.
+    """
+
+    def __init__(self, session=None):
+        # Resolved lazily: constructing YfData here would re-enter SingletonMeta lock
+        self._yfdata = None
+
+        self._session = None
+        self._loop_states = weakref.WeakKeyDictionary()
+        self._set_session(session)
+
+    @property
+    def _sync(self):
+        if self._yfdata is None:
+            self._yfdata = YfData()
+        return self._yfdata
+
+    def _set_session(self, session):
+        if session is None:
+            return
+        if not isinstance(session, requests.AsyncSession):
+            raise YFDataException(f"Yahoo API requires curl_cffi AsyncSession not {type(session)}. Solution: stop setting session, let YF handle.")
+        self._session = session
+        self._loop_states = weakref.WeakKeyDictionary()
+
+    def _get_loop_state(self):
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            session = self._session or requests.AsyncSession(max_clients=YfConfig.network.max_connections or 10,
+                                                             **_session_options())
+            state = _AsyncLoopState(session)
+            self._loop_states[loop] = state
+        return state
+
+    async def _close_loop_session(self):
+        # Release session of an event loop about to end, e.g. one made by asyncio.run()
+        state = self._loop_states.pop(asyncio.get_running_loop(), None)
+        if state is not None and state.session is not self._session:
+            await state.session.close()
+
+    def _copy_cookies(self, session):
+        # Cookie was fetched by synchronous session, copy into async session
+        for cookie in self._sync._session.cookies.jar:
+            session.cookies.jar.set_cookie(cookie)
+
+    async def _get_crumb_snapshot(self, timeout=30):
+        state = self._get_loop_state()
+        async with state.lock:
+            sync = self._sync
+            if state.crumb_snapshot is not None and state.crumb_snapshot is sync._crumb_snapshot:
+                return state.crumb_snapshot
+
+            # Cookie & crumb fetching is rare, so reuse the synchronous
+            # implementation rather than duplicate strategy handling.
+            snapshot = await asyncio.to_thread(sync._get_crumb_snapshot, timeout)
+            self._copy_cookies(state.session)
+            state.crumb_snapshot = snapshot
+            return snapshot
+
+    async def get(self, url, params=None, timeout=30):
+        state = self._get_loop_state()
+        response = await self._make_request(url, request_method=state.session.get, params=params, timeout=timeout)
+
+        # Accept cookie-consent if redirected to consent page
+        if self._sync._is_this_consent_url(response.url):
+            response = await self._accept_consent_form(response, timeout)
+
+        return response
+
+    async def post(self, url, body=None, params=None, timeout=30, data=None):
+        state = self._get_loop_state()
+        return await self._make_request(url, request_method=state.session.post, body=body, params=params, timeout=timeout, data=data)
+
+    async def _make_request(self, url, request_method, body=None, params=None, timeout=30, data=None):
+        # Important: treat input arguments as immutable.
+
+        if len(url) > 200:
+            utils.get_yf_logger().debug(f'url={url[:200]}...')
+        else:
+            utils.get_yf_logger().debug(f'url={url}')
+        utils.get_yf_logger().debug(f'params={params}')
+
+        state = self._get_loop_state()
+        # sync with config
+        state.session.proxies = YfConfig.network.proxy
+
+        if params is None:
+            params = {}
+        if 'crumb' in params:
+            raise YFException("Don't manually add 'crumb' to params dict, let data.py handle it")
+
+        cassette = get_cassette()
+        if cassette is not None:
+            method, cassette_key = YfData._cassette_key(request_method, url, params, body, data)
+            if cassette.replaying:
+                if YfConfig.network.cassette_latency:
+                    return await asyncio.to_thread(YfData._replay, cassette, cassette_key, url)
+                return YfData._replay(cassette, cassette_key, url)
+        request_start = _time.perf_counter()
+
+        snapshot = await self._get_crumb_snapshot(timeout)
+        request_args = YfData._build_request_args(url, params, snapshot.crumb, timeout, body, data)
+
+        rate_limiter = get_rate_limiter()
+        for attempt in range(YfConfig.network.retries + 1):
+            try:
+                await rate_limiter.acquire_async(url)
+                response = await self._send(request_method, request_args)
+                break
+            except Exception as e:
+                if _is_transient_error(e) and attempt < YfConfig.network.retries:
+                    metrics.inc('yfinance_retries_total', {'endpoint': utils.endpoint_family(url), 'reason': 'transient'})
+                    await asyncio.sleep(2 ** attempt)
+                else:
+                    raise
+        utils.get_yf_logger().debug(f'response code={response.status_code}')
+        rate_limiter.on_response(url, response.status_code)
+        if response.status_code >= 400:
+            # Retry with other cookie strategy
+            self._sync._toggle_cookie_strategy(snapshot.version)
+            snapshot = await self._get_crumb_snapshot(timeout)
+            request_args['params']['crumb'] = snapshot.crumb
+            metrics.inc('yfinance_retries_total', {'endpoint': utils.endpoint_family(url), 'reason': 'cookie_strategy'})
+            await rate_limiter.acquire_async(url)
+            response = await self._send(request_method, request_args)
+            utils.get_yf_logger().debug(f'response code={response.status_code}')
+            rate_limiter.on_response(url, response.status_code)
+
+            # Raise exception if rate limited
+            if response.status_code == 429:
+                raise YFRateLimitError()
+
+        if cassette is not None:
+            cassette.record(cassette_key, method, url, params, body or data, response,
+                            _time.perf_counter() - request_start)
+
+        return response
+
+    async def _send(self, request_method, request_args):
+        # Send request, routing around a failing host and hedging a slow one if enabled
+        if not (YfConfig.network.failover or YfConfig.network.hedge):
+            return await self._timed_request(request_method, request_args)
+
+        url, alt_url = failover.route(request_args['url'])
+        if url != request_args['url']:
+            utils.get_yf_logger().debug(f"failing over to {url}")
+            metrics.inc('yfinance_failovers_total', {'endpoint': utils.endpoint_family(url)})
+            request_args = {**request_args, 'url': url}
+        if YfConfig.network.hedge and alt_url is not None:
+            return await self._hedged_request(request_method, request_args, alt_url)
+        return await self._tracked_request(request_method, request_args)
+
+    async def _hedged_request(self, request_method, request_args, alt_url):
+        # AsyncSession handles concurrent requests, so hedge can reuse it
+        family = utils.endpoint_family(request_args['url'])
+        primary = asyncio.ensure_future(self._tracked_request(request_method, request_args))
+        done, _ = await asyncio.wait({primary}, timeout=failover.get_latency_tracker().hedge_delay(family))
+        if done:
+            return primary.result()
+
+        utils.get_yf_logger().debug(f"hedging slow request to {alt_url}")
+        metrics.inc('yfinance_hedged_requests_total', {'endpoint': family})
+        hedge = asyncio.ensure_future(self._send_hedge(request_method, {**request_args, 'url': alt_url}))
+
+        pending = {primary, hedge}
+        error, fallback = None, None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for f in done:
+                    if f.exception() is not None:
+                        error = error or f.exception()
+                        continue
+                    response = f.result()
+                    if not failover.is_failure(response.status_code):
+                        return response
+                    fallback = fallback or response
+        finally:
+            for f in pending:
+                f.cancel()
+        if fallback is not None:
+            return fallback
+        raise error
+
+    async def _send_hedge(self, request_method, request_args):
+        # Hedge is an extra request, so it must respect rate limit too
+        await get_rate_limiter().acquire_async(request_args['url'])
+        return await self._tracked_request(request_method, request_args)
+
+    async def _tracked_request(self, request_method, request_args):
+        # Timed request, feeding circuit breaker & latency tracker
+        url = request_args['url']
+        breaker = failover.get_circuit_breaker()
+        start = _time.perf_counter()
+        try:
+            response = await self._timed_request(request_method, request_args)
+        except Exception:
+            breaker.record_failure(failover.host_of(url))
+            raise
+        if failover.is_failure(response.status_code):
+            breaker.record_failure(failover.host_of(url))
+        else:
+            breaker.record_success(failover.host_of(url))
+            failover.get_latency_tracker().record(utils.endpoint_family(url), _time.perf_counter() - start)
+        return response
+
+    @staticmethod
+    async def _timed_request(request_method, request_args):
+        start = _time.perf_counter()
+        response = await request_method(**request_args)
+        _observe_response(request_method, request_args, response, _time.perf_counter() - start)
         return response
+
+    async def get_raw_json(self, url, params=None, timeout=30):
+        utils.get_yf_logger().debug(f'get_raw_json(): {url}')
+        response = await self.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return utils.response_json(response)
+
+    async def _accept_consent_form(self, consent_resp, timeout):
+        post_args = YfData._build_consent_form_post(consent_resp)
+        if post_args is None:
+            return consent_resp
+        state = self._get_loop_state()
+        return await state.session.post(**post_args, timeout=timeout, allow_redirects=True)
@@ -24,7 +24,7 @@ class Market:
         if data is None or "Will be right back" in data.text:
             raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
         try:
-            return data.json()
+            return utils.response_json(data)
         except _json.JSONDecodeError:
             if not YfConfig.debug.hide_exceptions:
                 raise
@@ -0,0 +1,163 @@
+import collections
+import threading
+import time as _time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+from .config import YfConfig
+from .const import _QUERY1_URL_, _BASE_URL_
+
+
+_ALTERNATE_HOSTS = {
+    urlsplit(_QUERY1_URL_).hostname: urlsplit(_BASE_URL_).hostname,
+    urlsplit(_BASE_URL_).hostname: urlsplit(_QUERY1_URL_).hostname,
+}
+
+# Used until enough latencies observed to estimate percentile
+_DEFAULT_HEDGE_DELAY = 1.0
+_MIN_HEDGE_DELAY = 0.05
+_MIN_SAMPLES = 20
+
+
+def host_of(url):
+    return urlsplit(url).hostname
+
+
+def alternate_url(url):
+    """
+    Return same URL on the alternate Yahoo API host (query1 <-> query2), or None.
+    """
+    parts = urlsplit(url)
+    alt_host = _ALTERNATE_HOSTS.get(parts.hostname)
+    if alt_host is None:
+        return None
+    return urlunsplit(parts._replace(netloc=alt_host))
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker. After 'network.failover_threshold' consecutive
+    failures a host is avoided for 'network.failover_cooldown' seconds, then
+    one trial request is allowed through.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened_at = {}
+
+    def is_open(self, host):
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return False
+        if _time.monotonic() - opened_at >= (YfConfig.network.failover_cooldown or 0):
+            # Half-open: allow a trial request, re-opened if it fails
+            with self._lock:
+                self._opened_at.pop(host, None)
+                self._failures[host] = max((YfConfig.network.failover_threshold or 1) - 1, 0)
+            return False
+        return True
+
+    def record_success(self, host):
+        if self._failures.get(host):
+            with self._lock:
+                self._failures[host] = 0
+
+    def record_failure(self, host):
+        with self._lock:
+            n = self._failures.get(host, 0) + 1
+            self._failures[host] = n
+            if n >= (YfConfig.network.failover_threshold or 1):
+                self._opened_at[host] = _time.monotonic()
+
+    def reset(self):
+        with self._lock:
+            self._failures = {}
+            self._opened_at = {}
+
+
+class LatencyTracker:
+    """
+    Recent request latencies per endpoint family, to decide when to hedge.
+    """
+
+    def __init__(self, window=256):
+        self._lock = threading.Lock()
+        self._window = window
+        self._latencies = {}
+
+    def record(self, family, elapsed):
+        with self._lock:
+            q = self._latencies.get(family)
+            if q is None:
+                q = self._latencies[family] = collections.deque(maxlen=self._window)
+            q.append(elapsed)
+
+    def hedge_delay(self, family):
+        """
+        Seconds to wait for a response before sending a hedge request:
+        the 'network.hedge_percentile' percentile of recent latencies.
+        """
+        with self._lock:
+            q = self._latencies.get(family)
+            samples = sorted(q) if q is not None and len(q) >= _MIN_SAMPLES else None
+        if samples is None:
+            return _DEFAULT_HEDGE_DELAY
+        pct = YfConfig.network.hedge_percentile or 95
+        i = min(int(len(samples) * pct / 100), len(samples) - 1)
+        return max(samples[i], _MIN_HEDGE_DELAY)
+
+    def reset(self):
+        with self._lock:
+            self._latencies = {}
+
+
+def route(url):
+    """
+    Return (url to send to, alternate url to hedge to or None),
+    routing around a host whose circuit breaker is open.
+    """
+    alt_url = alternate_url(url)
+    if alt_url is None or not YfConfig.network.failover:
+        return url, alt_url
+    breaker = get_circuit_breaker()
+    if breaker.is_open(host_of(url)):
+        if breaker.is_open(host_of(alt_url)):
+            # Both failing, nothing to gain
+            return url, None
+        return alt_url, None
+    if breaker.is_open(host_of(alt_url)):
+        return url, None
+    return url, alt_url
+
+
+def is_failure(status_code):
+    """
+    Whether a response indicates a problem with the host, not the request.
+    """
+    return status_code == 429 or status_code >= 500
+
+
+_circuit_breaker = CircuitBreaker()
+_latency_tracker = LatencyTracker()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_circuit_breaker():
+    return _circuit_breaker
+
+
+def get_latency_tracker():
+    return _latency_tracker
+
+
+def get_executor():
+    # Threads to run hedged synchronous requests
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=2 * (YfConfig.network.max_connections or 10),
+                                               thread_name_prefix='yf-hedge')
+    return _executor
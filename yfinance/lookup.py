@@ -25,7 +25,7 @@ import pandas as pd
 from . import utils
 from .config import YfConfig
 from .const import _QUERY1_URL_
-from .data import YfData
+from .data import YfData, AsyncYfData
 from .exceptions import YFDataException
 
 LOOKUP_TYPES = ["all", "equity", "mutualfund", "etf", "index", "future", "currency", "cryptocurrency"]
@@ -41,10 +41,11 @@ class Lookup:
     :param timeout: Request timeout in seconds (default 30).
     :param raise_errors: Raise exceptions on error (default True).
     """
+    _data_cls = YfData
 
     def __init__(self, query: str, session=None, timeout=30, raise_errors=True):
         self.session = session
-        self._data = YfData(session=self.session)
+        self._data = self._data_cls(session=self.session)
 
         self.query = query
 
@@ -60,6 +61,11 @@ class Lookup:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        url, params = self._build_request(lookup_type, count)
+        data = self._data.get(url=url, params=params, timeout=self.timeout)
+        return self._process_response(data, cache_key)
+
+    def _build_request(self, lookup_type, count):
         url = f"{_QUERY1_URL_}/v1/finance/lookup"
         params = {
             "query": self.query,
@@ -73,12 +79,13 @@ class Lookup:
         }
 
         self._logger.debug(f'GET Lookup for ticker ({self.query}) with parameters: {str(dict(params))}')
+        return url, params
 
-        data = self._data.get(url=url, params=params, timeout=self.timeout)
+    def _process_response(self, data, cache_key) -> dict:
         if data is None or "Will be right back" in data.text:
             raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
         try:
-            data = data.json()
+            data = utils.response_json(data)
         except _json.JSONDecodeError:
             if not YfConfig.debug.hide_exceptions:
                 raise
@@ -218,3 +225,25 @@ class Lookup:
     def cryptocurrency(self) -> pd.DataFrame:
         """Returns Cryptocurrencies related financial instruments."""
         return self._get_data("cryptocurrency")
+
+
+class AsyncLookup(Lookup):
+    """
+    Awaitable Lookup, for use inside an asyncio event loop.
+    Every getter & property returns an awaitable, e.g. ``df = await AsyncLookup("AAPL").stock``
+
+    Arguments same as Lookup, except session must be a curl_cffi AsyncSession.
+    """
+    _data_cls = AsyncYfData
+
+    async def _fetch_lookup(self, lookup_type="all", count=25) -> dict:
+        cache_key = (lookup_type, count)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        url, params = self._build_request(lookup_type, count)
+        data = await self._data.get(url=url, params=params, timeout=self.timeout)
+        return self._process_response(data, cache_key)
+
+    async def _get_data(self, lookup_type: str, count: int = 25) -> pd.DataFrame:
+        return self._parse_response(await self._fetch_lookup(lookup_type, count))
@@ -0,0 +1,159 @@
+import threading
+
+from .config import YfConfig
+
+
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# name: (type, help)
+_METRICS = {
+    'yfinance_requests_total': ('counter', "HTTP requests sent to Yahoo"),
+    'yfinance_request_duration_seconds': ('histogram', "Latency of HTTP requests to Yahoo"),
+    'yfinance_response_bytes_total': ('counter', "Bytes received in response bodies"),
+    'yfinance_http_errors_total': ('counter', "Error responses, by status class 4xx, 429 or 5xx"),
+    'yfinance_retries_total': ('counter', "Requests retried, by reason"),
+    'yfinance_crumb_refreshes_total': ('counter', "Cookie & crumb (re)fetches"),
+    'yfinance_cookie_strategy_toggles_total': ('counter', "Switches of cookie strategy"),
+    'yfinance_coalesced_requests_total': ('counter', "Requests served by an identical in-flight request"),
+    'yfinance_response_cache_hits_total': ('counter', "Requests served from persistent response cache"),
+    'yfinance_hedged_requests_total': ('counter', "Slow requests duplicated to the alternate host"),
+    'yfinance_failovers_total': ('counter', "Requests routed to the alternate host because of failures"),
+}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters & histograms, keyed by metric name and labels.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items())) if labels else ()
+
+    def inc(self, name, labels=None, value=1):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=None):
+        key = self._key(name, labels)
+        with self._lock:
+            h = self._histograms.get(key)
+            if h is None:
+                h = self._histograms[key] = {'buckets': [0] * len(_LATENCY_BUCKETS), 'sum': 0.0, 'count': 0}
+            for i, le in enumerate(_LATENCY_BUCKETS):
+                if value <= le:
+                    h['buckets'][i] += 1
+            h['sum'] += value
+            h['count'] += 1
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    def snapshot(self):
+        """
+        Return dict of metric name -> list of samples {'labels': dict, 'value': ...}.
+        Histogram values are dicts of cumulative 'buckets', 'sum' and 'count'.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {k: {'buckets': list(v['buckets']), 'sum': v['sum'], 'count': v['count']}
+                          for k, v in self._histograms.items()}
+        snap = {}
+        for (name, labels), value in sorted(counters.items()):
+            snap.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+        for (name, labels), h in sorted(histograms.items()):
+            value = {'buckets': dict(zip(_LATENCY_BUCKETS, h['buckets'])), 'sum': h['sum'], 'count': h['count']}
+            snap.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+        return snap
+
+    def prometheus_text(self):
+        """
+        Return metrics in Prometheus text exposition format.
+        """
+        lines = []
+        for name, samples in self.snapshot().items():
+            metric_type, help_text = _METRICS.get(name, ('untyped', ''))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for sample in samples:
+                labels = sample['labels']
+                if metric_type == 'histogram':
+                    h = sample['value']
+                    for le, count in h['buckets'].items():
+                        lines.append(f"{name}_bucket{_format_labels({**labels, 'le': le})} {count}")
+                    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {h['count']}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h['sum']}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h['count']}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {sample['value']}")
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    items = []
+    for k, v in labels.items():
+        v = str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        items.append(f'{k}="{v}"')
+    return '{' + ','.join(items) + '}'
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry():
+    return _registry
+
+
+def enabled():
+    return bool(YfConfig.debug.metrics)
+
+
+def inc(name, labels=None, value=1):
+    if enabled():
+        _registry.inc(name, labels, value)
+
+
+def observe(name, value, labels=None):
+    if enabled():
+        _registry.observe(name, value, labels)
+
+
+def observe_response(endpoint, method, status_code, elapsed, n_bytes):
+    """
+    Record one HTTP request/response exchange.
+    """
+    if not enabled():
+        return
+    labels = {'endpoint': endpoint, 'method': method}
+    _registry.inc('yfinance_requests_total', labels)
+    _registry.observe('yfinance_request_duration_seconds', elapsed, {'endpoint': endpoint})
+    if n_bytes:
+        _registry.inc('yfinance_response_bytes_total', {'endpoint': endpoint}, n_bytes)
+    if status_code == 429:
+        _registry.inc('yfinance_http_errors_total', {'endpoint': endpoint, 'status': '429'})
+    elif status_code >= 500:
+        _registry.inc('yfinance_http_errors_total', {'endpoint': endpoint, 'status': '5xx'})
+    elif status_code >= 400:
+        _registry.inc('yfinance_http_errors_total', {'endpoint': endpoint, 'status': '4xx'})
+
+
+def snapshot():
+    return _registry.snapshot()
+
+
+def prometheus_text():
+    return _registry.prometheus_text()
+
+
+def reset():
+    _registry.reset()
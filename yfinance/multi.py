@@ -21,20 +21,26 @@
 
 from __future__ import print_function
 
+import asyncio
+import functools
 import logging
+import multiprocessing
 import os
+import threading
 import traceback
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from typing import Union
 
+import numpy as _np
 import pandas as _pd
-from curl_cffi import requests
 
-from . import Ticker, shared, utils
-from .const import _SENTINEL_
-from .data import YfData
+from . import Ticker, cache, shared, utils
+from .const import _QUERY1_URL_, _SENTINEL_
+from .data import YfData, AsyncYfData
 from .config import YfConfig
+from .exceptions import YFException, YFRateLimitError
+from .scrapers.history import PriceHistory
 
 
 @utils.log_indent_decorator
@@ -59,6 +65,12 @@ def download(
     timeout=10,
     session=None,
     multi_level_index=True,
+    engine="threads",
+    concurrency=None,
+    format="wide",
+    processes=None,
+    since=None,
+    store=False,
     _retry=True,
 ) -> Union[_pd.DataFrame, None]:
     """
@@ -72,7 +84,8 @@ def download(
             Either Use period parameter or use start and end
         interval : str
             Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
-            Intraday data cannot extend last 60 days
+            Intraday data cannot extend last 60 days (1m: 30 days).
+            Ranges longer than one request allows are fetched in windows
         start: str
             Download start date string (YYYY-MM-DD) or _datetime, inclusive.
             Default is 99 years ago
@@ -110,10 +123,40 @@ def download(
             Optional. Pass your own session object to be used for all requests
         multi_level_index: bool
             Optional. Always return a MultiIndex DataFrame? Default is True
+        engine: str
+            How to fetch tickers concurrently: 'threads' (default) uses
+            a thread pool sized by 'threads', 'async' fetches every ticker
+            on an asyncio event loop
+        concurrency: None or int
+            Optional. Maximum tickers in flight with engine='async'.
+            Default is yf.config.network.max_connections
+        format: str
+            'wide' (default) returns one column per ticker & price.
+            'long' returns one row per ticker & timestamp, with columns
+            Ticker, Date/Datetime, Open, High, Low, Close, ... 'arrow' returns
+            the long table as pyarrow.Table (requires pyarrow).
+            group_by & multi_level_index only apply to 'wide'
+        processes: None, bool or int
+            Optional. Parse & repair fetched prices in this many worker
+            processes (True = one per CPU), while threads keep fetching.
+            Worth it with repair=True and many tickers. Default is None
+        since: None or DataFrame
+            Optional. A previous download() result, 'wide' or 'long', fetched
+            with the same arguments. Tickers in it only fetch prices after
+            their last row, re-adjusting old rows for any new dividends &
+            splits. start, end & period only apply to other tickers
+        store: bool
+            Optional. Keep prices in a local store under the cache folder,
+            and only fetch date ranges not stored yet. Default is False
     """
+    if engine not in ("threads", "async"):
+        raise ValueError(f"engine must be 'threads' or 'async', not '{engine}'")
+    if since is not None and (engine != "threads" or processes):
+        raise ValueError("'since' not supported with engine='async' or processes")
+    if store and (engine != "threads" or processes or since is not None):
+        raise ValueError("'store' not supported with engine='async', processes or 'since'")
+    _check_format(format)
     logger = utils.get_yf_logger()
-    session = session or requests.Session(impersonate="chrome")
-
     # Ensure data initialised with session.
     if proxy is not _SENTINEL_:
         warnings.warn(
@@ -153,118 +196,383 @@ def download(
         else:
             ignore_tz = True
 
-    # create ticker list
-    tickers = (
-        tickers
-        if isinstance(tickers, (list, set, tuple))
-        else tickers.replace(",", " ").split()
-    )
+    tickers, isins = _parse_tickers(tickers)
+    ctx = _DownloadContext(tickers, isins, progress)
 
-    # accept isin as ticker
-    with shared._ISINS_LOCK:
-        shared._ISINS = {}
-    _tickers_ = []
-    for ticker in tickers:
-        if utils.is_isin(ticker):
-            isin = ticker
-            ticker = utils.get_ticker_by_isin(ticker)
-            with shared._ISINS_LOCK:
-                shared._ISINS[ticker] = isin
-        _tickers_.append(ticker)
-
-    tickers = _tickers_
+    ctx.tzs = _prefetch_tz(tickers, timeout)
+    existing = _split_existing(since, ctx) if since is not None else None
+    process_pool = _process_pool(processes) if processes else None
+    # Only pass on if set, history_update() & worker processes don't take it
+    store_kwargs = {"store": True} if store else {}
+    try:
+        _download_all(ctx, engine, threads, concurrency, process_pool, existing, _retry,
+                      **store_kwargs,
+                      start=start,
+                      end=end,
+                      auto_adjust=auto_adjust,
+                      back_adjust=back_adjust,
+                      repair=repair,
+                      actions=actions,
+                      period=period,
+                      interval=interval,
+                      prepost=prepost,
+                      rounding=rounding,
+                      keepna=keepna,
+                      timeout=timeout)
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=True)
 
-    tickers = list(dict.fromkeys([ticker.upper() for ticker in tickers]))
+    ctx.publish()
+    return _assemble(ctx, ignore_tz, group_by, multi_level_index, format)
 
-    if progress:
-        with shared._PROGRESS_BAR_LOCK:
-            shared._PROGRESS_BAR = utils.ProgressBar(len(tickers), "completed")
 
-    # reset shared structures
-    with shared._DFS_LOCK:
-        shared._DFS = {}
-    with shared._ERRORS_LOCK:
-        shared._ERRORS = {}
-    with shared._TRACEBACKS_LOCK:
-        shared._TRACEBACKS = {}
+def _download_all(ctx, engine, threads, concurrency, process_pool, existing, _retry, **kwargs):
+    tickers = ctx.tickers
+    if process_pool is not None:
+        download_one = functools.partial(_download_one_in_process, process_pool)
+    elif existing is not None:
+        download_one = functools.partial(_download_one_update, existing)
+    else:
+        download_one = _download_one
 
+    if engine == "async":
+        _run_coroutine(_download_all_async(
+            ctx,
+            concurrency=concurrency,
+            close_session=True,
+            process_pool=process_pool,
+            **kwargs,
+        ))
     # download using threads
-    if threads:
+    elif threads:
         if threads is True:
             threads = min([len(tickers), (os.cpu_count() or 1) * 2])
         futures = {}
         with ThreadPoolExecutor(max_workers=threads) as executor:
             for ticker in tickers:
-                futures[
-                    executor.submit(
-                        _download_one_threaded,
-                        ticker,
-                        start=start,
-                        end=end,
-                        auto_adjust=auto_adjust,
-                        back_adjust=back_adjust,
-                        repair=repair,
-                        actions=actions,
-                        period=period,
-                        interval=interval,
-                        prepost=prepost,
-                        rounding=rounding,
-                        keepna=keepna,
-                        timeout=timeout,
-                    )
-                ] = ticker
+                futures[executor.submit(download_one, ticker, tz=ctx.tzs.get(ticker), **kwargs)] = ticker
             for future in as_completed(futures):
                 ticker = futures[future]
                 try:
-                    data = future.result()
-                    with shared._DFS_LOCK:
-                        shared._DFS[ticker.upper()] = data
+                    ctx.add(ticker, future.result())
                 except Exception as e:
-                    with shared._DFS_LOCK:
-                        shared._DFS[ticker.upper()] = utils.empty_df()
-                    with shared._ERRORS_LOCK:
-                        shared._ERRORS[ticker.upper()] = repr(e)
-                    with shared._TRACEBACKS_LOCK:
-                        shared._TRACEBACKS[ticker.upper()] = traceback.format_exc()
+                    ctx.add_error(ticker, e)
+                ctx.animate()
     # download synchronously
     else:
         for ticker in tickers:
             try:
-                data = _download_one(
-                    ticker,
-                    period=period,
-                    interval=interval,
-                    start=start,
-                    end=end,
-                    prepost=prepost,
-                    actions=actions,
-                    auto_adjust=auto_adjust,
-                    back_adjust=back_adjust,
-                    repair=repair,
-                    keepna=keepna,
-                    rounding=rounding,
-                    timeout=timeout,
-                    _retry=_retry,
-                )
-                with shared._DFS_LOCK:
-                    shared._DFS[ticker.upper()] = data
+                data = download_one(ticker, tz=ctx.tzs.get(ticker), _retry=_retry, **kwargs)
+                ctx.add(ticker, data)
             except Exception as e:
-                with shared._DFS_LOCK:
-                    shared._DFS[ticker.upper()] = utils.empty_df()
-                with shared._ERRORS_LOCK:
-                    shared._ERRORS[ticker.upper()] = repr(e)
-                with shared._TRACEBACKS_LOCK:
-                    shared._TRACEBACKS[ticker.upper()] = traceback.format_exc()
-            if progress:
-                with shared._PROGRESS_BAR_LOCK:
-                    shared._PROGRESS_BAR.animate()
-
-    if progress:
-        with shared._PROGRESS_BAR_LOCK:
-            shared._PROGRESS_BAR.completed()
-
-    with shared._ERRORS_LOCK:
-        errors_copy = shared._ERRORS.copy()
+                ctx.add_error(ticker, e)
+            ctx.animate()
+
+
+async def download_async(
+    tickers,
+    start=None,
+    end=None,
+    actions=False,
+    ignore_tz=None,
+    group_by="column",
+    auto_adjust=True,
+    back_adjust=False,
+    repair=False,
+    keepna=False,
+    progress=True,
+    period=None,
+    interval="1d",
+    prepost=False,
+    rounding=False,
+    timeout=10,
+    multi_level_index=True,
+    concurrency=None,
+    format="wide",
+) -> Union[_pd.DataFrame, None]:
+    """
+    Awaitable version of download(), for use inside an asyncio event loop.
+    Parameters same as download(), except 'concurrency' bounds how many
+    tickers are fetched at once. Default is yf.config.network.max_connections
+    """
+    _check_format(format)
+    logger = utils.get_yf_logger()
+    if logger.isEnabledFor(logging.DEBUG) and progress:
+        # Disable progress bar, interferes with display of log messages
+        progress = False
+
+    if ignore_tz is None:
+        ignore_tz = interval[-1] not in ["m", "h"]
+
+    tickers, isins = _parse_tickers(tickers)
+    ctx = _DownloadContext(tickers, isins, progress)
+
+    await _download_all_async(
+        ctx,
+        concurrency=concurrency,
+        start=start,
+        end=end,
+        auto_adjust=auto_adjust,
+        back_adjust=back_adjust,
+        repair=repair,
+        actions=actions,
+        period=period,
+        interval=interval,
+        prepost=prepost,
+        rounding=rounding,
+        keepna=keepna,
+        timeout=timeout,
+    )
+
+    ctx.publish()
+    return _assemble(ctx, ignore_tz, group_by, multi_level_index, format)
+
+
+def download_iter(
+    tickers,
+    start=None,
+    end=None,
+    actions=False,
+    threads=True,
+    ignore_tz=None,
+    auto_adjust=True,
+    back_adjust=False,
+    repair=False,
+    keepna=False,
+    progress=False,
+    period=None,
+    interval="1d",
+    prepost=False,
+    rounding=False,
+    timeout=10,
+    session=None,
+):
+    """
+    Download yahoo tickers one at a time, yielding (ticker, result) as each
+    completes, where result is the ticker's DataFrame or the Exception that
+    failed it. Nothing is kept after it is yielded, so memory stays flat
+    however many tickers.
+    Parameters same as download(). Tickers given as ISIN are yielded as ISIN.
+    """
+    logger = utils.get_yf_logger()
+    YfData(session=session)
+    if logger.isEnabledFor(logging.DEBUG):
+        threads = False
+        progress = False
+
+    if ignore_tz is None:
+        ignore_tz = interval[-1] not in ["m", "h"]
+
+    tickers, isins = _parse_tickers(tickers)
+    tzs = _prefetch_tz(tickers, timeout)
+    kwargs = dict(
+        start=start,
+        end=end,
+        auto_adjust=auto_adjust,
+        back_adjust=back_adjust,
+        repair=repair,
+        actions=actions,
+        period=period,
+        interval=interval,
+        prepost=prepost,
+        rounding=rounding,
+        keepna=keepna,
+        timeout=timeout,
+    )
+    progress_bar = utils.ProgressBar(len(tickers), "completed") if progress else None
+
+    def _result(ticker, fn):
+        try:
+            data = fn()
+        except Exception as e:
+            logger.debug(f"{ticker}: download failed: {e!r}")
+            data = e
+        else:
+            if ignore_tz and data is not None and data.shape[0] > 0:
+                data.index = data.index.tz_localize(None)
+        if progress_bar is not None:
+            progress_bar.animate()
+        return isins.get(ticker, ticker), data
+
+    if not threads:
+        for ticker in tickers:
+            yield _result(ticker, lambda: _download_one(ticker, tz=tzs.get(ticker), **kwargs))
+    else:
+        if threads is True:
+            threads = min([len(tickers), (os.cpu_count() or 1) * 2])
+        executor = ThreadPoolExecutor(max_workers=max(threads, 1))
+        # Bound futures in flight, so a slow consumer doesn't accumulate finished frames
+        pending = {}
+        remaining = iter(tickers)
+        try:
+            while True:
+                for ticker in remaining:
+                    pending[executor.submit(_download_one, ticker, tz=tzs.get(ticker), **kwargs)] = ticker
+                    if len(pending) >= 2 * threads:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _result(pending.pop(future), future.result)
+        finally:
+            # Consumer may stop early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    if progress_bar is not None:
+        progress_bar.completed()
+
+
+def _parse_tickers(tickers):
+    # Returns list of unique upper-case symbols, and dict of symbol -> ISIN given
+    tickers = (
+        tickers
+        if isinstance(tickers, (list, set, tuple))
+        else tickers.replace(",", " ").split()
+    )
+
+    # accept isin as ticker
+    resolved = _resolve_isins([ticker for ticker in tickers if utils.is_isin(ticker)])
+    isins = {}
+    _tickers_ = []
+    for ticker in tickers:
+        if utils.is_isin(ticker):
+            isin = ticker
+            ticker = resolved[isin]
+            isins[ticker] = isin
+        _tickers_.append(ticker)
+
+    tickers = _tickers_
+
+    tickers = list(dict.fromkeys([ticker.upper() for ticker in tickers]))
+
+    return tickers, isins
+
+
+def _resolve_isins(isins):
+    # Returns dict of ISIN -> symbol ("" if not found). Reads & writes the
+    # ISIN cache in bulk, and searches for the missing ISINs concurrently.
+    if not isins:
+        return {}
+    c = cache.get_isin_cache()
+    resolved = c.lookup_many(isins)
+    missing = list(dict.fromkeys(isin for isin in isins if isin not in resolved))
+    if missing:
+        max_workers = min(len(missing), YfConfig.network.max_connections or 10)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            searched = dict(zip(missing, executor.map(utils.get_ticker_by_isin, missing)))
+        c.store_many({isin: ticker for isin, ticker in searched.items() if ticker})
+        resolved.update(searched)
+    return resolved
+
+
+_TZ_QUOTE_CHUNK = 200  # symbols per quote request
+
+
+def _prefetch_tz(tickers, timeout=10):
+    # Resolve exchange timezones of many tickers in bulk: one cache read,
+    # then one quote request per chunk of missing tickers, then one cache
+    # write. Tickers still missing fall back to per-ticker fetching later.
+    c = cache.get_tz_cache()
+    tzs = {t: tz for t, tz in c.lookup_many(tickers).items() if utils.is_valid_timezone(tz)}
+    missing = [t for t in tickers if t not in tzs]
+    fetched = {}
+    for i in range(0, len(missing), _TZ_QUOTE_CHUNK):
+        try:
+            fetched.update(_fetch_tz_quotes(missing[i:i + _TZ_QUOTE_CHUNK], timeout))
+        except YFRateLimitError as e:
+            # Don't abort download(), per-ticker fetching surfaces the error
+            utils.get_yf_logger().debug(f"Rate-limited fetching timezones of {len(missing) - i} tickers: {e!r}")
+            break
+    c.store_many(fetched)
+    tzs.update(fetched)
+    return tzs
+
+
+def _fetch_tz_quotes(symbols, timeout):
+    logger = utils.get_yf_logger()
+    params = {"symbols": ",".join(symbols), "fields": "exchangeTimezoneName", "formatted": "false"}
+    try:
+        result = YfData().get_raw_json(f"{_QUERY1_URL_}/v7/finance/quote", params=params, timeout=timeout)
+        quotes = result["quoteResponse"]["result"]
+    except YFRateLimitError:
+        raise
+    except Exception as e:
+        logger.debug(f"Failed to fetch timezones of {len(symbols)} tickers: {e!r}")
+        return {}
+    tzs = {}
+    for q in quotes:
+        symbol, tz = q.get("symbol"), q.get("exchangeTimezoneName")
+        if symbol in symbols and utils.is_valid_timezone(tz):
+            tzs[symbol] = tz
+    return tzs
+
+
+def _ticker(ticker, tz=None):
+    # Ticker, with timezone if already resolved by _prefetch_tz()
+    dat = Ticker(ticker)
+    if tz is not None:
+        dat._tz = tz
+    return dat
+
+
+class _DownloadContext:
+    """
+    Results, errors & progress of one download() call. Each call has its own,
+    so concurrent downloads from different threads don't mix results.
+    """
+
+    def __init__(self, tickers, isins, progress):
+        self.tickers = tickers
+        self.isins = isins
+        self.tzs = {}
+        self.dfs = {}
+        self.errors = {}
+        self.tracebacks = {}
+        self.progress_bar = utils.ProgressBar(len(tickers), "completed") if progress else None
+        self._lock = threading.Lock()
+
+    def add(self, ticker, data):
+        with self._lock:
+            self.dfs[ticker.upper()] = data
+
+    def add_error(self, ticker, e):
+        # Call from inside the 'except' block, to capture traceback
+        if isinstance(e, _ProcessError):
+            err, tb = e.error, e.tb
+        else:
+            err, tb = repr(e), traceback.format_exc()
+        with self._lock:
+            self.dfs[ticker.upper()] = utils.empty_df()
+            self.errors[ticker.upper()] = err
+            self.tracebacks[ticker.upper()] = tb
+
+    def animate(self):
+        if self.progress_bar is not None:
+            with self._lock:
+                self.progress_bar.animate()
+
+    def completed(self):
+        if self.progress_bar is not None:
+            self.progress_bar.completed()
+
+    def publish(self):
+        # Expose results of latest download in yfinance.shared, for backward compatibility
+        with shared._DFS_LOCK:
+            shared._DFS = dict(self.dfs)
+        with shared._ERRORS_LOCK:
+            shared._ERRORS = dict(self.errors)
+        with shared._TRACEBACKS_LOCK:
+            shared._TRACEBACKS = dict(self.tracebacks)
+        with shared._ISINS_LOCK:
+            shared._ISINS = dict(self.isins)
+
+
+def _assemble(ctx, ignore_tz, group_by, multi_level_index, format="wide"):
+    ctx.completed()
+
+    errors_copy = ctx.errors.copy()
     if errors_copy:
         # Send errors to logging module
         logger = utils.get_yf_logger()
@@ -286,8 +594,7 @@ def download(
             logger.error(f"{errors[err]}: " + err)
 
         # Log each distinct traceback once, with list of symbols affected
-        with shared._TRACEBACKS_LOCK:
-            tbs_copy = shared._TRACEBACKS.copy()
+        tbs_copy = ctx.tracebacks.copy()
         tbs = {}
         for ticker in tbs_copy:
             tb = tbs_copy[ticker]
@@ -299,66 +606,40 @@ def download(
         for tb in tbs.keys():
             logger.debug(f"{tbs[tb]}: " + tb)
 
+    dfs = ctx.dfs
     if ignore_tz:
-        with shared._DFS_LOCK:
-            for tkr in shared._DFS.keys():
-                if (shared._DFS[tkr] is not None) and (shared._DFS[tkr].shape[0] > 0):
-                    shared._DFS[tkr].index = shared._DFS[tkr].index.tz_localize(None)
+        for tkr in dfs.keys():
+            if (dfs[tkr] is not None) and (dfs[tkr].shape[0] > 0):
+                dfs[tkr].index = dfs[tkr].index.tz_localize(None)
 
-    try:
-        # ───────────────────────────────
-        # 1. Logging before concat
-        # ───────────────────────────────
-        with shared._DFS_LOCK:  # already hold same lock as concat
-            for (
-                tkr,
-                df_single,
-            ) in shared._DFS.items():  # iterate over all saved DataFrames
-                if df_single is not None and not df_single.empty:
-                    utils._df_stats("BEFORE_CONCAT", df_single, tkr)
-                else:
-                    utils.get_yf_logger().debug(f"{tkr}: BEFORE_CONCAT: df EMPTY")
-
-        # ───────────────────────────────
-        # 2. _pd.concat(...)
-        # ───────────────────────────────
-        data = _pd.concat(
-            shared._DFS.values(),  # all DataFrames
-            axis=1,  # concatenate by columns
-            sort=True,
-            keys=shared._DFS.keys(),  # top level of MultiIndex = ticker
-            names=["Ticker", "Price"],
-        )
+    if format != "wide":
+        data = _stack_long(ctx, ignore_tz)
+        return _to_arrow(data) if format == "arrow" else data
+
+    debug = utils.get_yf_logger().isEnabledFor(logging.DEBUG)
+    if debug:
+        for tkr, df_single in dfs.items():
+            if df_single is not None and not df_single.empty:
+                utils._df_stats("BEFORE_CONCAT", df_single, tkr)
+            else:
+                utils.get_yf_logger().debug(f"{tkr}: BEFORE_CONCAT: df EMPTY")
+
+    data = _union_concat(dfs)
+
+    if debug:
+        # data has MultiIndex columns (Ticker → Price fields)
+        for tkr in dfs.keys():
+            utils._df_stats("AFTER_CONCAT", data[tkr], tkr)
 
-        # ───────────────────────────────
-        # 3. Logging after concat
-        # ───────────────────────────────
-        # data now has MultiIndex columns (Ticker → Price fields).
-        for tkr in data.columns.levels[0]:  # top level is list of tickers
-            df_slice = data[tkr]  # ticker slice ("sub-DataFrame")
-            # df_slice is still a DataFrame: columns Open/High/Low/Close/...
-            utils._df_stats("AFTER_CONCAT", df_slice, tkr)
-
-    except Exception:
-        _realign_dfs()
-        with shared._DFS_LOCK:
-            data = _pd.concat(
-                shared._DFS.values(),
-                axis=1,
-                sort=True,
-                keys=shared._DFS.keys(),
-                names=["Ticker", "Price"],
-            )
     data.index = _pd.to_datetime(data.index, utc=not ignore_tz)
     # switch names back to isins if applicable
-    with shared._ISINS_LOCK:
-        data.rename(columns=shared._ISINS, inplace=True)
+    data.rename(columns=ctx.isins, inplace=True)
 
     if group_by == "column":
         data.columns = data.columns.swaplevel(0, 1)
         data.sort_index(level=0, axis=1, inplace=True)
 
-    if not multi_level_index and len(tickers) == 1:
+    if not multi_level_index and len(ctx.tickers) == 1:
         data = data.droplevel(0 if group_by == "ticker" else 1, axis=1).rename_axis(
             None, axis=1
         )
@@ -366,30 +647,181 @@ def download(
     return data
 
 
-def _realign_dfs():
-    idx_len = 0
-    idx = None
+def _check_format(format):
+    if format not in ("wide", "long", "arrow"):
+        raise ValueError(f"format must be 'wide', 'long' or 'arrow', not '{format}'")
+
+
+def _stack_long(ctx, ignore_tz):
+    # Stack each ticker's columns end-to-end, so no wide NaN-padded intermediate
+    frames = [(ctx.isins.get(t, t), ctx.dfs[t]) for t in ctx.tickers
+              if ctx.dfs.get(t) is not None and ctx.dfs[t].shape[0] > 0]
+    if not frames:
+        return _pd.DataFrame(columns=["Ticker", "Date"] + list(utils.empty_df().columns))
+
+    index_name = frames[0][1].index.name or "Date"
+    columns = list(dict.fromkeys(c for _, df in frames for c in df.columns))
+    lengths = [len(df) for _, df in frames]
 
-    with shared._DFS_LOCK:
-        for df in shared._DFS.values():
-            if len(df) > idx_len:
-                idx_len = len(df)
-                idx = df.index
+    timestamps = []
+    for _, df in frames:
+        idx = df.index
+        if not ignore_tz and idx.tz is not None:
+            # Different exchanges, different timezones, so unify like 'wide' does
+            idx = idx.tz_convert("UTC")
+        timestamps.append(idx.tz_localize(None) if idx.tz is not None else idx)
+    timestamps = _pd.DatetimeIndex(_np.concatenate([idx.values for idx in timestamps]))
+    if not ignore_tz:
+        timestamps = timestamps.tz_localize("UTC")
 
-        for key in shared._DFS.keys():
+    data = {
+        "Ticker": _pd.Categorical.from_codes(_np.repeat(_np.arange(len(frames)), lengths),
+                                             categories=[t for t, _ in frames]),
+        index_name: timestamps,
+    }
+    for c in columns:
+        data[c] = _np.concatenate([df[c].to_numpy() if c in df.columns else _np.full(len(df), _np.nan)
+                                   for _, df in frames])
+    return _pd.DataFrame(data)
+
+
+def _to_arrow(data):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise YFException("format='arrow' requires package pyarrow")
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+def _run_coroutine(coro):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop (e.g. Jupyter), so run on a fresh loop in another thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _download_all_async(ctx, concurrency=None, close_session=False, process_pool=None, **kwargs):
+    if concurrency is None:
+        concurrency = YfConfig.network.max_connections or 10
+    semaphore = asyncio.Semaphore(max(int(concurrency), 1))
+
+    async def _fetch(ticker):
+        async with semaphore:
             try:
-                shared._DFS[key] = _pd.DataFrame(
-                    index=idx, data=shared._DFS[key]
-                ).drop_duplicates()
-            except Exception:
-                shared._DFS[key] = _pd.concat(
-                    [utils.empty_df(idx), shared._DFS[key].dropna()], axis=0, sort=True
-                )
+                ctx.add(ticker, await _download_one_async(ticker, tz=ctx.tzs.get(ticker),
+                                                          process_pool=process_pool, **kwargs))
+            except Exception as e:
+                ctx.add_error(ticker, e)
+            ctx.animate()
+
+    try:
+        await asyncio.gather(*[_fetch(ticker) for ticker in ctx.tickers])
+    finally:
+        if close_session:
+            # Event loop is about to end, release its session
+            await AsyncYfData()._close_loop_session()
+
 
-            # remove duplicate index
-            shared._DFS[key] = shared._DFS[key].loc[
-                ~shared._DFS[key].index.duplicated(keep="last")
-            ]
+def _union_concat(dfs):
+    # Equivalent of pd.concat(dfs.values(), axis=1, keys=dfs.keys(), sort=True)
+    # but computes the union index once, then scatters each ticker's columns
+    # straight into preallocated 2-D blocks, one per dtype. Duplicate
+    # timestamps keep the last row.
+    stamps = {}
+    for tkr, df in dfs.items():
+        if df is None or df.shape[0] == 0:
+            continue
+        if df.index.has_duplicates:
+            df = dfs[tkr] = df.loc[~df.index.duplicated(keep="last")]
+        idx = df.index
+        if idx.tz is not None:
+            # Different exchanges, different timezones
+            idx = idx.tz_convert("UTC").tz_localize(None)
+        stamps[tkr] = idx.values
+    # Usually every ticker trades on a subset of the longest calendar, so
+    # start from that and merge in only timestamps it lacks.
+    union = max(stamps.values(), key=len) if stamps else _np.array([], dtype="datetime64[ns]")
+    if not (union[1:] > union[:-1]).all():
+        # searchsorted needs it sorted
+        union = _np.unique(union)
+    positions = {}
+    grown = False
+    for tkr, ts in stamps.items():
+        pos = _np.searchsorted(union, ts)
+        if (pos < len(union)).all() and (union[pos] == ts).all():
+            positions[tkr] = pos
+        else:
+            union = _np.union1d(union, ts)
+            grown = True
+    if grown:
+        positions = {tkr: _np.searchsorted(union, ts) for tkr, ts in stamps.items()}
+    n = len(union)
+
+    # Plan which block & block column each output column goes to
+    columns = []
+    blocks = {}
+    widths = {}
+    for tkr, df in dfs.items():
+        if df is None:
+            df = utils.empty_df()
+        pos = positions.get(tkr)
+        groups = {}
+        for i, dt in enumerate(df.dtypes):
+            if not isinstance(dt, _np.dtype):
+                dt = _np.dtype("object")
+            if pos is None or (len(pos) < n and dt.kind in "fiu"):
+                # Missing rows become NaN
+                dt = _np.dtype("float64")
+            elif len(pos) < n:
+                dt = _np.dtype("object")
+            groups.setdefault(dt, []).append(i)
+        for dt, cols in groups.items():
+            j = widths.get(dt, 0)
+            widths[dt] = j + len(cols)
+            columns.extend((dt, j + k) for k in range(len(cols)))
+            keys = [(tkr, df.columns[i]) for i in cols]
+            # Values are copied out when filling, so only one ticker's copy exists at once
+            blocks.setdefault(dt, []).append((j, keys, pos, df, None if len(groups) == 1 else cols))
+
+    index = _pd.DatetimeIndex(union)
+    if any(df is not None and df.shape[0] > 0 and df.index.tz is not None for df in dfs.values()):
+        index = index.tz_localize("UTC")
+    names = {df.index.name for df in dfs.values() if df is not None and df.shape[0] > 0}
+    index.name = names.pop() if len(names) == 1 else None
+
+    frames = []
+    offsets = {}
+    offset = 0
+    for dt, entries in blocks.items():
+        # Column-major, so each ticker's columns are contiguous
+        if dt.kind in "fO":
+            arr = _np.full((n, widths[dt]), _np.nan, dtype=dt, order="F")
+        else:
+            arr = _np.empty((n, widths[dt]), dtype=dt, order="F")
+        keys = []
+        for j, entry_keys, pos, df, cols in entries:
+            if pos is not None:
+                values = (df if cols is None else df.iloc[:, cols]).to_numpy(dtype=dt)
+                # All rows already in index order, skip fancy indexing
+                in_order = len(pos) == n and (pos[1:] > pos[:-1]).all()
+                rows = slice(None) if in_order else pos
+                arr[rows, j:j + len(entry_keys)] = values
+            keys.extend(entry_keys)
+        keys = _pd.MultiIndex.from_tuples(keys, names=["Ticker", "Price"])
+        frames.append(_pd.DataFrame(arr, index=index, columns=keys, copy=False))
+        offsets[dt] = offset
+        offset += widths[dt]
+
+    if not frames:
+        return _pd.DataFrame(index=index, columns=_pd.MultiIndex.from_tuples([], names=["Ticker", "Price"]))
+    if len(frames) == 1:
+        return frames[0]
+    data = _pd.concat(frames, axis=1)
+    # Restore original column order
+    return data.iloc[:, [offsets[dt] + j for dt, j in columns]]
 
 
 def _download_one(
@@ -406,9 +838,11 @@ def _download_one(
     rounding=False,
     keepna=False,
     timeout=10,
+    tz=None,
+    store=False,
     _retry=True,
 ):
-    data = Ticker(ticker).history(
+    data = _ticker(ticker, tz).history(
         period=period,
         interval=interval,
         start=start,
@@ -422,13 +856,46 @@ def _download_one(
         keepna=keepna,
         timeout=timeout,
         raise_errors=True,
+        store=store,
         _retry=_retry,
     )
 
     return data
 
 
-def _download_one_threaded(
+def _download_one_update(existing, ticker, start=None, end=None, period="max", tz=None, _retry=True, **kwargs):
+    df = existing.get(ticker)
+    if df is None or df.empty:
+        return _download_one(ticker, start=start, end=end, period=period, tz=tz, _retry=_retry, **kwargs)
+    return _ticker(ticker, tz).history_update(df, raise_errors=True, **kwargs)
+
+
+def _split_existing(since, ctx):
+    # Split a previous download() result into each ticker's history
+    columns = since.columns
+    if "Ticker" in columns:
+        # format='long'
+        date_colname = columns[1]
+        frames = {t: g.drop(columns="Ticker").set_index(date_colname)
+                  for t, g in since.groupby("Ticker", observed=True)}
+    elif isinstance(columns, _pd.MultiIndex):
+        level = columns.names.index("Ticker") if "Ticker" in columns.names else 1
+        frames = {t: since.xs(t, axis=1, level=level) for t in columns.unique(level)}
+    elif len(ctx.tickers) == 1:
+        frames = {ctx.isins.get(ctx.tickers[0], ctx.tickers[0]): since}
+    else:
+        raise ValueError("'since' has no Ticker level, can only update 1 ticker")
+
+    existing = {}
+    for ticker in ctx.tickers:
+        df = frames.get(ctx.isins.get(ticker, ticker))
+        if df is not None:
+            # Drop padding rows from when other tickers traded
+            existing[ticker] = df.dropna(how="all")
+    return existing
+
+
+async def _download_one_async(
     ticker,
     start=None,
     end=None,
@@ -442,26 +909,120 @@ def _download_one_threaded(
     rounding=False,
     keepna=False,
     timeout=10,
+    tz=None,
+    process_pool=None,
+):
+    if process_pool is not None:
+        tkr = _ticker(ticker, tz)
+        tz = await tkr._get_ticker_tz_async(timeout=10)
+        ph = PriceHistory(tkr._data, tkr.ticker, tz)
+        hist_ctx = _prepare_history(ph, start, end, auto_adjust, back_adjust, repair, actions,
+                                    period, interval, prepost, rounding, keepna, True)
+        if hist_ctx is None:
+            return utils.empty_df()
+        data = await ph._fetch_data_async(hist_ctx['params'], timeout)
+        if isinstance(data, Exception):
+            raise data
+        future = process_pool.submit(_process_one, ph.ticker, tz, hist_ctx, data)
+        return _unwrap_processed(await asyncio.wrap_future(future))
+
+    data = await _ticker(ticker, tz).history_async(
+        period=period,
+        interval=interval,
+        start=start,
+        end=end,
+        prepost=prepost,
+        actions=actions,
+        auto_adjust=auto_adjust,
+        back_adjust=back_adjust,
+        repair=repair,
+        rounding=rounding,
+        keepna=keepna,
+        timeout=timeout,
+        raise_errors=True,
+    )
+
+    return data
+
+
+class _ProcessError(Exception):
+    # Error from a worker process, carried back as text because
+    # yfinance exceptions with extra constructor arguments don't pickle
+    def __init__(self, error, tb):
+        super().__init__(error)
+        self.error = error
+        self.tb = tb
+
+
+def _process_pool(processes):
+    if processes is True:
+        processes = os.cpu_count() or 1
+    # Workers start with default config & cache location, so send the current ones.
+    # Callables (e.g. custom json_decoder) can't be sent.
+    if not YfConfig._initialised:
+        YfConfig._load_option()
+    options = {section: {k: v for k, v in values.items() if not callable(v)}
+               for section, values in YfConfig.options.items()}
+    # 'spawn' because forking a process with fetch threads running can deadlock
+    return ProcessPoolExecutor(max_workers=int(processes), mp_context=multiprocessing.get_context("spawn"),
+                               initializer=_init_worker, initargs=(options, cache._TzDBManager.get_location()))
+
+
+def _init_worker(options, cache_dir):
+    for section, values in options.items():
+        config = getattr(YfConfig, section)
+        for k, v in values.items():
+            setattr(config, k, v)
+    cache.set_cache_location(cache_dir)
+
+
+def _prepare_history(price_history, start, end, auto_adjust, back_adjust, repair, actions,
+                     period, interval, prepost, rounding, keepna, _retry):
+    return price_history._prepare_history(period, interval, start, end, prepost, actions, auto_adjust,
+                                          back_adjust, repair, keepna, _SENTINEL_, rounding, True, _retry)
+
+
+def _download_one_in_process(
+    process_pool,
+    ticker,
+    start=None,
+    end=None,
+    auto_adjust=False,
+    back_adjust=False,
+    repair=False,
+    actions=False,
+    period="max",
+    interval="1d",
+    prepost=False,
+    rounding=False,
+    keepna=False,
+    timeout=10,
+    tz=None,
     _retry=True,
 ):
+    # Fetch in this thread, parse & repair in a worker process
+    ph = _ticker(ticker, tz)._lazy_load_price_history()
+    hist_ctx = _prepare_history(ph, start, end, auto_adjust, back_adjust, repair, actions,
+                                period, interval, prepost, rounding, keepna, _retry)
+    if hist_ctx is None:
+        return utils.empty_df()
+    data = ph._fetch_data(hist_ctx['params'], timeout, False)
+    if isinstance(data, Exception):
+        raise data
+    future = process_pool.submit(_process_one, ph.ticker, ph.tz, hist_ctx, data)
+    return _unwrap_processed(future.result())
+
+
+def _process_one(ticker, tz, hist_ctx, data):
+    # Runs in worker process
     try:
-        return _download_one(
-            ticker,
-            start=start,
-            end=end,
-            auto_adjust=auto_adjust,
-            back_adjust=back_adjust,
-            repair=repair,
-            actions=actions,
-            period=period,
-            interval=interval,
-            prepost=prepost,
-            rounding=rounding,
-            keepna=keepna,
-            timeout=timeout,
-            _retry=_retry,
-        )
-    finally:
-        if shared._PROGRESS_BAR is not None:
-            with shared._PROGRESS_BAR_LOCK:
-                shared._PROGRESS_BAR.animate()
+        return PriceHistory(YfData(), ticker, tz)._process_history(data, hist_ctx), None, None
+    except Exception as e:
+        return None, repr(e), traceback.format_exc()
+
+
+def _unwrap_processed(result):
+    df, error, tb = result
+    if error is not None:
+        raise _ProcessError(error, tb)
+    return df
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time as _time
+from urllib.parse import urlsplit
+
+from .config import YfConfig
+
+
+class _TokenBucket:
+    """
+    Token bucket with adaptive rate: halved when Yahoo rate-limits us,
+    then slowly recovered back to configured rate on successful requests.
+    """
+
+    # Never slow down below this fraction of configured rate
+    _MIN_RATE_FRACTION = 0.05
+    # Fraction of configured rate regained per successful request
+    _RECOVERY_FRACTION = 0.02
+
+    def __init__(self, rate, burst):
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+
+    def configure(self, rate, burst):
+        with self._lock:
+            self.configured_rate = float(rate)
+            self.burst = max(float(burst), 1.0)
+            self.rate = self.configured_rate
+            self.tokens = self.burst
+            self.last = _time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    def reserve(self):
+        """
+        Take a token, returning how many seconds caller must wait before sending.
+        Tokens can go negative, so concurrent callers queue up behind each other.
+        """
+        with self._lock:
+            self._refill(_time.monotonic())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def penalise(self):
+        with self._lock:
+            self._refill(_time.monotonic())
+            self.rate = max(self.rate * 0.5, self.configured_rate * self._MIN_RATE_FRACTION)
+            self.tokens = min(self.tokens, 0.0)
+
+    def reward(self):
+        if self.rate >= self.configured_rate:
+            return
+        with self._lock:
+            self._refill(_time.monotonic())
+            self.rate = min(self.configured_rate, self.rate + self.configured_rate * self._RECOVERY_FRACTION)
+
+
+class RateLimiter:
+    """
+    Process-wide pacing of requests to Yahoo, one token bucket per host.
+    Configured via yf.config.network.rate_limit (requests/second, None = disabled)
+    and yf.config.network.rate_limit_burst.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _get_bucket(self, url):
+        rate = YfConfig.network.rate_limit
+        if not rate:
+            return None
+        burst = YfConfig.network.rate_limit_burst or 1
+        host = urlsplit(url).hostname
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    bucket = _TokenBucket(rate, burst)
+                    self._buckets[host] = bucket
+        elif bucket.configured_rate != rate or bucket.burst != max(burst, 1):
+            bucket.configure(rate, burst)
+        return bucket
+
+    def acquire(self, url):
+        bucket = self._get_bucket(url)
+        if bucket is None:
+            return
+        delay = bucket.reserve()
+        if delay > 0:
+            _time.sleep(delay)
+
+    async def acquire_async(self, url):
+        bucket = self._get_bucket(url)
+        if bucket is None:
+            return
+        delay = bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_response(self, url, status_code):
+        bucket = self._get_bucket(url)
+        if bucket is None:
+            return
+        if status_code == 429:
+            bucket.penalise()
+        elif status_code < 400:
+            bucket.reward()
+
+    def stats(self):
+        """
+        Current requests/second allowed per host.
+        """
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    def reset(self):
+        with self._lock:
+            self._buckets = {}
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter():
+    return _rate_limiter
@@ -1,5 +1,4 @@
 import datetime
-import json
 import warnings
 
 import pandas as pd
@@ -121,8 +120,7 @@ class Financials:
         url += f"&period1={int(start_dt.timestamp())}&period2={int(end.timestamp())}"
 
         # Step 3: fetch and reshape data
-        json_str = self._data.cache_get(url=url).text
-        json_data = json.loads(json_str)
+        json_data = utils.response_json(self._data.cache_get(url=url))
         data_raw = json_data["timeseries"]["result"]
         # data_raw = [v for v in data_raw if len(v) > 1] # Discard keys with no data
         for d in data_raw:
@@ -1,4 +1,5 @@
-from curl_cffi import requests
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from math import isclose
 import bisect
 import datetime as _datetime
@@ -9,9 +10,10 @@ import pandas as pd
 import time as _time
 import warnings
 
-from yfinance import shared, utils
+from yfinance import cache, utils
 from yfinance.config import YfConfig
-from yfinance.const import _BASE_URL_, _PRICE_COLNAMES_, _SENTINEL_
+from yfinance.data import AsyncYfData
+from yfinance.const import _BASE_URL_, _INTRADAY_MAX_LOOKBACK_, _INTRADAY_MAX_WINDOW_, _PRICE_COLNAMES_, _SENTINEL_
 from yfinance.exceptions import YFDataException, YFInvalidPeriodError, YFPricesMissingError, YFRateLimitError, YFTzMissingError
 
 class PriceHistory:
@@ -26,7 +28,7 @@ class PriceHistory:
                 stacklevel=5,
             )
             self._data._set_proxy(proxy)
-        self.session = session or requests.Session(impersonate="chrome")
+        self.session = session
 
         self._history_cache = {}
         self._history_metadata = None
@@ -36,6 +38,126 @@ class PriceHistory:
         self._reconstruct_start_interval = None
 
     def _fetch_data(self, params, timeout, _no_cache):
+        windows = self._split_windows(params, self.ticker)
+        if len(windows) == 1:
+            return self._fetch_window(windows[0], timeout, _no_cache)
+        with ThreadPoolExecutor(max_workers=min(len(windows), YfConfig.network.max_connections or 10)) as executor:
+            results = list(executor.map(lambda p: self._fetch_window(p, timeout, _no_cache), windows))
+        return self._stitch_windows(windows, results)
+
+    async def _fetch_data_async(self, params, timeout):
+        windows = self._split_windows(params, self.ticker)
+        if len(windows) == 1:
+            return await self._fetch_window_async(windows[0], timeout)
+        results = await asyncio.gather(*[self._fetch_window_async(p, timeout) for p in windows])
+        return self._stitch_windows(windows, results)
+
+    @staticmethod
+    def _split_windows(params, ticker=None):
+        # Split an intraday time range longer than Yahoo allows into consecutive windows
+        max_window = _INTRADAY_MAX_WINDOW_.get(params["interval"])
+        if max_window is not None and params.get("range") not in (None, "ytd", "max"):
+            # Period too long for one request, so convert to start & end
+            end = int(_time.time())
+            start = int((pd.Timestamp(end, unit="s") - utils._interval_to_timedelta(params["range"])).timestamp())
+            if end - start > max_window:
+                params = {k: v for k, v in params.items() if k != "range"}
+                params["period1"], params["period2"] = start, end
+        start, end = params.get("period1"), params.get("period2")
+        lookback = _INTRADAY_MAX_LOOKBACK_.get(params["interval"])
+        if lookback is not None and start is not None and end is not None:
+            # Yahoo rejects windows starting further back, so don't request them
+            earliest = int(_time.time()) - lookback + 5  # allow for processing time
+            if start < earliest < end:
+                if earliest - start > 60:
+                    # Not just period='max' resolved a moment ago
+                    utils.get_yf_logger().warning(
+                        f'{ticker}: {params["interval"]} data not available for startTime={start}. '
+                        f'The requested range must be within the last {lookback // 86400} days, '
+                        f'fetching from {pd.Timestamp(earliest, unit="s").tz_localize("UTC")}')
+                params = dict(params)
+                params["period1"] = start = earliest
+        if max_window is None or start is None or end is None or end - start <= max_window:
+            return [params]
+        windows = []
+        while start < end:
+            window = dict(params)
+            window["period1"], window["period2"] = start, min(start + max_window, end)
+            windows.append(window)
+            start = window["period2"]
+        return windows
+
+    @staticmethod
+    def _stitch_windows(windows, results):
+        # Combine chart JSON of consecutive windows into one chart JSON.
+        # Windows beyond Yahoo's lookback return errors, ignore those.
+        for r in results:
+            if isinstance(r, Exception):
+                return r
+        parts = []
+        for i, r in enumerate(results):
+            try:
+                result = r["chart"]["result"][0]
+            except (KeyError, IndexError, TypeError):
+                continue
+            if result and "timestamp" in result:
+                parts.append((windows[i], result))
+        if len(parts) == 0:
+            return results[-1]
+        if len(parts) == 1:
+            return {"chart": {"result": [parts[0][1]], "error": None}}
+
+        ts, quotes, adjclose, events = [], [], [], {}
+        for i, (window, result) in enumerate(parts):
+            n = len(result["timestamp"])
+            ts_i = np.asarray(result["timestamp"], dtype=np.int64)
+            if i < len(parts) - 1:
+                # Yahoo may append the live price after window end
+                keep = np.flatnonzero(ts_i < window["period2"])
+            else:
+                keep = np.arange(n)
+            ts.append(ts_i[keep])
+            quote = result["indicators"]["quote"][0]
+            quotes.append({k: np.asarray(quote[k], dtype=object)[keep] for k in quote if len(quote[k]) == n})
+            if "adjclose" in result["indicators"]:
+                adjclose.append(np.asarray(result["indicators"]["adjclose"][0]["adjclose"], dtype=object)[keep])
+            for k, v in result.get("events", {}).items():
+                events.setdefault(k, {}).update(v)
+
+        # Duplicate timestamps at window boundaries: keep the later window's
+        ts_all = np.concatenate(ts)
+        _, last = np.unique(ts_all[::-1], return_index=True)
+        keep = len(ts_all) - 1 - last
+
+        result = dict(parts[-1][1])
+        result["meta"] = dict(result["meta"])
+        tps = [r["meta"]["tradingPeriods"] for _, r in parts if "tradingPeriods" in r["meta"]]
+        if tps:
+            result["meta"]["tradingPeriods"] = PriceHistory._stitch_trading_periods(tps)
+        result["timestamp"] = ts_all[keep].tolist()
+        keys = set.intersection(*[set(q) for q in quotes])
+        indicators = {"quote": [{k: np.concatenate([q[k] for q in quotes])[keep].tolist() for k in keys}]}
+        if len(adjclose) == len(parts):
+            indicators["adjclose"] = [{"adjclose": np.concatenate(adjclose)[keep].tolist()}]
+        result["indicators"] = indicators
+        result["events"] = events
+        return {"chart": {"result": [result], "error": None}}
+
+    @staticmethod
+    def _stitch_trading_periods(tps):
+        # tradingPeriods is a list of days, or dict of such lists for pre/regular/post
+        def merge(days_lists):
+            merged = {}
+            for days in days_lists:
+                for day in days:
+                    if day:
+                        merged[day[0]["start"]] = day
+            return [merged[k] for k in sorted(merged)]
+        if all(isinstance(t, dict) for t in tps):
+            return {k: merge([t.get(k, []) for t in tps]) for k in tps[-1]}
+        return merge([t for t in tps if isinstance(t, list)])
+
+    def _fetch_window(self, params, timeout, _no_cache):
         get_fn = self._data.get
         if not _no_cache and "period2" in params:
             end_dt_utc = pd.Timestamp(params["period2"], unit="s").tz_localize("UTC")
@@ -46,7 +168,17 @@ class PriceHistory:
             data = get_fn(url=url, params=params, timeout=timeout)
             if "Will be right back" in data.text or data is None:
                 raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
-            return data.json()
+            return utils.response_json(data)
+        except Exception as e:
+            return e
+
+    async def _fetch_window_async(self, params, timeout):
+        url = f"{_BASE_URL_}/v8/finance/chart/{self.ticker}"
+        try:
+            data = await AsyncYfData().get(url=url, params=params, timeout=timeout)
+            if data is None or "Will be right back" in data.text:
+                raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
+            return utils.response_json(data)
         except Exception as e:
             return e
 
@@ -68,6 +200,7 @@ class PriceHistory:
         timeout=10,
         raise_errors=False,
         max_retries=5,
+        store=False,
         _no_cache=False,
         _retry=True,
     ) -> pd.DataFrame:
@@ -79,7 +212,8 @@ class PriceHistory:
               | Can combine with start/end e.g. end = start + period
             interval : str
               | Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
-              | Intraday data cannot extend last 60 days
+              | Intraday data cannot extend last 60 days (1m: 30 days)
+              | Ranges longer than one request allows are fetched in windows
             start : str
               | Download start date string (YYYY-MM-DD) or _datetime, inclusive.
               | Default: 99 years ago
@@ -116,19 +250,370 @@ class PriceHistory:
                 completely missing price data and when refetching yearly
                 blocks of data.
                 Default: 5
+            store : bool
+                If True, keep prices in a local store under the cache folder,
+                and only fetch the date ranges it doesn't have yet.
+                Stored prices are re-adjusted when new dividends & splits appear.
+                Default: False
+        """
+        ctx = self._prepare_history(period, interval, start, end, prepost, actions, auto_adjust,
+                                    back_adjust, repair, keepna, proxy, rounding, raise_errors, _retry)
+        if ctx is None:
+            return utils.empty_df()
+
+        cache_key, ttl = (None, 0) if _no_cache else self._history_cache_key(ctx)
+        if ttl != 0:
+            hit = cache.get_history_cache().lookup(cache_key)
+            if hit is not None:
+                df, self._history_metadata = hit
+                return df
+
+        if store:
+            df = self._history_from_store(ctx, timeout)
+        else:
+            # Getting data from json
+            data = self._fetch_data(ctx['params'], timeout, _no_cache)
+            df = self._process_history(data, ctx)
+        if ttl != 0:
+            self._cache_history(cache_key, df, ttl)
+        return df
+
+    async def history_async(
+        self,
+        period=None,
+        interval="1d",
+        start=None,
+        end=None,
+        prepost=False,
+        actions=True,
+        auto_adjust=True,
+        back_adjust=False,
+        repair=False,
+        keepna=False,
+        rounding=False,
+        timeout=10,
+        raise_errors=False,
+        _retry=True,
+    ) -> pd.DataFrame:
+        """
+        Awaitable version of history(), fetches prices with AsyncYfData.
+        Parameters same as history().
+        """
+        ctx = self._prepare_history(period, interval, start, end, prepost, actions, auto_adjust,
+                                    back_adjust, repair, keepna, _SENTINEL_, rounding, raise_errors, _retry)
+        if ctx is None:
+            return utils.empty_df()
+
+        cache_key, ttl = self._history_cache_key(ctx)
+        if ttl != 0:
+            hit = cache.get_history_cache().lookup(cache_key)
+            if hit is not None:
+                df, self._history_metadata = hit
+                return df
+
+        data = await self._fetch_data_async(ctx['params'], timeout)
+        if repair:
+            # Repair can trigger more fetches (blocking), so keep it off the event loop
+            df = await asyncio.to_thread(self._process_history, data, ctx)
+        else:
+            df = self._process_history(data, ctx)
+        if ttl != 0:
+            self._cache_history(cache_key, df, ttl)
+        return df
+
+    def _history_cache_key(self, ctx):
+        # Key & seconds to keep 'ctx' result in the process-wide history cache.
+        # TTL None = forever, 0 = don't cache.
+        if not YfConfig.cache.history:
+            return None, 0
+        ttls = YfConfig.cache.history_ttl or {}
+        # Same condition as for cache_get: range ended over 30 minutes ago
+        closed = ctx['end_user'] is not None and ctx['end'] + 30 * 60 <= _time.time()
+        state = 'closed' if closed else 'open'
+        if state not in ttls:
+            return None, 0
+        key = (self.ticker, ctx['interval_user'], ctx['period_user'],
+               ctx['start'] if ctx['start_user'] is not None else None,
+               ctx['end'] if ctx['end_user'] is not None else None,
+               ctx['prepost'], ctx['actions'], ctx['auto_adjust'], ctx['back_adjust'],
+               ctx['repair'], ctx['keepna'], ctx['rounding'])
+        return key, ttls[state]
+
+    def _cache_history(self, key, df, ttl):
+        if df.empty:
+            # Probably failed, try again next time
+            return
+        max_bytes = YfConfig.cache.history_max_mb
+        if max_bytes is not None:
+            max_bytes = int(max_bytes * 1024 * 1024)
+        cache.get_history_cache().store(key, df, self._history_metadata, ttl, max_bytes)
+
+    def _history_from_store(self, ctx, timeout):
+        # Serve 'ctx' request from the price store, fetching only what it lacks.
+        # Bars are stored as fetched with auto_adjust=False, so can apply any
+        # adjustment after. Each fetch overlaps 1 stored bar, to check it agrees.
+        logger = utils.get_yf_logger()
+        price_store = cache.get_price_store()
+        interval = ctx['interval']
+        key = f"{self.ticker}|{interval}|prepost={int(ctx['prepost'])}|repair={int(ctx['repair'])}"
+        start, end = self._store_range(ctx)
+        # Bars that can still change are fetched but not stored
+        now = pd.Timestamp.now('UTC')
+        settled = min(end, int((now - utils._interval_to_timedelta(interval)).timestamp()))
+
+        def fetch(fetch_start, fetch_end):
+            kwargs = dict(interval=interval, start=fetch_start, end=fetch_end, prepost=ctx['prepost'],
+                          actions=True, auto_adjust=False, back_adjust=False, repair=ctx['repair'],
+                          keepna=True, timeout=timeout, _retry=ctx['_retry'])
+            if ctx['raise_errors']:
+                kwargs['raise_errors'] = True
+            df = self.history(**kwargs)
+            if not df.empty and not pd.api.types.is_numeric_dtype(df["Dividends"]):
+                # Dividends in another currency, can't store
+                return None
+            return df
+
+        stored = price_store.lookup(key)
+        fresh = None
+        if stored is not None and start < stored['start']:
+            fetch_end = stored['start'] if stored['first'] is None else stored['first'] + 1
+            df = fetch(start, fetch_end)
+            if df is None:
+                return self._history_unstored(ctx, timeout)
+            if not df.empty:
+                if stored['first'] is not None and not self._agrees_with_store(df, price_store.read(key, stored['first'], stored['first'] + 1)):
+                    # Yahoo has adjusted for actions the store hasn't seen, so start again
+                    logger.debug(f'{self.ticker}: price store out of date, refetching')
+                    price_store.delete(key)
+                    stored = None
+                else:
+                    self._save_to_store(price_store, key, df, start, stored['end'], stored)
+                    stored = price_store.lookup(key)
+                    fresh = df
+
+        if stored is None:
+            df = fetch(start, end)
+            if df is None:
+                return self._history_unstored(ctx, timeout)
+            if not df.empty and settled > start:
+                self._save_to_store(price_store, key, df, start, settled, None)
+            fresh = df
+        elif end > stored['end']:
+            fetch_start = stored['end'] if stored['last'] is None else stored['last']
+            df = fetch(fetch_start, end)
+            if df is None:
+                return self._history_unstored(ctx, timeout)
+            if not df.empty:
+                new = df[df.index.as_unit('s').asi8 > stored['last']] if stored['last'] is not None else df
+                new_actions = new.index[(new["Dividends"] != 0) | (new["Stock Splits"] != 0)]
+                if len(new_actions) > 0:
+                    before = df[df.index < new_actions[0]]
+                    div_ratio = (before["Adj Close"] / before["Close"]).iloc[-1] if not before.empty else np.nan
+                    if not np.isfinite(div_ratio):
+                        logger.debug(f'{self.ticker}: new corporate actions but cannot rebase store, refetching')
+                        price_store.delete(key)
+                        return self._history_from_store(ctx, timeout)
+                    splits = new["Stock Splits"]
+                    split_ratio = splits[splits != 0].prod()
+                    logger.debug(f'{self.ticker}: rebasing stored prices for new actions: split ratio={split_ratio} dividend ratio={div_ratio}')
+                    price_store.rebase(key, int(df.index[0].timestamp()), split_ratio, div_ratio)
+                self._save_to_store(price_store, key, df, stored['start'], max(stored['end'], settled), stored)
+            fresh = df
+
+        stored = price_store.lookup(key)
+        df = self._read_store(price_store, key, start, end, stored)
+        if fresh is not None and not fresh.empty:
+            # Add bars not stored yet
+            ts = fresh.index.as_unit('s').asi8
+            unsettled = fresh[(ts >= (stored['end'] if stored is not None else start)) & (ts < end)]
+            if not unsettled.empty:
+                unsettled = unsettled.reindex(columns=df.columns)
+                df = unsettled if df.empty else pd.concat([df, unsettled])
+        if df.empty:
+            return utils.empty_df()
+        price_hint = stored['price_hint'] if stored is not None else self._price_hint()
+        return self._finalise_history(df, ctx, price_hint)
+
+    def _history_unstored(self, ctx, timeout):
+        data = self._fetch_data(ctx['params'], timeout, False)
+        return self._process_history(data, ctx)
+
+    def _store_range(self, ctx):
+        # Resolve 'ctx' request into [start, end) Unix timestamps
+        start, end = ctx['start'], ctx['end']
+        if end is None:
+            end = int(_time.time())
+        if start is None:
+            period = ctx['period']
+            end_dt = pd.Timestamp(end, unit='s', tz='UTC').tz_convert(self.tz)
+            if period == 'ytd':
+                start_dt = pd.Timestamp(end_dt.year, 1, 1).tz_localize(self.tz)
+            else:
+                start_dt = end_dt - utils._interval_to_timedelta(period)
+            start = int(start_dt.timestamp())
+        return start, end
+
+    @staticmethod
+    def _agrees_with_store(df, rows):
+        # Check fetched bar matches stored bar, i.e. both adjusted for same actions
+        if not rows:
+            return True
+        ts, close, adjclose = rows[0][0], rows[0][4], rows[0][5]
+        fetched = df[df.index.as_unit('s').asi8 == ts]
+        if fetched.empty:
+            return True
+        return bool(np.isclose(fetched["Close"].iloc[0], close, rtol=1e-9, equal_nan=True) and
+                    np.isclose(fetched["Adj Close"].iloc[0], adjclose, rtol=1e-9, equal_nan=True))
+
+    def _save_to_store(self, price_store, key, df, start, end, stored):
+        ts = df.index.as_unit('s').asi8
+        df = df[ts < end]
+        ts = ts[ts < end]
+        capital_gains = "Capital Gains" in df.columns or (stored is not None and stored['capital_gains'])
+        none = [None] * len(df)
+
+        def column(name):
+            if name not in df.columns:
+                return none
+            values = df[name].astype(object)
+            return values.where(df[name].notna(), None).tolist()
+
+        rows = list(zip(ts.tolist(), column("Open"), column("High"), column("Low"), column("Close"),
+                        column("Adj Close"), column("Volume"), column("Dividends"), column("Stock Splits"),
+                        column("Capital Gains"), column("Repaired?")))
+        price_store.store(key, rows, start, end, self._price_hint(), capital_gains)
+
+    def _read_store(self, price_store, key, start, end, stored):
+        rows = price_store.read(key, start, end)
+        index = pd.to_datetime(np.array([r[0] for r in rows], dtype=np.int64), unit='s', utc=True)
+        # None = NULL becomes NaN
+        values = np.array([r[1:10] for r in rows], dtype=np.float64).reshape(len(rows), 9)
+        df = pd.DataFrame(values, index=index.tz_convert(self.tz),
+                          columns=_PRICE_COLNAMES_ + ['Volume', 'Dividends', 'Stock Splits', 'Capital Gains'])
+        df['Volume'] = df['Volume'].fillna(0).astype(np.int64)
+        if stored is None or not stored['capital_gains']:
+            df = df.drop(columns='Capital Gains')
+        if '|repair=1' in key:
+            df['Repaired?'] = np.array([bool(r[10]) for r in rows], dtype=bool)
+        return df
+
+    def history_update(
+        self,
+        df,
+        interval="1d",
+        prepost=False,
+        actions=True,
+        auto_adjust=True,
+        back_adjust=False,
+        repair=False,
+        keepna=False,
+        rounding=False,
+        timeout=10,
+        raise_errors=False,
+    ) -> pd.DataFrame:
+        """
+        Extend 'df', a previous history() result, with the prices since its
+        last row. Only that tail is fetched, starting at the last row because
+        it may have been incomplete. If new dividends or splits appeared, the
+        existing rows are re-adjusted for them.
+        Parameters same as history(), and must match those 'df' was fetched with.
         """
+        kwargs = dict(interval=interval, prepost=prepost, repair=repair, keepna=keepna, timeout=timeout)
+        if raise_errors:
+            kwargs['raise_errors'] = True
+        if df is None or df.empty:
+            return self.history(period="max", actions=actions, auto_adjust=auto_adjust,
+                                back_adjust=back_adjust, rounding=rounding, **kwargs)
+        logger = utils.get_yf_logger()
+
+        index = df.index
+        if index.tz is None:
+            index = index.tz_localize(self.tz)
+        last = index[-1]
+
+        # Fetch unadjusted, to get adjustment ratio for any new dividends
+        tail = self.history(start=last, actions=True, auto_adjust=False, back_adjust=False, **kwargs)
+        if tail.empty:
+            return df.copy()
+
+        new = tail[tail.index > last]
+        new_actions = new.index[(new["Dividends"] != 0) | (new["Stock Splits"] != 0)]
+        old = df[index < tail.index[0]]
+        if len(new_actions) > 0:
+            # Yahoo adjusts every row before a dividend by the same ratio,
+            # so any tail row before the first new action gives the ratio.
+            before = tail[tail.index < new_actions[0]]
+            div_ratio = (before["Adj Close"] / before["Close"]).iloc[-1] if not before.empty else np.nan
+            if not np.isfinite(div_ratio):
+                logger.debug(f'{self.ticker}: new corporate actions but cannot rebase, fetching all')
+                full = self.history(start=index[0], actions=actions, auto_adjust=auto_adjust,
+                                    back_adjust=back_adjust, rounding=rounding, **kwargs)
+                if df.index.tz is None:
+                    full.index = full.index.tz_localize(None)
+                return full
+            splits = new["Stock Splits"]
+            split_ratio = splits[splits != 0].prod()
+            logger.debug(f'{self.ticker}: rebasing existing prices for new actions: split ratio={split_ratio} dividend ratio={div_ratio}')
+            old = self._rebase_prices(old, split_ratio, div_ratio, auto_adjust, back_adjust, rounding)
+
+        if auto_adjust:
+            tail = utils.auto_adjust(tail)
+        elif back_adjust:
+            tail = utils.back_adjust(tail)
+        if rounding:
+            price_colnames = [c for c in _PRICE_COLNAMES_ if c in tail.columns]
+            tail[price_colnames] = np.round(tail[price_colnames], self._price_hint())
+        if not actions:
+            tail = tail.drop(columns=["Dividends", "Stock Splits", "Capital Gains"], errors='ignore')
+        if df.index.tz is None:
+            tail.index = tail.index.tz_localize(None)
+        else:
+            tail.index = tail.index.tz_convert(df.index.tz)
+
+        return pd.concat([old, tail])
+
+    def _rebase_prices(self, df, split_ratio, div_ratio, auto_adjust, back_adjust, rounding):
+        # Re-adjust existing prices for splits & dividends that happened after them
+        df = df.copy()
+        price_colnames = [c for c in _PRICE_COLNAMES_ if c in df.columns]
+        df[price_colnames] = df[price_colnames] / split_ratio
+        if auto_adjust:
+            div_colnames = ['Open', 'High', 'Low', 'Close']
+        elif back_adjust:
+            div_colnames = ['Open', 'High', 'Low']
+        else:
+            div_colnames = ['Adj Close']
+        div_colnames = [c for c in div_colnames if c in df.columns]
+        df[div_colnames] = df[div_colnames] * div_ratio
+        if rounding:
+            df[price_colnames] = np.round(df[price_colnames], self._price_hint())
+        if 'Volume' in df.columns:
+            df['Volume'] = (df['Volume'] * split_ratio).round().astype(np.int64)
+        if 'Dividends' in df.columns:
+            df['Dividends'] = df['Dividends'] / split_ratio
+        return df
+
+    def _price_hint(self):
+        if self._history_metadata and 'priceHint' in self._history_metadata:
+            return self._history_metadata['priceHint']
+        return 2
+
+    def _prepare_history(self, period, interval, start, end, prepost, actions, auto_adjust,
+                         back_adjust, repair, keepna, proxy, rounding, raise_errors, _retry):
+        # Resolve user arguments into Yahoo chart parameters. Returns None if
+        # request cannot be made, else a dict of state for _process_history().
         logger = utils.get_yf_logger()
 
         if proxy is not _SENTINEL_:
             warnings.warn(
                 "Set proxy via new config function: yf.set_config(proxy=proxy)",
                 DeprecationWarning,
-                stacklevel=5,
+                stacklevel=6,
             )
             self._data._set_proxy(proxy)
 
         if raise_errors:
-            warnings.warn("'raise_errors' deprecated, do: yf.config.debug.hide_exceptions = False", DeprecationWarning, stacklevel=5)
+            warnings.warn("'raise_errors' deprecated, do: yf.config.debug.hide_exceptions = False", DeprecationWarning, stacklevel=6)
 
         interval_user = interval
         period_user = period
@@ -143,13 +628,11 @@ class PriceHistory:
                     # Every valid ticker has a timezone. A missing timezone is a problem.
                     _exception = YFTzMissingError(self.ticker)
                     err_msg = str(_exception)
-                    shared._DFS[self.ticker] = utils.empty_df()
-                    shared._ERRORS[self.ticker] = err_msg.split(': ', 1)[1]
                     if raise_errors or (not YfConfig.debug.hide_exceptions):
                         raise _exception
                     else:
                         logger.error(err_msg)
-                    return utils.empty_df()
+                    return None
                 if period == 'ytd':
                     start = _datetime.date(pd.Timestamp.utcnow().tz_convert(tz).year, 1, 1)
                 else:
@@ -169,13 +652,11 @@ class PriceHistory:
                 # Every valid ticker has a timezone. A missing timezone is a problem.
                 _exception = YFTzMissingError(self.ticker)
                 err_msg = str(_exception)
-                shared._DFS[self.ticker] = utils.empty_df()
-                shared._ERRORS[self.ticker] = err_msg.split(': ', 1)[1]
                 if raise_errors or (not YfConfig.debug.hide_exceptions):
                     raise _exception
                 else:
                     logger.error(err_msg)
-                return utils.empty_df()
+                return None
 
         if start:
             start_dt = utils._parse_user_dt(start, tz)
@@ -200,7 +681,7 @@ class PriceHistory:
                     end = int(_time.time())
                 if start is None:
                     if interval == "1m":
-                        start = end - 691200  # 8 days
+                        start = end - 2592000  # 30 days, fetched in 8-day windows
                     elif interval in ("2m", "5m", "15m", "30m", "90m"):
                         start = end - 5184000  # 60 days
                     elif interval in ("1h", "60m"):
@@ -246,8 +727,28 @@ class PriceHistory:
         if end is not None and end_dt is None:
             end_dt = pd.Timestamp(end, unit="s").tz_localize("UTC")
 
-        # Getting data from json
-        data = self._fetch_data(params, timeout, _no_cache)
+        return {
+            'params': params, 'tz': tz,
+            'period': period, 'period_user': period_user,
+            'interval': interval, 'interval_user': interval_user,
+            'start': start, 'start_user': start_user,
+            'end': end, 'end_user': end_user, 'end_dt': end_dt,
+            'prepost': prepost, 'actions': actions,
+            'auto_adjust': auto_adjust, 'back_adjust': back_adjust,
+            'repair': repair, 'keepna': keepna, 'rounding': rounding,
+            'raise_errors': raise_errors, '_retry': _retry,
+        }
+
+    def _process_history(self, data, ctx):
+        # Parse & clean the chart JSON fetched for request described by 'ctx'
+        logger = utils.get_yf_logger()
+
+        params, tz = ctx['params'], ctx['tz']
+        period, interval = ctx['period'], ctx['interval']
+        start, start_user = ctx['start'], ctx['start_user']
+        end, end_user, end_dt = ctx['end'], ctx['end_user'], ctx['end_dt']
+        prepost, repair, raise_errors = ctx['prepost'], ctx['repair'], ctx['raise_errors']
+
         if isinstance(data, Exception):
             if raise_errors or (not YfConfig.debug.hide_exceptions):
                 raise data
@@ -302,8 +803,6 @@ class PriceHistory:
 
         if fail:
             err_msg = str(_exception)
-            shared._DFS[self.ticker] = utils.empty_df()
-            shared._ERRORS[self.ticker] = err_msg.split(': ', 1)[1]
             if raise_errors or (not YfConfig.debug.hide_exceptions):
                 raise _exception
             else:
@@ -501,6 +1000,29 @@ class PriceHistory:
             df = self._fix_zeroes(df, interval, tz_exchange, prepost)
             df = df.sort_index()
 
+        df = self._finalise_history(df, ctx, self._price_hint())
+
+        if df.empty:
+            msg = f'{self.ticker}: yfinance returning OHLC: EMPTY'
+        elif len(df) == 1:
+            msg = f'{self.ticker}: yfinance returning OHLC: {df.index[0]} only'
+        else:
+            msg = f'{self.ticker}: yfinance returning OHLC: {df.index[0]} -> {df.index[-1]}'
+        logger.debug(msg)
+
+        if self._reconstruct_start_interval is not None and self._reconstruct_start_interval == interval:
+            self._reconstruct_start_interval = None
+        return df
+
+    def _finalise_history(self, df, ctx, price_hint):
+        # Adjust & clean parsed prices as requested in 'ctx'
+        logger = utils.get_yf_logger()
+        interval, interval_user, period_user = ctx['interval'], ctx['interval_user'], ctx['period_user']
+        actions, keepna, rounding = ctx['actions'], ctx['keepna'], ctx['rounding']
+        auto_adjust, back_adjust = ctx['auto_adjust'], ctx['back_adjust']
+        raise_errors, _retry = ctx['raise_errors'], ctx['_retry']
+        intraday = ctx['params']["interval"][-1] in ("m", 'h')
+
         # Auto/back adjust
         try:
             if auto_adjust:
@@ -508,18 +1030,17 @@ class PriceHistory:
             elif back_adjust:
                 df = utils.back_adjust(df)
         except Exception as e:
+            # download() sets raise_errors, recording this in its error summary
             if raise_errors or (not YfConfig.debug.hide_exceptions):
                 raise
             if auto_adjust:
                 err_msg = "auto_adjust failed with %s" % e
             else:
                 err_msg = "back_adjust failed with %s" % e
-            shared._DFS[self.ticker] = utils.empty_df()
-            shared._ERRORS[self.ticker] = err_msg
             logger.error('%s: %s' % (self.ticker, err_msg))
 
         if rounding:
-            df = np.round(df, data["chart"]["result"][0]["meta"]["priceHint"])
+            df = np.round(df, price_hint)
         df['Volume'] = df['Volume'].fillna(0).astype(np.int64)
 
         if intraday:
@@ -542,16 +1063,6 @@ class PriceHistory:
         if interval != interval_user:
             df = self._resample(df, interval, interval_user, period_user)
 
-        if df.empty:
-            msg = f'{self.ticker}: yfinance returning OHLC: EMPTY'
-        elif len(df) == 1:
-            msg = f'{self.ticker}: yfinance returning OHLC: {df.index[0]} only'
-        else:
-            msg = f'{self.ticker}: yfinance returning OHLC: {df.index[0]} -> {df.index[-1]}'
-        logger.debug(msg)
-
-        if self._reconstruct_start_interval is not None and self._reconstruct_start_interval == interval:
-            self._reconstruct_start_interval = None
         return df
 
     def _get_history_cache(self, period="max", interval="1d") -> pd.DataFrame:
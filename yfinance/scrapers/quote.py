@@ -707,8 +707,7 @@ class Quote:
             end = int(end.timestamp())
             url += f"&period1={start}&period2={end}"
 
-            json_str = self._data.cache_get(url=url).text
-            json_data = json.loads(json_str)
+            json_data = utils.response_json(self._data.cache_get(url=url))
             json_result = json_data.get("timeseries") or json_data.get("finance")
             if json_result["error"] is not None:
                 raise YFException("Failed to parse json response from Yahoo Finance: " + str(json_result["error"]))
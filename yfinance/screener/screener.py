@@ -4,8 +4,8 @@ import warnings
 from json import dumps
 
 from yfinance.const import _QUERY1_URL_
-from yfinance.data import YfData
-from ..utils import dynamic_docstring, generate_list_table_from_dict_universal
+from yfinance.data import YfData, AsyncYfData
+from ..utils import dynamic_docstring, generate_list_table_from_dict_universal, response_json
 
 from .query import EquityQuery as EqyQy
 from .query import FundQuery as FndQy
@@ -113,7 +113,37 @@ def screen(query: Union[str, EquityQuery, FundQuery],
     """
 
     _data = YfData(session=session)
+    request = _build_screen_request(query, offset, size, count, sortField, sortAsc, userId, userIdType)
+    if request['data'] is None:
+        response = _data.get(url=request['url'], params=request['params'])
+    else:
+        response = _data.post(request['url'], data=request['data'], params=request['params'])
+    return _parse_screen_response(response, request['predefined'])
+
+
+async def screen_async(query: Union[str, EquityQuery, FundQuery],
+                       offset: int = None,
+                       size: int = None,
+                       count: int = None,
+                       sortField: str = None,
+                       sortAsc: bool = None,
+                       userId: str = None,
+                       userIdType: str = None,
+                       session = None):
+    """
+    Awaitable version of screen(), for use inside an asyncio event loop.
+    Parameters same as screen(), except session must be a curl_cffi AsyncSession.
+    """
+    _data = AsyncYfData(session=session)
+    request = _build_screen_request(query, offset, size, count, sortField, sortAsc, userId, userIdType)
+    if request['data'] is None:
+        response = await _data.get(url=request['url'], params=request['params'])
+    else:
+        response = await _data.post(request['url'], data=request['data'], params=request['params'])
+    return _parse_screen_response(response, request['predefined'])
 
+
+def _build_screen_request(query, offset, size, count, sortField, sortAsc, userId, userIdType):
     # Only use defaults when user NOT give a predefined, because
     # Yahoo's predefined endpoint auto-applies defaults. Also,
     # that endpoint might be ignoring these fields.
@@ -154,7 +184,7 @@ def screen(query: Union[str, EquityQuery, FundQuery],
         # Switch to Yahoo's predefined endpoint
 
         if size is not None:
-            warnings.warn("Screen 'size' argument is deprecated for predefined screens, set 'count' instead.", DeprecationWarning, stacklevel=2)
+            warnings.warn("Screen 'size' argument is deprecated for predefined screens, set 'count' instead.", DeprecationWarning, stacklevel=3)
             count = size
             size = None
             fields['count'] = fields['size']
@@ -164,14 +194,7 @@ def screen(query: Union[str, EquityQuery, FundQuery],
         for k,v in fields.items():
             if v is not None:
                 params_dict[k] = v
-        resp = _data.get(url=_PREDEFINED_URL_, params=params_dict)
-        try:
-            resp.raise_for_status()
-        except curl_cffi.requests.exceptions.HTTPError:
-            if query not in PREDEFINED_SCREENER_QUERIES:
-                print(f"yfinance.screen: '{query}' is probably not a predefined query.")
-            raise
-        return resp.json()["finance"]["result"][0]
+        return {'url': _PREDEFINED_URL_, 'params': params_dict, 'data': None, 'predefined': query}
 
     elif isinstance(query, QueryBase):
         # Prepare other fields
@@ -197,9 +220,14 @@ def screen(query: Union[str, EquityQuery, FundQuery],
     post_query['query'] = post_query['query'].to_dict()
     data = dumps(post_query, separators=(",", ":"), ensure_ascii=False)
 
-    # Fetch
-    response = _data.post(_SCREENER_URL_, 
-                            data=data, 
-                            params=params_dict)
-    response.raise_for_status()
-    return response.json()['finance']['result'][0]
+    return {'url': _SCREENER_URL_, 'params': params_dict, 'data': data, 'predefined': None}
+
+
+def _parse_screen_response(response, predefined):
+    try:
+        response.raise_for_status()
+    except curl_cffi.requests.exceptions.HTTPError:
+        if predefined is not None and predefined not in PREDEFINED_SCREENER_QUERIES:
+            print(f"yfinance.screen: '{predefined}' is probably not a predefined query.")
+        raise
+    return response_json(response)['finance']['result'][0]
@@ -24,11 +24,14 @@ import json as _json
 from . import utils
 from .config import YfConfig
 from .const import _BASE_URL_
-from .data import YfData
+from .data import YfData, AsyncYfData
 from .exceptions import YFDataException
 
 
 class Search:
+    _data_cls = YfData
+    _search_on_init = True
+
     def __init__(self, query, max_results=8, news_count=8, lists_count=8, include_cb=True, include_nav_links=False,
                  include_research=False, include_cultural_assets=False, enable_fuzzy_query=False, recommended=8,
                  session=None, timeout=30, raise_errors=True):
@@ -51,7 +54,7 @@ class Search:
             raise_errors: Raise exceptions on error (default True).
         """
         self.session = session
-        self._data = YfData(session=self.session)
+        self._data = self._data_cls(session=self.session)
         
         self.query = query
         self.max_results = max_results
@@ -77,10 +80,16 @@ class Search:
         self._research = []
         self._nav = []
 
-        self.search()
+        if self._search_on_init:
+            self.search()
 
     def search(self) -> 'Search':
         """Search using the query parameters defined in the constructor."""
+        url, params = self._build_request()
+        data = self._data.cache_get(url=url, params=params, timeout=self.timeout)
+        return self._process_response(data)
+
+    def _build_request(self):
         url = f"{_BASE_URL_}/v1/finance/search"
         params = {
             "q": self.query,
@@ -98,12 +107,13 @@ class Search:
         }
 
         self._logger.debug(f'{self.query}: Yahoo GET parameters: {str(dict(params))}')
+        return url, params
 
-        data = self._data.cache_get(url=url, params=params, timeout=self.timeout)
+    def _process_response(self, data) -> 'Search':
         if data is None or "Will be right back" in data.text:
             raise YFDataException("*** YAHOO! FINANCE IS CURRENTLY DOWN! ***")
         try:
-            data = data.json()
+            data = utils.response_json(data)
         except _json.JSONDecodeError:
             if not YfConfig.debug.hide_exceptions:
                 raise
@@ -157,3 +167,20 @@ class Search:
     def response(self) -> 'dict':
         """Get the raw response from the search results."""
         return self._response
+
+
+class AsyncSearch(Search):
+    """
+    Awaitable Search, for use inside an asyncio event loop.
+    Construction does not fetch, instead: ``s = await AsyncSearch("AAPL").search()``
+
+    Arguments same as Search, except session must be a curl_cffi AsyncSession.
+    """
+    _data_cls = AsyncYfData
+    _search_on_init = False
+
+    async def search(self) -> 'AsyncSearch':
+        """Search using the query parameters defined in the constructor."""
+        url, params = self._build_request()
+        data = await self._data.get(url=url, params=params, timeout=self.timeout)
+        return self._process_response(data)
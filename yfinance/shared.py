@@ -21,6 +21,8 @@
 
 import threading
 
+# Results of most recent download(), kept for backward compatibility.
+# Each download() call collects into its own multi._DownloadContext.
 _DFS = {}
 _DFS_LOCK = threading.Lock()
 _PROGRESS_BAR = None
@@ -25,6 +25,7 @@ from collections import namedtuple as _namedtuple
 
 import pandas as _pd
 
+from . import utils
 from .base import TickerBase
 from .const import _BASE_URL_
 from .scrapers.funds import FundsData
@@ -45,7 +46,7 @@ class Ticker(TickerBase):
         else:
             url = f"{_BASE_URL_}/v7/finance/options/{self.ticker}?date={date}"
 
-        r = self._data.get(url=url).json()
+        r = utils.response_json(self._data.get(url=url))
         if len(r.get('optionChain', {}).get('result', [])) > 0:
             for exp in r['optionChain']['result'][0]['expirationDates']:
                 self._expirations[_pd.Timestamp(exp, unit='s').strftime('%Y-%m-%d')] = exp
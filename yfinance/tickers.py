@@ -21,7 +21,7 @@
 
 from __future__ import print_function
 
-from . import Ticker, multi
+from . import Ticker, cache, multi, utils
 from .live import WebSocket
 from .data import YfData
 
@@ -82,6 +82,11 @@ class Tickers:
         for symbol in self.symbols:
             self.tickers.get(symbol, {})._history = data[symbol]
 
+        # download() resolved & cached all timezones in bulk, reuse for these Ticker objects
+        for symbol, tz in cache.get_tz_cache().lookup_many(self.symbols).items():
+            if utils.is_valid_timezone(tz):
+                self.tickers[symbol]._tz = tz
+
         if group_by == 'column':
             data.columns = data.columns.swaplevel(0, 1)
             data.sort_index(level=0, axis=1, inplace=True)
@@ -22,6 +22,7 @@
 from __future__ import print_function
 
 import datetime as _datetime
+import json as _json
 import logging
 import re as _re
 import sys as _sys
@@ -157,6 +158,66 @@ class YFLogFormatter(logging.Filter):
         return True
 
 
+def _load_json_decoder(name):
+    if name not in ('auto', 'orjson', 'ujson', 'stdlib'):
+        raise YFException(f"Unknown json_decoder '{name}', choose from 'auto', 'orjson', 'ujson', 'stdlib' or a callable")
+    if name in ('auto', 'orjson'):
+        try:
+            import orjson
+            return orjson.loads
+        except ImportError:
+            if name == 'orjson':
+                raise YFException("json_decoder 'orjson' requires package orjson")
+    if name in ('auto', 'ujson'):
+        try:
+            import ujson
+            return ujson.loads
+        except ImportError:
+            if name == 'ujson':
+                raise YFException("json_decoder 'ujson' requires package ujson")
+    return _json.loads
+
+
+_json_decoders = {}
+
+
+def get_json_decoder():
+    """
+    Return function decoding JSON str/bytes, as configured by yf.config.network.json_decoder
+    """
+    choice = YfConfig.network.json_decoder or 'auto'
+    if callable(choice):
+        return choice
+    decoder = _json_decoders.get(choice)
+    if decoder is None:
+        decoder = _json_decoders[choice] = _load_json_decoder(choice)
+    return decoder
+
+
+def json_loads(data):
+    """
+    Decode JSON with the configured decoder. If a non-stdlib decoder rejects it,
+    retry with stdlib so behaviour & exception types match json.loads.
+    """
+    decoder = get_json_decoder()
+    if decoder is _json.loads:
+        return _json.loads(data)
+    try:
+        return decoder(data)
+    except ValueError:
+        return _json.loads(data)
+
+
+def response_json(response):
+    """
+    Decode body of a Yahoo response, like response.json() but using the configured decoder.
+    """
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, str)):
+        return json_loads(content)
+    return response.json()
+
+
 def get_yf_logger():
     global yf_logger
     global yf_log_indented
@@ -211,6 +272,31 @@ def is_isin(string):
 _PRICE_RE = _re.compile(r"^(open|high|low|close|adj[_\s]?close|price|adjclose)$", _re.I)
 
 
+_ENDPOINT_FAMILIES = (
+    ('/v8/finance/chart/', 'chart'),
+    ('/fundamentals-timeseries/', 'fundamentals-timeseries'),
+    ('/finance/quoteSummary/', 'quoteSummary'),
+    ('/v7/finance/quote', 'quote'),
+    ('/v7/finance/options/', 'options'),
+    ('/v1/finance/search', 'search'),
+    ('/v1/finance/lookup', 'lookup'),
+    ('/finance/screener', 'screener'),
+    ('/finance/visualization', 'calendar'),
+    ('/getcrumb', 'crumb'),
+)
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Classify a Yahoo API URL into a coarse endpoint family, e.g. 'chart' or 'quoteSummary'.
+    Unrecognised URLs are classified as 'other'.
+    """
+    for fragment, family in _ENDPOINT_FAMILIES:
+        if fragment in url:
+            return family
+    return 'other'
+
+
 def _get_price_columns(df: _pd.DataFrame) -> List[str]:
     """Return all columns containing price data.
 
@@ -635,34 +721,36 @@ def back_adjust(data):
     return df[[c for c in col_order if c in df.columns]]
 
 
+def _float_array(values):
+    # JSON list of numbers & None -> float64 array, None becomes NaN
+    return _np.array(values, dtype=_np.float64)
+
+
 def parse_quotes(data):
-    timestamps = data["timestamp"]
+    # Builds frame straight from typed numpy arrays, so pandas doesn't
+    # infer dtypes or copy columns
     ohlc = data["indicators"]["quote"][0]
-    volumes = ohlc["volume"]
-    opens = ohlc["open"]
-    closes = ohlc["close"]
-    lows = ohlc["low"]
-    highs = ohlc["high"]
+    timestamps = _np.array(data["timestamp"], dtype=_np.int64)
 
-    adjclose = closes
+    columns = {c: _float_array(ohlc[c.lower()]) for c in ["Open", "High", "Low", "Close"]}
     if "adjclose" in data["indicators"]:
-        adjclose = data["indicators"]["adjclose"][0]["adjclose"]
-
-    quotes = _pd.DataFrame(
-        {
-            "Open": opens,
-            "High": highs,
-            "Low": lows,
-            "Close": closes,
-            "Adj Close": adjclose,
-            "Volume": volumes,
-        }
-    )
+        columns["Adj Close"] = _float_array(data["indicators"]["adjclose"][0]["adjclose"])
+    else:
+        columns["Adj Close"] = columns["Close"].copy()
+    try:
+        columns["Volume"] = _np.array(ohlc["volume"], dtype=_np.int64)
+    except TypeError:
+        # Missing volumes, keep as NaN
+        columns["Volume"] = _float_array(ohlc["volume"])
 
-    quotes.index = _pd.to_datetime(timestamps, unit="s")
-    quotes.sort_index(inplace=True)
+    if len(timestamps) > 1 and (_np.diff(timestamps) < 0).any():
+        order = _np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[order]
+        columns = {c: v[order] for c, v in columns.items()}
 
-    all_nan = quotes[["Open", "High", "Low", "Close"]].isna().all(axis=1)
+    quotes = _pd.DataFrame(columns, index=_pd.to_datetime(timestamps, unit="s"), copy=False)
+
+    all_nan = _np.isnan(_np.vstack([columns[c] for c in ["Open", "High", "Low", "Close"]])).all(axis=0)
     if all_nan.any():
         logger = get_yf_logger()
         logger.debug(
@@ -672,6 +760,18 @@ def parse_quotes(data):
     return quotes
 
 
+def _parse_events(events, colname, value_fn):
+    # dict of events keyed by timestamp -> 1-column frame, sorted by date
+    events = list(events.values())
+    dates = _np.array([e["date"] for e in events], dtype=_np.int64)
+    values = _np.array([value_fn(e) for e in events], dtype=_np.float64)
+    order = _np.argsort(dates, kind="stable")
+    index = _pd.to_datetime(dates[order], unit="s")
+    index.name = "date"
+    df = _pd.DataFrame({colname: values[order]}, index=index, copy=False)
+    return df, order, events
+
+
 def parse_actions(data):
     dividends = None
     capital_gains = None
@@ -679,31 +779,18 @@ def parse_actions(data):
 
     if "events" in data:
         if "dividends" in data["events"] and len(data["events"]["dividends"]) > 0:
-            dividends = _pd.DataFrame(data=list(data["events"]["dividends"].values()))
-            dividends.set_index("date", inplace=True)
-            dividends.index = _pd.to_datetime(dividends.index, unit="s")
-            dividends.sort_index(inplace=True)
-            if "currency" in dividends.columns and (dividends["currency"] == "").all():
-                # Currency column useless, drop it.
-                dividends = dividends.drop("currency", axis=1)
-            dividends = dividends.rename(columns={"amount": "Dividends"})
+            dividends, order, events = _parse_events(data["events"]["dividends"], "Dividends", lambda e: e["amount"])
+            if any("currency" in e for e in events):
+                currency = _np.array([e.get("currency") for e in events], dtype=object)[order]
+                if not (currency == "").all():
+                    dividends["currency"] = currency
 
         if "capitalGains" in data["events"] and len(data["events"]["capitalGains"]) > 0:
-            capital_gains = _pd.DataFrame(
-                data=list(data["events"]["capitalGains"].values())
-            )
-            capital_gains.set_index("date", inplace=True)
-            capital_gains.index = _pd.to_datetime(capital_gains.index, unit="s")
-            capital_gains.sort_index(inplace=True)
-            capital_gains.columns = ["Capital Gains"]
+            capital_gains, _, _ = _parse_events(data["events"]["capitalGains"], "Capital Gains", lambda e: e["amount"])
 
         if "splits" in data["events"] and len(data["events"]["splits"]) > 0:
-            splits = _pd.DataFrame(data=list(data["events"]["splits"].values()))
-            splits.set_index("date", inplace=True)
-            splits.index = _pd.to_datetime(splits.index, unit="s")
-            splits.sort_index(inplace=True)
-            splits["Stock Splits"] = splits["numerator"] / splits["denominator"]
-            splits = splits[["Stock Splits"]]
+            splits, _, _ = _parse_events(data["events"]["splits"], "Stock Splits",
+                                         lambda e: e["numerator"] / e["denominator"])
 
     if dividends is None:
         dividends = _pd.DataFrame(columns=["Dividends"], index=_pd.DatetimeIndex([]))
@@ -875,6 +962,13 @@ def fix_Yahoo_returning_live_separate(
     return quotes, dropped_row
 
 
+def _index_dates(index):
+    # Calendar dates of DatetimeIndex, in its own timezone, as datetime64[D]
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]')
+
+
 def safe_merge_dfs(df_main, df_sub, interval):
     if df_main.empty:
         return df_main
@@ -890,104 +984,48 @@ def safe_merge_dfs(df_main, df_sub, interval):
         # On some exchanges the event can occur before market open.
         # Problem when combining with intraday data.
         # Solution = use dates, not datetimes, to map/merge.
-        df_main["_date"] = df_main.index.date
-        df_sub["_date"] = df_sub.index.date
-        indices = _np.searchsorted(
-            _np.append(df_main["_date"], [df_main["_date"].iloc[-1] + td]),
-            df_sub["_date"],
-            side="left",
-        )
-        df_main = df_main.drop("_date", axis=1)
-        df_sub = df_sub.drop("_date", axis=1)
-    else:
-        indices = _np.searchsorted(
-            _np.append(df_main.index, df_main.index[-1] + td),
-            df_sub.index,
-            side="right",
-        )
-        indices -= 1  # Convert from [[i-1], [i]) to [[i], [i+1])
-    # Numpy.searchsorted does not handle out-of-range well, so handle manually:
-    if intraday:
-        for i in range(len(df_sub.index)):
-            dt = df_sub.index[i].date()
-            if dt < df_main.index[0].date() or dt >= df_main.index[
-                -1
-            ].date() + _datetime.timedelta(days=1):
-                # Out-of-range
-                indices[i] = -1
-    else:
-        for i in range(len(df_sub.index)):
-            dt = df_sub.index[i]
-            if dt < df_main.index[0] or dt >= df_main.index[-1] + td:
-                # Out-of-range
-                indices[i] = -1
-
-    f_outOfRange = indices == -1
-    if f_outOfRange.any():
-        if intraday:
+        main_dates = _index_dates(df_main.index)
+        sub_dates = _index_dates(df_sub.index)
+        f_outOfRange = (sub_dates < main_dates[0]) | (sub_dates > main_dates[-1])
+        if f_outOfRange.any():
             # Discard out-of-range dividends in intraday data, assume user not interested
             df_sub = df_sub[~f_outOfRange]
             if df_sub.empty:
                 df_main["Dividends"] = 0.0
                 return df_main
-
-            # df_sub changed so recalc indices:
-            df_main['_date'] = df_main.index.date
-            df_sub['_date'] = df_sub.index.date
-            indices = _np.searchsorted(_np.append(df_main['_date'], [df_main['_date'].iloc[-1]+td]), df_sub['_date'], side='left')
-            df_main = df_main.drop('_date', axis=1)
-            df_sub = df_sub.drop('_date', axis=1)
-        else:
-            empty_row_data = {
-                **{c: [_np.nan] for c in const._PRICE_COLNAMES_},
-                "Volume": [0],
-            }
-            if interval == "1d":
-                # For 1d, add all out-of-range event dates
-                for i in _np.where(f_outOfRange)[0]:
-                    dt = df_sub.index[i]
-                    get_yf_logger().debug(
-                        f"Adding out-of-range {data_col} @ {dt.date()} in new prices row of NaNs"
-                    )
-                    empty_row = _pd.DataFrame(data=empty_row_data, index=[dt])
-                    df_main = _pd.concat([df_main, empty_row], sort=True)
-            else:
-                # Else, only add out-of-range event dates if occurring in interval
+            sub_dates = sub_dates[~f_outOfRange]
+        indices = _np.searchsorted(main_dates, sub_dates, side="left")
+    else:
+        def out_of_range(index):
+            return _np.asarray((df_sub.index < index[0]) | (df_sub.index >= index[-1] + td))
+
+        f_outOfRange = out_of_range(df_main.index)
+        if f_outOfRange.any():
+            new_dts = df_sub.index[f_outOfRange]
+            if interval != "1d":
+                # Only add out-of-range event dates if occurring in interval
                 # immediately after last price row
-                last_dt = df_main.index[-1]
-                next_interval_start_dt = last_dt + td
+                next_interval_start_dt = df_main.index[-1] + td
                 next_interval_end_dt = next_interval_start_dt + td
-                for i in _np.where(f_outOfRange)[0]:
-                    dt = df_sub.index[i]
-                    if next_interval_start_dt <= dt < next_interval_end_dt:
-                        get_yf_logger().debug(
-                            f"Adding out-of-range {data_col} @ {dt.date()} in new prices row of NaNs"
-                        )
-                        empty_row = _pd.DataFrame(data=empty_row_data, index=[dt])
-                        df_main = _pd.concat([df_main, empty_row], sort=True)
-            df_main = df_main.sort_index()
-
-            # Re-calculate indices
-            indices = _np.searchsorted(
-                _np.append(df_main.index, df_main.index[-1] + td),
-                df_sub.index,
-                side="right",
-            )
-            indices -= 1  # Convert from [[i-1], [i]) to [[i], [i+1])
-            # Numpy.searchsorted does not handle out-of-range well, so handle manually:
-            for i in range(len(df_sub.index)):
-                dt = df_sub.index[i]
-                if dt < df_main.index[0] or dt >= df_main.index[-1] + td:
-                    # Out-of-range
-                    indices[i] = -1
-
-    f_outOfRange = indices == -1
-    if f_outOfRange.any():
-        if intraday or interval in ['1d', '1wk']:
-            raise YFException(f"The following '{data_col}' events are out-of-range, did not expect with interval {interval}: {df_sub.index[f_outOfRange]}")
-        get_yf_logger().debug(f'Discarding these {data_col} events:' + '\n' + str(df_sub[f_outOfRange]))
-        df_sub = df_sub[~f_outOfRange].copy()
-        indices = indices[~f_outOfRange]
+                new_dts = new_dts[(new_dts >= next_interval_start_dt) & (new_dts < next_interval_end_dt)]
+            if len(new_dts) > 0:
+                get_yf_logger().debug(
+                    f"Adding out-of-range {data_col} @ {', '.join(str(d) for d in new_dts.date)} in new prices rows of NaNs"
+                )
+                empty_rows = _pd.DataFrame(
+                    data={**{c: _np.nan for c in const._PRICE_COLNAMES_}, "Volume": 0},
+                    index=new_dts,
+                )
+                df_main = _pd.concat([df_main, empty_rows], sort=True).sort_index()
+                f_outOfRange = out_of_range(df_main.index)
+        indices = df_main.index.searchsorted(df_sub.index, side="right") - 1
+
+        if f_outOfRange.any():
+            if interval in ['1d', '1wk']:
+                raise YFException(f"The following '{data_col}' events are out-of-range, did not expect with interval {interval}: {df_sub.index[f_outOfRange]}")
+            get_yf_logger().debug(f'Discarding these {data_col} events:' + '\n' + str(df_sub[f_outOfRange]))
+            df_sub = df_sub[~f_outOfRange].copy()
+            indices = indices[~f_outOfRange]
 
     def _reindex_events(df, new_index, data_col_name):
         if len(new_index) == len(set(new_index)):
@@ -1016,7 +1054,7 @@ def safe_merge_dfs(df_main, df_sub, interval):
 
     df = df_main.join(df_sub)
     f_na = df[data_col].isna()
-    data_lost = sum(~f_na) < df_sub.shape[0]
+    data_lost = (~f_na).sum() < df_sub.shape[0]
     if data_lost:
         raise YFException('Data was lost in merge, investigate')
 